@@ -3,7 +3,15 @@ from ninja import NinjaAPI
 
 from coalition.core.views import health_check as health_check_view
 
-from . import campaigns, endorsements, homepage, legislators, stakeholders
+from . import (
+    campaigns,
+    endorsements,
+    homepage,
+    legislators,
+    regions,
+    search,
+    stakeholders,
+)
 
 api = NinjaAPI(version="1.0")
 
@@ -12,6 +20,8 @@ api.add_router("/stakeholders/", stakeholders.router)
 api.add_router("/endorsements/", endorsements.router)
 api.add_router("/legislators/", legislators.router)
 api.add_router("/homepage/", homepage.router)
+api.add_router("/regions/", regions.router)
+api.add_router("/search/", search.router)
 
 
 @api.get("/health/", tags=["Health"])
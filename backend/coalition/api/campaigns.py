@@ -1,13 +1,237 @@
-from django.http import HttpRequest
-from ninja import Router
+import json
+from functools import partial
+from typing import TYPE_CHECKING, Annotated
 
-from coalition.campaigns.models import PolicyCampaign
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import aget_object_or_404
+from django.utils import timezone
+from ninja import Query, Router
+from ninja.responses import NinjaJSONEncoder
 
-from .schemas import PolicyCampaignOut
+from coalition.campaigns.models import Bill, PolicyCampaign
+from coalition.core.cache import (
+    CachedPayload,
+    campaign_bills_cache_key,
+    get_or_build,
+)
+from coalition.endorsements.models import Endorsement, RegionEndorsementCount
+from coalition.legislators.models import Legislator
+from coalition.regions.models import Region
+from coalition.stakeholders.models import Stakeholder
+
+from .conditional import atable_not_modified, make_etag, not_modified
+from .pagination import acursor_paginate
+from .regions import GEOJSON_CONTENT_TYPE
+from .schemas import CampaignBillOut, EndorsementOut, PolicyCampaignOut, SponsorOut
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
 
 router = Router()
 
+SPONSOR_FIELDS = tuple(SponsorOut.model_fields)
+BILL_FIELDS = tuple(
+    name
+    for name in CampaignBillOut.model_fields
+    if name not in ("sponsors", "cosponsors")
+)
+
+
+def campaign_bills(campaign_id: int) -> "QuerySet[Bill]":
+    """
+    A campaign's bills, primary first, with their sponsors and cosponsors.
+
+    Three queries however many bills there are: the bills, then one per
+    relation, each selecting only the columns ``CampaignBillOut`` shows.
+    """
+    legislators = Legislator.objects.only(*SPONSOR_FIELDS).order_by(
+        "last_name",
+        "first_name",
+        "id",
+    )
+    return (
+        Bill.objects.filter(policy_id=campaign_id)
+        .only("policy_id", *BILL_FIELDS)
+        .order_by("-is_primary", "introduced_date", "id")
+        .prefetch_related(
+            Prefetch("sponsors", queryset=legislators),
+            Prefetch("cosponsors", queryset=legislators),
+        )
+    )
+
+
+def serialize_campaign_bills(campaign_id: int) -> CachedPayload:
+    """Render a campaign's bills to the same JSON bytes Ninja would produce"""
+    bills = [
+        CampaignBillOut.from_orm(bill).model_dump()
+        for bill in campaign_bills(campaign_id)
+    ]
+    body = json.dumps(bills, cls=NinjaJSONEncoder).encode()
+    return CachedPayload(body, make_etag(body), timezone.now())
+
 
 @router.get("/", response=list[PolicyCampaignOut])
-def list_campaigns(request: HttpRequest) -> list[PolicyCampaign]:
-    return PolicyCampaign.objects.all()
+async def list_campaigns(
+    request: HttpRequest,
+    response: HttpResponse,
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list[PolicyCampaign] | HttpResponse:
+    unchanged = await atable_not_modified(request, response, PolicyCampaign)
+    if unchanged:
+        return unchanged
+
+    return await acursor_paginate(
+        request,
+        response,
+        PolicyCampaign.objects.all(),
+        ordering=("created_at", "id"),
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+@router.get("/{slug}/", response=PolicyCampaignOut)
+async def get_campaign(request: HttpRequest, slug: str) -> PolicyCampaign:
+    """Get a specific campaign by slug"""
+    return await aget_object_or_404(PolicyCampaign, slug=slug)
+
+
+@router.get("/{slug}/bills/", response=list[CampaignBillOut])
+async def list_campaign_bills(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    List a campaign's bills with their sponsors and cosponsors.
+
+    The serialized payload is cached per campaign and dropped when a bill,
+    its (co)sponsors or one of those legislators changes (see
+    ``coalition.campaigns.signals``), so a cache hit costs only the slug
+    lookup.
+    """
+    campaign = await aget_object_or_404(PolicyCampaign.objects.only("id"), slug=slug)
+    payload = await sync_to_async(get_or_build)(
+        campaign_bills_cache_key(campaign.id),
+        partial(serialize_campaign_bills, campaign.id),
+    )
+    response = HttpResponse(
+        payload.body,
+        content_type="application/json; charset=utf-8",
+    )
+    return (
+        not_modified(request, response, payload.etag, payload.last_modified) or response
+    )
+
+
+@router.get("/{slug}/endorsements/", response=list[EndorsementOut])
+async def list_campaign_endorsements(
+    request: HttpRequest,
+    response: HttpResponse,
+    slug: str,
+    public_display: bool = True,
+    stakeholder_type: Annotated[str | None, Query(alias="type")] = None,
+    state: str | None = None,
+    county: str | None = None,
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list[Endorsement] | HttpResponse:
+    """
+    List one campaign's endorsements, filtered on the server.
+
+    Only publicly displayed endorsements are returned unless
+    ``public_display=false`` is passed. The campaign and visibility filters
+    and the keyset ordering are all served by
+    ``endorsement_campaign_list_idx``; the stakeholder filters by
+    ``stakeholder_location_type_idx``.
+    """
+    campaign = await aget_object_or_404(PolicyCampaign, slug=slug)
+    unchanged = await atable_not_modified(
+        request,
+        response,
+        Endorsement,
+        Stakeholder,
+        PolicyCampaign,
+    )
+    if unchanged:
+        return unchanged
+
+    stakeholder_filters = {
+        "stakeholder__type": stakeholder_type,
+        "stakeholder__state": state.upper() if state else None,
+        "stakeholder__county": county,
+    }
+    endorsements = Endorsement.objects.filter(
+        campaign=campaign,
+        public_display=public_display,
+        **{k: v for k, v in stakeholder_filters.items() if v is not None},
+    ).select_related("stakeholder", "campaign")
+
+    return await acursor_paginate(
+        request,
+        response,
+        endorsements,
+        ordering=("created_at", "id"),
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+@router.get("/{slug}/endorsements/regions/")
+async def campaign_endorsement_map(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    Get a campaign's public endorsement counts per state, for a choropleth.
+
+    Returns a GeoJSON FeatureCollection of the states with at least one
+    public endorsement. Counts come from the precomputed
+    ``RegionEndorsementCount`` table and geometries from ``Region.geojson``.
+    """
+    campaign = await aget_object_or_404(PolicyCampaign, slug=slug)
+    response = HttpResponse(content_type=GEOJSON_CONTENT_TYPE)
+    unchanged = await atable_not_modified(
+        request,
+        response,
+        Endorsement,
+        Stakeholder,
+        Region,
+        RegionEndorsementCount,
+    )
+    if unchanged:
+        return unchanged
+
+    rows = (
+        RegionEndorsementCount.objects.filter(campaign=campaign, public_count__gt=0)
+        .values_list(
+            "region_id",
+            "public_count",
+            "region__geoid",
+            "region__name",
+            "region__label",
+            "region__type",
+            "region__geojson",
+        )
+        .order_by("region_id")
+    )
+    features = [
+        {
+            "type": "Feature",
+            "id": region_id,
+            "geometry": geometry,
+            "properties": {
+                "geoid": geoid,
+                "name": name,
+                "label": label,
+                "type": region_type,
+                "count": count,
+            },
+        }
+        async for region_id, count, geoid, name, label, region_type, geometry in rows
+    ]
+    response.content = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "total": sum(feature["properties"]["count"] for feature in features),
+            "features": features,
+        },
+        separators=(",", ":"),
+    )
+    return response
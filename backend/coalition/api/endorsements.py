@@ -1,13 +1,58 @@
-from django.http import HttpRequest
-from ninja import Router
+from typing import Annotated
 
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from ninja import Query, Router
+
+from coalition.campaigns.models import PolicyCampaign
 from coalition.endorsements.models import Endorsement
+from coalition.stakeholders.models import Stakeholder
 
+from .conditional import atable_not_modified
+from .pagination import acursor_paginate
 from .schemas import EndorsementOut
+from .streaming import ExportFormat, stream_queryset
 
 router = Router()
 
 
 @router.get("/", response=list[EndorsementOut])
-def list_endorsements(request: HttpRequest) -> list[Endorsement]:
-    return Endorsement.objects.select_related("stakeholder", "campaign").all()
+async def list_endorsements(
+    request: HttpRequest,
+    response: HttpResponse,
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list[Endorsement] | HttpResponse:
+    unchanged = await atable_not_modified(
+        request,
+        response,
+        Endorsement,
+        Stakeholder,
+        PolicyCampaign,
+    )
+    if unchanged:
+        return unchanged
+
+    return await acursor_paginate(
+        request,
+        response,
+        Endorsement.objects.select_related("stakeholder", "campaign"),
+        ordering=("created_at", "id"),
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+@router.get("/export/")
+def export_endorsements(
+    request: HttpRequest,
+    fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+) -> StreamingHttpResponse:
+    """Stream every endorsement as NDJSON (default) or a JSON array"""
+    return stream_queryset(
+        Endorsement.objects.select_related("stakeholder", "campaign").order_by("id"),
+        EndorsementOut,
+        filename="endorsements",
+        fmt=fmt,
+        asynchronous=isinstance(request, ASGIRequest),
+    )
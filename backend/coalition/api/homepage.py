@@ -1,38 +1,88 @@
-from django.http import Http404, HttpRequest
-from django.shortcuts import get_object_or_404
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import aget_object_or_404
+from django.utils import timezone
 from ninja import Router
+from ninja.responses import NinjaJSONEncoder
 
+from coalition.core.cache import (
+    CachedPayload,
+    aget_active_homepage_payload,
+    aset_active_homepage_payload,
+)
 from coalition.core.models import ContentBlock, HomePage
 
+from .conditional import make_etag, not_modified
 from .schemas import ContentBlockOut, HomePageOut
 
 router = Router()
 
 
+def serialize_homepage(homepage: HomePage) -> CachedPayload:
+    """
+    Render a homepage to the same JSON bytes Ninja would produce.
+
+    Last-Modified is the build time rather than the newest ``updated_at``:
+    hiding or deleting a block, or activating an older homepage, changes the
+    body without touching any visible row's timestamp.
+    """
+    schema = HomePageOut.from_orm(homepage)
+    body = json.dumps(schema.model_dump(), cls=NinjaJSONEncoder).encode()
+    return CachedPayload(body, make_etag(body), timezone.now())
+
+
 @router.get("/", response=HomePageOut)
-def get_homepage(request: HttpRequest) -> HomePage:
-    """Get the active homepage configuration with all content blocks"""
-    homepage = HomePage.get_active()
-    if not homepage:
-        raise Http404("No active homepage configuration found")
+async def get_homepage(request: HttpRequest) -> HttpResponse:
+    """
+    Get the active homepage configuration with all content blocks.
+
+    The serialized payload and its ETag are cached and served as-is, so a
+    cache hit (or a 304 for a matching If-None-Match) costs no database
+    queries. Saving or deleting a HomePage or ContentBlock invalidates it
+    (see ``coalition.core.signals``).
+    """
+    payload = await aget_active_homepage_payload()
+    if payload is None:
+        homepage = await HomePage.aget_active()
+        if not homepage:
+            raise Http404("No active homepage configuration found")
+
+        # Resolving the content blocks queries lazily, which is only allowed
+        # off the event loop
+        payload = await sync_to_async(serialize_homepage)(homepage)
+        await aset_active_homepage_payload(payload)
 
-    return homepage
+    response = HttpResponse(
+        payload.body,
+        content_type="application/json; charset=utf-8",
+    )
+    return (
+        not_modified(request, response, payload.etag, payload.last_modified) or response
+    )
 
 
 @router.get("/{homepage_id}/", response=HomePageOut)
-def get_homepage_by_id(request: HttpRequest, homepage_id: int) -> HomePage:
+async def get_homepage_by_id(request: HttpRequest, homepage_id: int) -> HttpResponse:
     """Get a specific homepage configuration by ID"""
-    return get_object_or_404(HomePage, id=homepage_id)
+    homepage = await aget_object_or_404(HomePage, id=homepage_id)
+    payload = await sync_to_async(serialize_homepage)(homepage)
+    return HttpResponse(payload.body, content_type="application/json; charset=utf-8")
 
 
 @router.get("/{homepage_id}/content-blocks/", response=list[ContentBlockOut])
-def get_content_blocks(request: HttpRequest, homepage_id: int) -> list[ContentBlock]:
+async def get_content_blocks(
+    request: HttpRequest,
+    homepage_id: int,
+) -> list[ContentBlock]:
     """Get all content blocks for a specific homepage"""
-    homepage = get_object_or_404(HomePage, id=homepage_id)
-    return list(homepage.content_blocks.filter(is_visible=True).order_by("order"))
+    homepage = await aget_object_or_404(HomePage, id=homepage_id)
+    blocks = homepage.content_blocks.filter(is_visible=True).order_by("order")
+    return [block async for block in blocks]
 
 
 @router.get("/content-blocks/{block_id}/", response=ContentBlockOut)
-def get_content_block(request: HttpRequest, block_id: int) -> ContentBlock:
+async def get_content_block(request: HttpRequest, block_id: int) -> ContentBlock:
     """Get a specific content block by ID"""
-    return get_object_or_404(ContentBlock, id=block_id)
+    return await aget_object_or_404(ContentBlock, id=block_id)
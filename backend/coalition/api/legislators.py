@@ -1,13 +1,110 @@
-from django.http import HttpRequest
-from ninja import Router
+from typing import Annotated, Literal
 
-from coalition.legislators.models import Legislator
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import aget_object_or_404
+from ninja import Query, Router
 
-from .schemas import LegislatorOut
+from coalition.campaigns.models import PolicyCampaign
+from coalition.legislators.models import Legislator, LegislatorScore
+from coalition.legislators.regions import legislators_at_point
+
+from .conditional import atable_not_modified
+from .pagination import acursor_paginate
+from .schemas import LegislatorOut, LegislatorRegionOut, ScorecardOut, SponsorOut
 
 router = Router()
 
+Chamber = Literal["House", "Senate"]
+
 
 @router.get("/", response=list[LegislatorOut])
-def list_legislators(request: HttpRequest) -> list[Legislator]:
-    return Legislator.objects.all()
+async def list_legislators(
+    request: HttpRequest,
+    response: HttpResponse,
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list[Legislator] | HttpResponse:
+    unchanged = await atable_not_modified(request, response, Legislator)
+    if unchanged:
+        return unchanged
+
+    return await acursor_paginate(
+        request,
+        response,
+        Legislator.objects.all(),
+        ordering=("id",),
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+@router.get("/locate/", response=list[LegislatorRegionOut])
+async def locate_legislators(
+    request: HttpRequest,
+    lat: Annotated[float, Query(ge=-90, le=90)],
+    lng: Annotated[float, Query(ge=-180, le=180)],
+) -> list[Legislator]:
+    """Get the senators and House member who represent a point"""
+    return await sync_to_async(legislators_at_point)(lat, lng)
+
+
+@router.get("/scorecard/", response=list[ScorecardOut])
+async def legislator_scorecard(
+    request: HttpRequest,
+    response: HttpResponse,
+    campaign: str | None = None,
+    chamber: Chamber | None = None,
+    party: Annotated[str | None, Query(max_length=1)] = None,
+    state: Annotated[str | None, Query(max_length=2)] = None,
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list[LegislatorScore] | HttpResponse:
+    """
+    List how many of each campaign's bills legislators (co)sponsor.
+
+    One row per legislator and campaign, most bills first. Rows are read from
+    the precomputed ``LegislatorScore`` table (see
+    ``coalition.legislators.scorecard``); filter by ``campaign`` slug,
+    ``chamber``, ``party`` and ``state`` to break the scores down.
+    """
+    filters = {
+        "chamber": chamber,
+        "party": party.upper() if party else None,
+        "state": state.upper() if state else None,
+    }
+    if campaign is not None:
+        found = await aget_object_or_404(
+            PolicyCampaign.objects.only("id"),
+            slug=campaign,
+        )
+        filters["campaign_id"] = found.id
+    unchanged = await atable_not_modified(
+        request,
+        response,
+        LegislatorScore,
+        Legislator,
+        PolicyCampaign,
+    )
+    if unchanged:
+        return unchanged
+
+    scores = (
+        LegislatorScore.objects.filter(
+            **{k: v for k, v in filters.items() if v is not None},
+        )
+        .select_related("legislator", "campaign")
+        .only(
+            *ScorecardOut.model_fields,
+            *(f"legislator__{name}" for name in SponsorOut.model_fields),
+            "campaign__slug",
+        )
+    )
+    return await acursor_paginate(
+        request,
+        response,
+        scores,
+        ordering=("-total", "id"),
+        cursor=cursor,
+        page_size=page_size,
+    )
@@ -0,0 +1,194 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from ninja.errors import HttpError
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.db.models import Model, QuerySet
+    from django.http import HttpRequest, HttpResponse
+
+
+def get_page_size(page_size: int | None) -> int:
+    """Clamp a requested page size to the configured default and hard cap"""
+    if page_size is None:
+        return settings.API_PAGE_SIZE
+    return max(1, min(page_size, settings.API_MAX_PAGE_SIZE))
+
+
+def encode_cursor(values: "list[Any]", reverse: bool = False) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor string"""
+    payload = {
+        "v": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        "r": reverse,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    model: "type[Model]",
+    ordering: tuple[str, ...],
+) -> "tuple[list[Any], bool]":
+    """Decode a cursor back into typed keyset values and its direction"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        raw_values = payload["v"]
+        reverse = bool(payload.get("r", False))
+        if len(raw_values) != len(ordering):
+            raise ValueError("Cursor does not match ordering")
+        values = [
+            model._meta.get_field(field.removeprefix("-")).to_python(value)
+            for field, value in zip(ordering, raw_values, strict=True)
+        ]
+    except (
+        binascii.Error,
+        json.JSONDecodeError,
+        KeyError,
+        TypeError,
+        ValueError,
+        ValidationError,
+    ) as e:
+        raise HttpError(400, "Invalid cursor") from e
+    return values, reverse
+
+
+def _keyset_filter(
+    ordering: tuple[str, ...],
+    values: "list[Any]",
+    reverse: bool,
+) -> Q:
+    """
+    Build the row-comparison predicate ``(f1, f2, ...) > (v1, v2, ...)``.
+
+    Expanded as ``f1 > v1 OR (f1 = v1 AND f2 > v2) OR ...`` so that it can be
+    satisfied by a composite index on the ordering columns. Descending fields
+    (``-f``) compare with ``<``, and ``reverse`` flips every comparison.
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        descending = field.startswith("-")
+        lookup = "lt" if descending != reverse else "gt"
+        clause = Q(**{f"{field.removeprefix('-')}__{lookup}": values[i]})
+        for prior_field, prior_value in zip(ordering[:i], values[:i], strict=True):
+            clause &= Q(**{prior_field.removeprefix("-"): prior_value})
+        condition |= clause
+    return condition
+
+
+def _row_values(row: "Any", ordering: tuple[str, ...]) -> "list[Any]":
+    """The keyset values of a model instance or a ``values()`` dict"""
+    names = [field.removeprefix("-") for field in ordering]
+    if isinstance(row, dict):
+        return [row[name] for name in names]
+    return [getattr(row, name) for name in names]
+
+
+def _flip(field: str) -> str:
+    return field.removeprefix("-") if field.startswith("-") else f"-{field}"
+
+
+def _page_link(request: "HttpRequest", cursor: str, page_size: int) -> str:
+    params = request.GET.copy()
+    params["cursor"] = cursor
+    params["page_size"] = str(page_size)
+    return f"{request.path}?{params.urlencode()}"
+
+
+def _seek(
+    queryset: "QuerySet",
+    ordering: tuple[str, ...],
+    cursor: str | None,
+    size: int,
+) -> "tuple[QuerySet, bool]":
+    """Apply the cursor to ``queryset``; returns the page query and direction"""
+    reverse = False
+    if cursor:
+        values, reverse = decode_cursor(cursor, queryset.model, ordering)
+        queryset = queryset.filter(_keyset_filter(ordering, values, reverse))
+
+    order_by = [_flip(field) for field in ordering] if reverse else list(ordering)
+    return queryset.order_by(*order_by)[: size + 1], reverse
+
+
+def _finish_page(
+    request: "HttpRequest",
+    response: "HttpResponse",
+    rows: list,
+    ordering: tuple[str, ...],
+    cursor: str | None,
+    size: int,
+    reverse: bool,
+) -> list:
+    """Trim the look-ahead row and set the cursor headers for a fetched page"""
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if reverse:
+        rows.reverse()
+
+    # Walking forwards, "more" means another page ahead and a cursor implies a
+    # page behind; walking backwards the two roles swap.
+    has_next = bool(cursor) if reverse else has_more
+    has_prev = has_more if reverse else bool(cursor)
+
+    links = []
+    if rows and has_next:
+        next_cursor = encode_cursor(_row_values(rows[-1], ordering))
+        response["X-Next-Cursor"] = next_cursor
+        links.append(f'<{_page_link(request, next_cursor, size)}>; rel="next"')
+    if rows and has_prev:
+        prev_cursor = encode_cursor(_row_values(rows[0], ordering), reverse=True)
+        response["X-Prev-Cursor"] = prev_cursor
+        links.append(f'<{_page_link(request, prev_cursor, size)}>; rel="prev"')
+    if links:
+        response["Link"] = ", ".join(links)
+
+    return rows
+
+
+def cursor_paginate(
+    request: "HttpRequest",
+    response: "HttpResponse",
+    queryset: "QuerySet",
+    ordering: tuple[str, ...],
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list:
+    """
+    Return one page of ``queryset`` using keyset (cursor) pagination.
+
+    Rows are ordered by ``ordering`` (``-field`` for descending), which must
+    end in a unique column. ``queryset`` may yield model instances or
+    ``values()`` dicts that include the ordering columns. Instead of an
+    OFFSET, each page seeks past the last row of the previous one, so deep
+    pages cost the same as the first. Cursors for the adjacent pages are set
+    on ``response`` as ``X-Next-Cursor`` / ``X-Prev-Cursor`` headers and as
+    an RFC 8288 ``Link`` header, which keeps the response body a plain list.
+    """
+    size = get_page_size(page_size)
+    page, reverse = _seek(queryset, ordering, cursor, size)
+    return _finish_page(request, response, list(page), ordering, cursor, size, reverse)
+
+
+async def acursor_paginate(
+    request: "HttpRequest",
+    response: "HttpResponse",
+    queryset: "QuerySet",
+    ordering: tuple[str, ...],
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> list:
+    """Async version of :func:`cursor_paginate` for ``async def`` handlers"""
+    size = get_page_size(page_size)
+    page, reverse = _seek(queryset, ordering, cursor, size)
+    rows = [row async for row in page]
+    return _finish_page(request, response, rows, ordering, cursor, size, reverse)
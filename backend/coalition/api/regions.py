@@ -0,0 +1,131 @@
+import json
+from typing import Annotated, Literal
+
+from django.http import HttpRequest, HttpResponse
+from ninja import Query, Router
+from ninja.errors import HttpError
+
+from coalition.core.models import TableVersion
+from coalition.regions.locate import locate_point
+from coalition.regions.models import Region, RegionGeometry
+from coalition.regions.tiles import get_tile, is_valid_tile
+
+from .conditional import make_etag, not_modified, table_not_modified
+from .schemas import RegionLocateOut
+
+MVT_CONTENT_TYPE = "application/vnd.mapbox-vector-tile"
+GEOJSON_CONTENT_TYPE = "application/geo+json"
+
+TileRegionType = Literal["state", "cd119"]
+# Counties are only used for geocoding, so maps leave them out
+MAP_REGION_TYPES = ["state", "cd119"]
+
+router = Router()
+
+
+def pick_resolution(available: list[int], requested: int) -> int | None:
+    """
+    Choose the stored zoom level to serve for a requested one.
+
+    That is the coarsest stored level at least as detailed as requested, or
+    the most detailed level if none is.
+    """
+    finer = [zoom for zoom in available if zoom >= requested]
+    if finer:
+        return min(finer)
+    return max(available, default=None)
+
+
+def _feature(region_id: int, geometry: str, properties: dict) -> str:
+    # The stored geometry is already compact GeoJSON, so it is spliced in as is
+    return (
+        f'{{"type":"Feature","id":{region_id},"geometry":{geometry},'
+        f'"properties":{json.dumps(properties, separators=(",", ":"))}}}'
+    )
+
+
+@router.get("/")
+def list_region_geometries(
+    request: HttpRequest,
+    region_type: Annotated[TileRegionType | None, Query(alias="type")] = None,
+    resolution: Annotated[int, Query(ge=0, le=22)] = 0,
+) -> HttpResponse:
+    """
+    Get region boundaries as a GeoJSON FeatureCollection.
+
+    ``resolution`` is a map zoom level; geometries come from the
+    precomputed level closest to it (see ``simplify_regions``).
+    """
+    response = HttpResponse(content_type=GEOJSON_CONTENT_TYPE)
+    unchanged = table_not_modified(request, response, Region, RegionGeometry)
+    if unchanged:
+        return unchanged
+
+    available = RegionGeometry.objects.values_list("zoom", flat=True).distinct()
+    zoom = pick_resolution(list(available), resolution)
+    rows = (
+        RegionGeometry.objects.filter(zoom=zoom)
+        .values_list(
+            "region_id",
+            "geojson",
+            "region__geoid",
+            "region__name",
+            "region__label",
+            "region__type",
+        )
+        .filter(region__type__in=[region_type] if region_type else MAP_REGION_TYPES)
+        .order_by("region_id")
+    )
+
+    features = [
+        _feature(
+            region_id,
+            geometry,
+            {"geoid": geoid, "name": name, "label": label, "type": type_},
+        )
+        for region_id, geometry, geoid, name, label, type_ in rows
+    ]
+    response.content = (
+        f'{{"type":"FeatureCollection","resolution":{json.dumps(zoom)},'
+        f'"features":[{",".join(features)}]}}'
+    )
+    return response
+
+
+@router.get("/locate/", response=RegionLocateOut)
+def locate_region(
+    request: HttpRequest,
+    lat: Annotated[float, Query(ge=-90, le=90)],
+    lng: Annotated[float, Query(ge=-180, le=180)],
+) -> dict:
+    """Get the state and congressional district that contain a point"""
+    return locate_point(lat, lng)
+
+
+@router.get("/tiles/{int:z}/{int:x}/{int:y}.mvt")
+def region_tile(
+    request: HttpRequest,
+    z: int,
+    x: int,
+    y: int,
+    region_type: Annotated[TileRegionType | None, Query(alias="type")] = None,
+) -> HttpResponse:
+    """
+    Get a Mapbox Vector Tile of region boundaries.
+
+    The tile has one ``regions`` layer with each region's id, geoid, name,
+    label and type. Tiles are served from the disk cache when possible.
+    """
+    if not is_valid_tile(z, x, y):
+        raise HttpError(404, "Tile not found")
+
+    types = [region_type] if region_type else MAP_REGION_TYPES
+    version = TableVersion.get_version(Region)
+    response = HttpResponse(content_type=MVT_CONTENT_TYPE)
+    etag = make_etag("tile", version, z, x, y, *types)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+
+    response.content = get_tile(z, x, y, types, version=version)
+    return response
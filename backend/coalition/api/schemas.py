@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 from ninja import Schema
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
     from coalition.core.models import ContentBlock, HomePage
+    from coalition.legislators.models import LegislatorScore
 
 
 class PolicyCampaignOut(Schema):
@@ -28,6 +29,45 @@ class StakeholderOut(Schema):
     created_at: datetime
 
 
+class StakeholderFieldsOut(Schema):
+    """A stakeholder limited to the fields asked for with ``?fields=``"""
+
+    id: int | None = None
+    name: str | None = None
+    organization: str | None = None
+    role: str | None = None
+    email: str | None = None
+    state: str | None = None
+    county: str | None = None
+    type: str | None = None
+    created_at: datetime | None = None
+
+
+class SearchResultOut(Schema):
+    type: str
+    id: int
+    label: str
+    detail: str
+    # Campaign slug for campaigns and bills
+    slug: str | None = None
+    rank: float
+
+
+class BulkImportRowOut(Schema):
+    row: int
+    status: str
+    stakeholder_id: int | None = None
+    endorsement: str | None = None
+    errors: list[str]
+
+
+class BulkImportOut(Schema):
+    created: int
+    updated: int
+    errors: int
+    results: list[BulkImportRowOut]
+
+
 class EndorsementOut(Schema):
     id: int
     stakeholder: StakeholderOut
@@ -47,6 +87,64 @@ class LegislatorOut(Schema):
     is_senior: bool | None = None
 
 
+class SponsorOut(Schema):
+    id: int
+    bioguide_id: str
+    first_name: str
+    last_name: str
+    party: str
+    chamber: str
+    state: str
+    district: str
+
+
+class CampaignBillOut(Schema):
+    id: int
+    number: str
+    title: str
+    chamber: str
+    congress: int | None = None
+    congress_session: str
+    introduced_date: date
+    status: str
+    url: str
+    is_primary: bool
+    sponsors: list[SponsorOut]
+    cosponsors: list[SponsorOut]
+
+
+class ScorecardOut(Schema):
+    legislator: SponsorOut
+    campaign: str
+    chamber: str
+    party: str
+    state: str
+    sponsored: int
+    cosponsored: int
+    total: int
+
+    @staticmethod
+    def resolve_campaign(obj: "LegislatorScore") -> str:
+        return obj.campaign.slug
+
+
+class RegionOut(Schema):
+    id: int
+    geoid: str
+    name: str
+    label: str | None = None
+    type: str
+
+
+class LegislatorRegionOut(LegislatorOut):
+    region: RegionOut
+
+
+class RegionLocateOut(Schema):
+    state: RegionOut | None = None
+    district: RegionOut | None = None
+
+
 class ContentBlockOut(Schema):
     id: int
     title: str
@@ -0,0 +1,35 @@
+from typing import Annotated, Literal
+
+from django.http import HttpRequest, HttpResponse
+from ninja import Query, Router
+
+from coalition.campaigns.models import Bill, PolicyCampaign
+from coalition.core.search import SearchHit, search
+from coalition.stakeholders.models import Stakeholder
+
+from .conditional import table_not_modified
+from .schemas import SearchResultOut
+
+SearchType = Literal["stakeholder", "campaign", "bill"]
+
+router = Router()
+
+
+@router.get("/", response=list[SearchResultOut])
+def search_everything(
+    request: HttpRequest,
+    response: HttpResponse,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    result_type: Annotated[SearchType | None, Query(alias="type")] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> list[SearchHit] | HttpResponse:
+    """
+    Search stakeholders, campaigns and bills, best matches first.
+
+    Every word of ``q`` is matched as a prefix, so this also serves typeahead.
+    """
+    unchanged = table_not_modified(request, response, Stakeholder, PolicyCampaign, Bill)
+    if unchanged:
+        return unchanged
+
+    return search(q, [result_type] if result_type else None, limit)
@@ -1,13 +1,171 @@
-from django.http import HttpRequest
-from ninja import Router
+from typing import Annotated, Literal
 
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from ninja import Query, Router
+from ninja.errors import HttpError
+from ninja.security import django_auth_is_staff
+
+from coalition.regions.models import Region
+from coalition.stakeholders.importer import (
+    ImportFormat,
+    import_stakeholders,
+    parse_rows,
+)
 from coalition.stakeholders.models import Stakeholder
 
-from .schemas import StakeholderOut
+from .conditional import table_not_modified
+from .pagination import cursor_paginate
+from .schemas import BulkImportOut, StakeholderFieldsOut, StakeholderOut
+from .streaming import ExportFormat, stream_queryset
+
+StakeholderType = Literal["farmer", "waterman", "business", "nonprofit", "other"]
+StakeholderOrdering = Literal[
+    "created_at",
+    "-created_at",
+    "name",
+    "-name",
+    "organization",
+    "-organization",
+    "state",
+    "-state",
+]
+
+# Fields ?fields= may select, in the order they are serialized
+LIST_FIELDS = tuple(StakeholderOut.model_fields)
 
 router = Router()
 
 
-@router.get("/", response=list[StakeholderOut])
-def list_stakeholders(request: HttpRequest) -> list[Stakeholder]:
-    return Stakeholder.objects.all()
+def _parse_fields(fields: str | None) -> list[str]:
+    """The fields selected by a comma-separated ``?fields=``, or all of them"""
+    if fields is None:
+        return list(LIST_FIELDS)
+    selected = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in LIST_FIELDS]
+    if unknown or not selected:
+        raise HttpError(
+            422,
+            f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields",
+        )
+    return [name for name in LIST_FIELDS if name in selected]
+
+
+def _filter_location(
+    stakeholders: QuerySet[Stakeholder],
+    within: int | None,
+    near: tuple[float | None, float | None, float | None],
+) -> QuerySet[Stakeholder]:
+    """Keep stakeholders located in a region and/or within a radius of a point"""
+    if within is not None:
+        region = Region.objects.filter(pk=within).only("geom").first()
+        if region is None or region.geom is None:
+            raise HttpError(404, "Region not found")
+        stakeholders = stakeholders.filter(location__intersects=region.geom)
+
+    if any(value is not None for value in near):
+        lat, lng, radius = near
+        if lat is None or lng is None or radius is None:
+            raise HttpError(422, "lat, lng and radius must be given together")
+        near_point = (Point(lng, lat, srid=4326), D(km=radius))
+        if connection.ops.spatialite:
+            # SpatiaLite rejects Distance objects in DWithin on geographic
+            # fields; it measures the same great-circle distance without the
+            # spatial index
+            stakeholders = stakeholders.filter(location__distance_lte=near_point)
+        else:
+            stakeholders = stakeholders.filter(location__dwithin=near_point)
+    return stakeholders
+
+
+@router.get("/", response=list[StakeholderFieldsOut], exclude_unset=True)
+def list_stakeholders(
+    request: HttpRequest,
+    response: HttpResponse,
+    cursor: str | None = None,
+    page_size: int | None = None,
+    fields: str | None = None,
+    stakeholder_type: Annotated[StakeholderType | None, Query(alias="type")] = None,
+    state: Annotated[str | None, Query(max_length=2)] = None,
+    ordering: StakeholderOrdering = "created_at",
+    within: int | None = None,
+    lat: Annotated[float | None, Query(ge=-90, le=90)] = None,
+    lng: Annotated[float | None, Query(ge=-180, le=180)] = None,
+    radius: Annotated[float | None, Query(gt=0)] = None,
+) -> list[dict] | HttpResponse:
+    """
+    List stakeholders, optionally filtered, sorted and limited to some fields.
+
+    ``fields`` is a comma-separated subset of the stakeholder fields; the
+    others are never read from the database. ``within`` is a region id;
+    ``lat``, ``lng`` and ``radius`` (in km) go together. Stakeholders
+    without a location match neither filter.
+    """
+    selected = _parse_fields(fields)
+    models = (Stakeholder, Region) if within is not None else (Stakeholder,)
+    unchanged = table_not_modified(request, response, *models)
+    if unchanged:
+        return unchanged
+
+    stakeholders = Stakeholder.objects.all()
+    if stakeholder_type:
+        stakeholders = stakeholders.filter(type=stakeholder_type)
+    if state:
+        stakeholders = stakeholders.filter(state=state.upper())
+    stakeholders = _filter_location(stakeholders, within, (lat, lng, radius))
+
+    # The id tiebreaker keeps keyset pagination stable on non-unique columns
+    keyset = (ordering, "-id" if ordering.startswith("-") else "id")
+    columns = dict.fromkeys([*selected, ordering.removeprefix("-"), "id"])
+    rows = cursor_paginate(
+        request,
+        response,
+        stakeholders.values(*columns),
+        ordering=keyset,
+        cursor=cursor,
+        page_size=page_size,
+    )
+    return [{name: row[name] for name in selected} for row in rows]
+
+
+@router.get("/export/")
+def export_stakeholders(
+    request: HttpRequest,
+    fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+) -> StreamingHttpResponse:
+    """Stream every stakeholder as NDJSON (default) or a JSON array"""
+    return stream_queryset(
+        Stakeholder.objects.all().order_by("id"),
+        StakeholderOut,
+        filename="stakeholders",
+        fmt=fmt,
+        asynchronous=isinstance(request, ASGIRequest),
+    )
+
+
+@router.post("/bulk/", response=BulkImportOut, auth=django_auth_is_staff)
+def bulk_import_stakeholders(
+    request: HttpRequest,
+    fmt: Annotated[ImportFormat | None, Query(alias="format")] = None,
+) -> dict:
+    """
+    Import stakeholders, and optionally their endorsements, from NDJSON or CSV.
+
+    The format is taken from ``?format=`` or else from the Content-Type
+    (``text/csv`` or ``application/x-ndjson``). The body is read line by line,
+    so large petition lists are never loaded into memory at once.
+    """
+    if fmt is None:
+        fmt = "csv" if request.content_type == "text/csv" else "ndjson"
+
+    results = import_stakeholders(parse_rows(request, fmt))
+    return {
+        "created": sum(r.status == "created" for r in results),
+        "updated": sum(r.status == "updated" for r in results),
+        "errors": sum(r.status == "error" for r in results),
+        "results": results,
+    }
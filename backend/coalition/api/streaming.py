@@ -0,0 +1,91 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Literal
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from ninja import Schema
+
+ExportFormat = Literal["ndjson", "json"]
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _serialize_rows(
+    queryset: "QuerySet",
+    schema: "type[Schema]",
+) -> Iterator[bytes]:
+    """Serialize rows one at a time, reading the queryset in chunks"""
+    for obj in queryset.iterator(chunk_size=settings.API_EXPORT_CHUNK_SIZE):
+        yield schema.from_orm(obj).model_dump_json().encode()
+
+
+async def _aserialize_rows(
+    queryset: "QuerySet",
+    schema: "type[Schema]",
+) -> AsyncIterator[bytes]:
+    """Async version of :func:`_serialize_rows`, for ASGI servers"""
+    async for obj in queryset.aiterator(chunk_size=settings.API_EXPORT_CHUNK_SIZE):
+        yield schema.from_orm(obj).model_dump_json().encode()
+
+
+def _ndjson(rows: Iterator[bytes]) -> Iterator[bytes]:
+    for row in rows:
+        yield row + b"\n"
+
+
+def _json_array(rows: Iterator[bytes]) -> Iterator[bytes]:
+    yield b"["
+    separator = b""
+    for row in rows:
+        yield separator + row
+        separator = b","
+    yield b"]"
+
+
+async def _andjson(rows: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield row + b"\n"
+
+
+async def _ajson_array(rows: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield b"["
+    separator = b""
+    async for row in rows:
+        yield separator + row
+        separator = b","
+    yield b"]"
+
+
+def stream_queryset(
+    queryset: "QuerySet",
+    schema: "type[Schema]",
+    filename: str,
+    fmt: ExportFormat = "ndjson",
+    asynchronous: bool = False,
+) -> StreamingHttpResponse:
+    """
+    Stream a queryset as NDJSON or a JSON array without materializing it.
+
+    Rows are fetched with ``QuerySet.iterator()`` (a server-side cursor on
+    PostgreSQL) and serialized as they are sent, so peak memory depends on
+    the chunk size rather than on the number of rows.
+
+    Pass ``asynchronous=True`` when serving under ASGI: Django buffers a
+    synchronous iterator in full before sending it to an ASGI server, so
+    the rows are read with ``aiterator()`` instead.
+    """
+    if asynchronous:
+        arows = _aserialize_rows(queryset, schema)
+        body = _andjson(arows) if fmt == "ndjson" else _ajson_array(arows)
+    else:
+        rows = _serialize_rows(queryset, schema)
+        body = _ndjson(rows) if fmt == "ndjson" else _json_array(rows)
+    response = StreamingHttpResponse(body, content_type=CONTENT_TYPES[fmt])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    return response
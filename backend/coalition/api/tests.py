@@ -1,11 +1,36 @@
+import csv
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
 from django.test import TestCase
-from django.test.client import Client
+from django.test.client import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
 
+from coalition.campaigns.models import Bill, PolicyCampaign
+from coalition.core.cache import cache_clear
 from coalition.core.models import ContentBlock, HomePage
+from coalition.endorsements.models import Endorsement, RegionEndorsementCount
+from coalition.legislators.models import Legislator
+from coalition.regions.models import Region, RegionGeometry
+from coalition.regions.tests import RegionFileTestMixin
+from coalition.stakeholders.models import Stakeholder
 
 
 class HomepageAPITest(TestCase):
     def setUp(self) -> None:
+        # Start every test with a cold homepage cache
+        cache_clear()
+
         # Use Django's test client
         self.client = Client()
 
@@ -537,3 +562,1588 @@ class HomepageAPITest(TestCase):
             assert first_block["id"] == block_data["id"]
             assert first_block["title"] == block_data["title"]
             assert first_block["content"] == block_data["content"]
+
+
+class CursorPaginationAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.stakeholders = [
+            Stakeholder.objects.create(
+                name=f"Stakeholder {i}",
+                organization=f"Org {i}",
+                email=f"person{i}@example.org",
+                state="MD",
+                type="farmer",
+            )
+            for i in range(5)
+        ]
+
+    def test_first_page_respects_page_size(self) -> None:
+        """Test that the first page is limited and links to the next page"""
+        response = self.client.get("/api/stakeholders/?page_size=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["id"] for s in data] == [s.id for s in self.stakeholders[:2]]
+        assert "X-Next-Cursor" in response
+        assert "X-Prev-Cursor" not in response
+        assert 'rel="next"' in response["Link"]
+
+    def test_walks_forward_and_back(self) -> None:
+        """Test following next cursors to the end and a prev cursor back"""
+        seen = []
+        cursor = None
+        while True:
+            url = "/api/stakeholders/?page_size=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = self.client.get(url)
+            assert response.status_code == 200
+            seen.extend(s["id"] for s in response.json())
+            if "X-Next-Cursor" not in response:
+                break
+            cursor = response["X-Next-Cursor"]
+
+        assert seen == [s.id for s in self.stakeholders]
+
+        # The last page holds one row and points back at the two before it
+        prev_cursor = response["X-Prev-Cursor"]
+        response = self.client.get(
+            f"/api/stakeholders/?page_size=2&cursor={prev_cursor}",
+        )
+        assert [s["id"] for s in response.json()] == [
+            s.id for s in self.stakeholders[2:4]
+        ]
+        assert "X-Next-Cursor" in response
+        assert "X-Prev-Cursor" in response
+
+    def test_page_size_is_capped(self) -> None:
+        """Test that page_size cannot exceed the configured maximum"""
+        with self.settings(API_MAX_PAGE_SIZE=3):
+            response = self.client.get("/api/stakeholders/?page_size=1000")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+
+    def test_invalid_cursor(self) -> None:
+        """Test that a malformed cursor is rejected"""
+        response = self.client.get("/api/stakeholders/?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_list_endpoints_return_plain_lists(self) -> None:
+        """Test that every paginated list endpoint still returns a JSON array"""
+        for url in [
+            "/api/campaigns/",
+            "/api/stakeholders/",
+            "/api/endorsements/",
+            "/api/legislators/",
+        ]:
+            response = self.client.get(url)
+            assert response.status_code == 200
+            assert isinstance(response.json(), list)
+
+
+class StakeholderListAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.stakeholders = [
+            Stakeholder.objects.create(
+                name=name,
+                organization=f"{name} Org",
+                email=f"{name.lower()}@example.org",
+                state=state,
+                type=stakeholder_type,
+            )
+            for name, state, stakeholder_type in [
+                ("Carol", "MD", "farmer"),
+                ("Alice", "VA", "farmer"),
+                ("Bob", "MD", "waterman"),
+                ("Dan", "MD", "farmer"),
+            ]
+        ]
+
+    def test_sparse_fields(self) -> None:
+        """Test that only the requested fields are serialized and selected"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/stakeholders/?fields=name,id")
+
+        assert response.status_code == 200
+        assert response.json()[0] == {"id": self.stakeholders[0].id, "name": "Carol"}
+        (select,) = [
+            q["sql"] for q in queries if 'FROM "stakeholders_stakeholder"' in q["sql"]
+        ]
+        assert '"name"' in select
+        assert "email" not in select
+
+    def test_all_fields_by_default(self) -> None:
+        """Test that every field is returned without ?fields="""
+        response = self.client.get("/api/stakeholders/")
+
+        assert set(response.json()[0]) == {
+            "id",
+            "name",
+            "organization",
+            "role",
+            "email",
+            "state",
+            "county",
+            "type",
+            "created_at",
+        }
+
+    def test_unknown_field(self) -> None:
+        """Test that unknown fields are rejected"""
+        response = self.client.get("/api/stakeholders/?fields=name,password")
+
+        assert response.status_code == 422
+
+    def test_filters(self) -> None:
+        """Test filtering by stakeholder type and state"""
+        response = self.client.get("/api/stakeholders/?type=farmer&state=md")
+
+        assert [s["name"] for s in response.json()] == ["Carol", "Dan"]
+
+    def test_ordering_pages(self) -> None:
+        """Test walking pages of a descending, non-unique ordering"""
+        names = []
+        url = "/api/stakeholders/?ordering=-name&fields=name&page_size=3"
+        while url:
+            response = self.client.get(url)
+            names.extend(s["name"] for s in response.json())
+            cursor = response.get("X-Next-Cursor")
+            url = cursor and f"/api/stakeholders/?ordering=-name&cursor={cursor}"
+
+        assert names == ["Dan", "Carol", "Bob", "Alice"]
+
+        response = self.client.get(
+            f"/api/stakeholders/?ordering=-name&page_size=3"
+            f"&cursor={response['X-Prev-Cursor']}",
+        )
+        assert [s["name"] for s in response.json()] == ["Dan", "Carol", "Bob"]
+
+    def test_invalid_ordering(self) -> None:
+        """Test that only the documented orderings are accepted"""
+        response = self.client.get("/api/stakeholders/?ordering=email")
+
+        assert response.status_code == 422
+
+
+class ExportAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+        for i in range(3):
+            stakeholder = Stakeholder.objects.create(
+                name=f"Stakeholder {i}",
+                organization=f"Org {i}",
+                email=f"person{i}@example.org",
+                state="MD",
+                type="farmer",
+            )
+            Endorsement.objects.create(stakeholder=stakeholder, campaign=self.campaign)
+
+    def test_export_endorsements_ndjson(self) -> None:
+        """Test that endorsements stream as one JSON object per line"""
+        response = self.client.get("/api/endorsements/export/")
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert len(rows) == 3
+        assert rows[0]["campaign"]["slug"] == "clean-water-act"
+        assert rows[0]["stakeholder"]["name"] == "Stakeholder 0"
+
+    def test_export_stakeholders_json_array(self) -> None:
+        """Test that format=json streams a single JSON array"""
+        with self.settings(API_EXPORT_CHUNK_SIZE=2):
+            response = self.client.get("/api/stakeholders/export/?format=json")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert 'filename="stakeholders.json"' in response["Content-Disposition"]
+        data = json.loads(b"".join(response.streaming_content))
+        assert [s["name"] for s in data] == [f"Stakeholder {i}" for i in range(3)]
+
+    def test_export_empty_json_array(self) -> None:
+        """Test that an empty table exports as an empty array"""
+        Stakeholder.objects.all().delete()
+
+        response = self.client.get("/api/stakeholders/export/?format=json")
+
+        assert json.loads(b"".join(response.streaming_content)) == []
+
+
+class HomepageCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        self.homepage = HomePage.objects.create(
+            organization_name="Cached Organization",
+            tagline="Cached tagline",
+            hero_title="Cached Hero",
+            about_section_content="Cached content",
+            contact_email="cache@test.org",
+        )
+        self.block = ContentBlock.objects.create(
+            homepage=self.homepage,
+            title="Cached Block",
+            content="Block content",
+            order=1,
+        )
+
+    def test_cache_hit_runs_no_queries(self) -> None:
+        """Test that a warm homepage cache is served without touching the DB"""
+        first = self.client.get("/api/homepage/")
+        assert first.status_code == 200
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/homepage/")
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second["Content-Type"] == "application/json; charset=utf-8"
+
+    def test_homepage_save_invalidates_cache(self) -> None:
+        """Test that saving the homepage drops the cached payload"""
+        self.client.get("/api/homepage/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.homepage.tagline = "Updated tagline"
+            self.homepage.save()
+
+        data = self.client.get("/api/homepage/").json()
+        assert data["tagline"] == "Updated tagline"
+
+    def test_content_block_save_invalidates_cache(self) -> None:
+        """Test that editing a content block drops the cached payload"""
+        self.client.get("/api/homepage/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.block.is_visible = False
+            self.block.save(update_fields=["is_visible"])
+
+        data = self.client.get("/api/homepage/").json()
+        assert data["content_blocks"] == []
+
+    def test_content_block_delete_invalidates_cache(self) -> None:
+        """Test that deleting a content block drops the cached payload"""
+        self.client.get("/api/homepage/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.block.delete()
+
+        data = self.client.get("/api/homepage/").json()
+        assert data["content_blocks"] == []
+
+    def test_cache_dropped_on_commit(self) -> None:
+        """Test that the payload is only dropped once the change commits"""
+        first = self.client.get("/api/homepage/")
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.homepage.tagline = "Updated tagline"
+            self.homepage.save()
+
+        # Until then a rebuild would cache the old rows, so keep serving them
+        assert self.client.get("/api/homepage/").content == first.content
+        for callback in callbacks:
+            callback()
+        data = self.client.get("/api/homepage/").json()
+        assert data["tagline"] == "Updated tagline"
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        self.stakeholder = Stakeholder.objects.create(
+            name="Test Farmer",
+            organization="Test Farm",
+            email="test@farm.com",
+            state="MD",
+            type="farmer",
+        )
+        HomePage.objects.create(
+            organization_name="Conditional Organization",
+            tagline="Conditional tagline",
+            hero_title="Conditional Hero",
+            about_section_content="Conditional content",
+            contact_email="etag@test.org",
+        )
+
+    def test_list_endpoint_returns_304_for_matching_etag(self) -> None:
+        """Test that a list endpoint honours If-None-Match"""
+        response = self.client.get("/api/stakeholders/")
+        etag = response["ETag"]
+        assert "Last-Modified" in response
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                "/api/stakeholders/",
+                HTTP_IF_NONE_MATCH=etag,
+            )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+
+    def test_list_etag_changes_when_table_changes(self) -> None:
+        """Test that saving a row produces a new ETag"""
+        etag = self.client.get("/api/stakeholders/")["ETag"]
+
+        self.stakeholder.county = "Talbot"
+        self.stakeholder.save()
+
+        response = self.client.get("/api/stakeholders/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_list_etag_depends_on_query(self) -> None:
+        """Test that different pages of a list have different ETags"""
+        first = self.client.get("/api/stakeholders/")
+        second = self.client.get("/api/stakeholders/?page_size=1")
+
+        assert first["ETag"] != second["ETag"]
+
+    def test_endorsement_etag_tracks_nested_tables(self) -> None:
+        """Test that endorsements revalidate when a nested stakeholder changes"""
+        etag = self.client.get("/api/endorsements/")["ETag"]
+
+        self.stakeholder.name = "Renamed Farmer"
+        self.stakeholder.save()
+
+        response = self.client.get("/api/endorsements/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_homepage_returns_304_without_queries(self) -> None:
+        """Test that a warm homepage revalidates with no database queries"""
+        response = self.client.get("/api/homepage/")
+        etag = response["ETag"]
+        assert "Last-Modified" in response
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/homepage/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_homepage_if_modified_since(self) -> None:
+        """Test that If-Modified-Since is honoured for the homepage"""
+        response = self.client.get("/api/homepage/")
+
+        response = self.client.get(
+            "/api/homepage/",
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+
+        assert response.status_code == 304
+
+    def test_homepage_if_modified_since_after_hiding_block(self) -> None:
+        """Test that hiding a block moves the homepage's Last-Modified forward"""
+        homepage = HomePage.objects.get()
+        block = ContentBlock.objects.create(
+            homepage=homepage,
+            title="Soon hidden",
+            block_type="text",
+            content="Hidden later.",
+        )
+        # A client that fetched the page yesterday; hiding the block below
+        # leaves every visible row's updated_at at that time
+        yesterday = timezone.now() - timedelta(days=1)
+        HomePage.objects.update(updated_at=yesterday)
+        ContentBlock.objects.update(updated_at=yesterday)
+
+        block.is_visible = False
+        block.save()
+
+        response = self.client.get(
+            "/api/homepage/",
+            HTTP_IF_MODIFIED_SINCE=http_date(yesterday.timestamp()),
+        )
+        assert response.status_code == 200
+        assert response.json()["content_blocks"] == []
+
+
+class BulkImportAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.staff = User.objects.create_user(
+            username="staff",
+            password="password",
+            is_staff=True,
+        )
+        self.client.force_login(self.staff)
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+
+    def _post(
+        self,
+        body: str | bytes,
+        content_type: str = "application/x-ndjson",
+    ) -> dict:
+        response = self.client.post(
+            "/api/stakeholders/bulk/",
+            data=body,
+            content_type=content_type,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def _ndjson(self, *rows: dict) -> str:
+        return "\n".join(json.dumps(row) for row in rows)
+
+    def _row(self, **overrides: object) -> dict:
+        row = {
+            "name": "Jane Farmer",
+            "organization": "Green Acres",
+            "email": "jane@example.org",
+            "state": "MD",
+            "type": "farmer",
+        }
+        row.update(overrides)
+        return row
+
+    def test_import_ndjson_creates_stakeholders(self) -> None:
+        """Test that NDJSON rows create stakeholders and endorsements"""
+        data = self._post(
+            self._ndjson(
+                self._row(campaign="clean-water-act", statement="Yes!"),
+                self._row(name="Bob", email="bob@example.org", organization="Bay"),
+            ),
+        )
+
+        assert data["created"] == 2
+        assert data["errors"] == 0
+        assert Stakeholder.objects.count() == 2
+        endorsement = Endorsement.objects.get()
+        assert endorsement.statement == "Yes!"
+        assert data["results"][0]["endorsement"] == "created"
+        assert data["results"][0]["stakeholder_id"] == endorsement.stakeholder_id
+        assert data["results"][1]["endorsement"] is None
+
+    def test_import_csv(self) -> None:
+        """Test that CSV bodies are detected from the Content-Type"""
+        body = (
+            "name,organization,email,state,type,campaign,public_display\r\n"
+            "Jane Farmer,Green Acres,jane@example.org,MD,farmer,clean-water-act,no\r\n"
+        )
+        data = self._post(body, content_type="text/csv")
+
+        assert data["created"] == 1
+        assert Endorsement.objects.get().public_display is False
+
+    def test_import_matches_existing_stakeholders(self) -> None:
+        """Test that email and organization match case-insensitively"""
+        existing = Stakeholder.objects.create(
+            name="Jane",
+            organization="Green Acres",
+            email="Jane@Example.org",
+            state="VA",
+            type="farmer",
+        )
+        Endorsement.objects.create(
+            stakeholder=existing,
+            campaign=self.campaign,
+            statement="Old",
+        )
+
+        data = self._post(
+            self._ndjson(
+                self._row(
+                    organization="GREEN ACRES",
+                    campaign="clean-water-act",
+                    statement="New",
+                ),
+            ),
+        )
+
+        assert data["updated"] == 1
+        assert data["results"][0]["stakeholder_id"] == existing.id
+        assert data["results"][0]["endorsement"] == "updated"
+        existing.refresh_from_db()
+        assert existing.state == "MD"
+        assert existing.email == "jane@example.org"
+        assert Endorsement.objects.get().statement == "New"
+
+    def test_import_deduplicates_within_batch(self) -> None:
+        """Test that repeated rows in one upload update the same stakeholder"""
+        data = self._post(
+            self._ndjson(
+                self._row(campaign="clean-water-act", statement="First"),
+                self._row(campaign="clean-water-act", statement="Second"),
+            ),
+        )
+
+        assert [r["status"] for r in data["results"]] == ["created", "updated"]
+        assert Stakeholder.objects.count() == 1
+        assert Endorsement.objects.get().statement == "Second"
+
+    def test_import_recounts_touched_campaigns(self) -> None:
+        """Test that region counts are rebuilt only for affected campaigns"""
+        maryland, virginia = (
+            Region.objects.create(geoid=geoid, name=label, label=label, type="state")
+            for geoid, label in [("24", "MD"), ("51", "VA")]
+        )
+        other, untouched = (
+            PolicyCampaign.objects.create(title=slug, slug=slug, summary="")
+            for slug in ["other", "untouched"]
+        )
+        jane = Stakeholder.objects.create(**self._row())
+        Endorsement.objects.create(stakeholder=jane, campaign=other)
+        bob = Stakeholder.objects.create(**self._row(email="bob@example.org"))
+        Endorsement.objects.create(stakeholder=bob, campaign=untouched)
+        RegionEndorsementCount.objects.filter(campaign=untouched).update(count=99)
+
+        # Jane moves state, so her existing endorsement changes region
+        self._post(self._ndjson(self._row(state="VA")))
+
+        assert list(
+            RegionEndorsementCount.objects.filter(campaign=other).values_list(
+                "region",
+                "count",
+            ),
+        ) == [(virginia.id, 1)]
+        untouched_count = RegionEndorsementCount.objects.get(campaign=untouched)
+        assert untouched_count.region_id == maryland.id
+        assert untouched_count.count == 99
+
+    def test_import_reports_row_errors(self) -> None:
+        """Test that invalid rows are reported without blocking valid ones"""
+        body = "\n".join(
+            [
+                json.dumps(self._row(email="not-an-email")),
+                "{not json",
+                json.dumps(self._row(campaign="no-such-campaign")),
+                json.dumps(self._row(email="ok@example.org")),
+            ],
+        )
+        with self.settings(BULK_IMPORT_BATCH_SIZE=2):
+            data = self._post(body)
+
+        assert data["created"] == 1
+        assert data["errors"] == 3
+        results = data["results"]
+        assert [r["row"] for r in results] == [1, 2, 3, 4]
+        assert results[0]["errors"][0].startswith("email:")
+        assert results[1]["errors"][0].startswith("Invalid JSON")
+        assert "no-such-campaign" in results[2]["errors"][0]
+        assert Stakeholder.objects.get().email == "ok@example.org"
+
+    def test_import_reports_undecodable_rows(self) -> None:
+        """Test that bytes that aren't UTF-8 are row errors, not server errors"""
+        ndjson = b"\n".join(
+            [
+                b'{"name": "\xff\xfe"}',
+                json.dumps(self._row()).encode(),
+            ],
+        )
+        data = self._post(ndjson)
+
+        assert data["created"] == 1
+        assert data["results"][0]["errors"][0].startswith("Invalid UTF-8")
+
+        csv_body = (
+            b"name,organization,email,state,type\r\n"
+            b"Bad \xff,Bay,bad@example.org,MD,farmer\r\n"
+            b"Bob,Bay,bob@example.org,MD,farmer\r\n"
+        )
+        data = self._post(csv_body, content_type="text/csv")
+
+        assert data["created"] == 1
+        assert [r["status"] for r in data["results"]] == ["error", "created"]
+        assert data["results"][0]["errors"][0].startswith("Invalid UTF-8")
+
+    def test_import_reports_malformed_csv(self) -> None:
+        """Test that csv.Error is reported for its row and reading continues"""
+        body = (
+            "name,organization,email,state,type\r\n"
+            f"{'x' * (csv.field_size_limit() + 1)},Bay,big@example.org,MD,farmer\r\n"
+            "Bob,Bay,bob@example.org,MD,farmer\r\n"
+        )
+        data = self._post(body, content_type="text/csv")
+
+        assert data["created"] == 1
+        assert data["results"][0]["errors"][0].startswith("Invalid CSV")
+
+    def test_import_requires_staff(self) -> None:
+        """Test that anonymous and non-staff users are rejected"""
+        self.client.logout()
+        response = self.client.post(
+            "/api/stakeholders/bulk/",
+            data=self._ndjson(self._row()),
+            content_type="application/x-ndjson",
+        )
+
+        assert response.status_code == 401
+        assert not Stakeholder.objects.exists()
+
+
+class AsyncAPITest(TestCase):
+    """Exercise the async handlers through the ASGI request path"""
+
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = AsyncClient()
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+        stakeholder = Stakeholder.objects.create(
+            name="Jane Farmer",
+            organization="Green Acres",
+            email="jane@example.org",
+            state="MD",
+            type="farmer",
+        )
+        Endorsement.objects.create(stakeholder=stakeholder, campaign=self.campaign)
+        HomePage.objects.create(
+            organization_name="Async Organization",
+            tagline="Async tagline",
+            hero_title="Async Hero",
+            about_section_content="Async content",
+            contact_email="async@test.org",
+            is_active=True,
+        )
+
+    async def test_list_endpoints(self) -> None:
+        """Test that the async list handlers paginate and set validators"""
+        for path in ("/api/campaigns/", "/api/endorsements/", "/api/legislators/"):
+            response = await self.client.get(path)
+            assert response.status_code == 200
+            assert "ETag" in response
+            assert isinstance(response.json(), list)
+
+        response = await self.client.get("/api/endorsements/")
+        assert response.json()[0]["campaign"]["slug"] == "clean-water-act"
+
+    async def test_list_not_modified(self) -> None:
+        """Test that async handlers answer revalidation with a 304"""
+        response = await self.client.get("/api/campaigns/")
+        response = await self.client.get(
+            "/api/campaigns/",
+            headers={"if-none-match": response["ETag"]},
+        )
+
+        assert response.status_code == 304
+
+    async def test_get_campaign_by_slug(self) -> None:
+        """Test the campaign detail route and its 404"""
+        response = await self.client.get("/api/campaigns/clean-water-act/")
+        assert response.status_code == 200
+        assert response.json()["title"] == "Clean Water Act"
+
+        response = await self.client.get("/api/campaigns/missing/")
+        assert response.status_code == 404
+
+    async def test_homepage(self) -> None:
+        """Test that the active homepage is served from the async handler"""
+        response = await self.client.get("/api/homepage/")
+
+        assert response.status_code == 200
+        assert response.json()["organization_name"] == "Async Organization"
+
+    async def test_export_streams_asynchronously(self) -> None:
+        """Test that exports use an async iterator under ASGI"""
+        response = await self.client.get("/api/endorsements/export/")
+
+        assert response.status_code == 200
+        assert response.is_async
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        assert json.loads(body)["stakeholder"]["name"] == "Jane Farmer"
+
+
+class CampaignEndorsementsAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+        other_campaign = PolicyCampaign.objects.create(
+            title="Other Campaign",
+            slug="other-campaign",
+            summary="Something else",
+        )
+        people = [
+            ("Farmer MD", "MD", "Talbot", "farmer", True),
+            ("Business MD", "MD", "Talbot", "business", True),
+            ("Farmer VA", "VA", "Accomack", "farmer", True),
+            ("Hidden", "MD", "Talbot", "farmer", False),
+        ]
+        for name, state, county, kind, public in people:
+            stakeholder = Stakeholder.objects.create(
+                name=name,
+                organization=f"{name} Org",
+                email=f"{name.replace(' ', '').lower()}@example.org",
+                state=state,
+                county=county,
+                type=kind,
+            )
+            Endorsement.objects.create(
+                stakeholder=stakeholder,
+                campaign=self.campaign,
+                public_display=public,
+            )
+        Endorsement.objects.create(stakeholder=stakeholder, campaign=other_campaign)
+
+    def _names(self, query: str = "") -> list[str]:
+        response = self.client.get(
+            f"/api/campaigns/clean-water-act/endorsements/{query}",
+        )
+        assert response.status_code == 200
+        return [e["stakeholder"]["name"] for e in response.json()]
+
+    def test_lists_public_endorsements_for_campaign(self) -> None:
+        """Test that only this campaign's public endorsements are listed"""
+        assert self._names() == ["Farmer MD", "Business MD", "Farmer VA"]
+
+    def test_hidden_endorsements_on_request(self) -> None:
+        """Test that public_display=false lists the hidden endorsements"""
+        assert self._names("?public_display=false") == ["Hidden"]
+
+    def test_stakeholder_filters(self) -> None:
+        """Test filtering by stakeholder type, state and county"""
+        assert self._names("?type=farmer") == ["Farmer MD", "Farmer VA"]
+        assert self._names("?state=md") == ["Farmer MD", "Business MD"]
+        assert self._names("?state=VA&county=Accomack") == ["Farmer VA"]
+        assert self._names("?type=nonprofit") == []
+
+    def test_paginates(self) -> None:
+        """Test that the listing uses cursor pagination"""
+        response = self.client.get(
+            "/api/campaigns/clean-water-act/endorsements/?page_size=2",
+        )
+
+        assert len(response.json()) == 2
+        next_page = self.client.get(
+            "/api/campaigns/clean-water-act/endorsements/"
+            f"?page_size=2&cursor={response['X-Next-Cursor']}",
+        )
+        assert [e["stakeholder"]["name"] for e in next_page.json()] == ["Farmer VA"]
+
+    def test_unknown_campaign(self) -> None:
+        """Test that an unknown slug returns 404"""
+        response = self.client.get("/api/campaigns/missing/endorsements/")
+
+        assert response.status_code == 404
+
+
+class CampaignBillsAPITest(TestCase):
+    URL = "/api/campaigns/clean-water-act/bills/"
+
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+        self.legislators = [
+            Legislator.objects.create(
+                bioguide_id=f"L{i:06}",
+                first_name="Pat",
+                last_name=f"Member{i}",
+                chamber="House",
+                state="MD",
+                district=f"{i:02}",
+                party="D",
+            )
+            for i in range(1, 4)
+        ]
+
+    def _add_bills(self, count: int) -> list[Bill]:
+        bills = []
+        for i in range(count):
+            bill = Bill.objects.create(
+                policy=self.campaign,
+                number=f"H.R. {100 + i}",
+                title=f"Water Bill {i}",
+                chamber="House",
+                congress_session="119th",
+                introduced_date="2025-01-03",
+                is_primary=i == 1,
+            )
+            bill.sponsors.add(self.legislators[0])
+            bill.cosponsors.add(*self.legislators[1:])
+            bills.append(bill)
+        return bills
+
+    def test_lists_bills_with_sponsors(self) -> None:
+        """Test that bills come primary first with nested (co)sponsors"""
+        self._add_bills(2)
+
+        response = self.client.get(self.URL)
+
+        assert response.status_code == 200
+        bills = response.json()
+        assert [b["number"] for b in bills] == ["H.R. 101", "H.R. 100"]
+        assert bills[0]["sponsors"] == [
+            {
+                "id": self.legislators[0].id,
+                "bioguide_id": "L000001",
+                "first_name": "Pat",
+                "last_name": "Member1",
+                "party": "D",
+                "chamber": "House",
+                "state": "MD",
+                "district": "01",
+            },
+        ]
+        assert [c["last_name"] for c in bills[0]["cosponsors"]] == [
+            "Member2",
+            "Member3",
+        ]
+
+    def test_query_count_is_constant(self) -> None:
+        """Test that listing 10 bills takes as many queries as listing 2"""
+        counts = []
+        for total in (2, 10):
+            Bill.objects.all().delete()
+            self._add_bills(total)
+            cache_clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.URL)
+            assert len(response.json()) == total
+            counts.append(len(queries))
+
+        # The campaign, the bills, and one prefetch per relation
+        assert counts == [4, 4]
+
+    def test_cached_until_sponsors_change(self) -> None:
+        """Test that a cache hit skips the bills until an M2M change"""
+        bill = self._add_bills(1)[0]
+        self.client.get(self.URL)
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(self.URL)
+        assert len(queries) == 1
+        assert cached.json()[0]["sponsors"][0]["last_name"] == "Member1"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bill.sponsors.add(self.legislators[2])
+        sponsors = self.client.get(self.URL).json()[0]["sponsors"]
+        assert [s["last_name"] for s in sponsors] == ["Member1", "Member3"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.legislators[2].sponsored_bills.clear()
+        sponsors = self.client.get(self.URL).json()[0]["sponsors"]
+        assert [s["last_name"] for s in sponsors] == ["Member1"]
+
+    def test_legislator_edit_invalidates(self) -> None:
+        """Test that renaming a sponsor refreshes the cached bills"""
+        self._add_bills(1)
+        self.client.get(self.URL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.legislators[0].last_name = "Renamed"
+            self.legislators[0].save()
+
+        sponsors = self.client.get(self.URL).json()[0]["sponsors"]
+        assert sponsors[0]["last_name"] == "Renamed"
+
+    def test_cache_dropped_on_commit(self) -> None:
+        """Test that the payload is only dropped once a bill change commits"""
+        bill = self._add_bills(1)[0]
+        first = self.client.get(self.URL)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            bill.title = "Renamed Bill"
+            bill.save()
+
+        # Until then a rebuild would cache the old rows, so keep serving them
+        assert self.client.get(self.URL).content == first.content
+        for callback in callbacks:
+            callback()
+        assert self.client.get(self.URL).json()[0]["title"] == "Renamed Bill"
+
+    def test_not_modified(self) -> None:
+        """Test that a matching If-None-Match returns 304"""
+        self._add_bills(1)
+        etag = self.client.get(self.URL)["ETag"]
+
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_unknown_campaign(self) -> None:
+        """Test that an unknown slug returns 404"""
+        response = self.client.get("/api/campaigns/missing/bills/")
+
+        assert response.status_code == 404
+
+
+class RegionLocateAPITest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        self.state = Region.objects.create(
+            name="Maryland",
+            geoid="24",
+            type="state",
+            geom=MultiPolygon(Polygon.from_bbox((0, 0, 10, 10)), srid=4326),
+        )
+        self.district = Region.objects.create(
+            name="MD-01",
+            geoid="2401",
+            type="cd119",
+            parent=self.state,
+            geom=MultiPolygon(Polygon.from_bbox((0, 0, 5, 5)), srid=4326),
+        )
+
+    def _locate(self, lat: float, lng: float) -> dict:
+        response = self.client.get(f"/api/regions/locate/?lat={lat}&lng={lng}")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_point_in_district(self) -> None:
+        """Test that a point returns its state and congressional district"""
+        data = self._locate(lat=2, lng=3)
+
+        assert data["state"]["name"] == "Maryland"
+        assert data["district"]["geoid"] == "2401"
+
+    def test_point_in_state_only(self) -> None:
+        """Test a point inside the state but outside every district"""
+        data = self._locate(lat=8, lng=8)
+
+        assert data["state"]["id"] == self.state.id
+        assert data["district"] is None
+
+    def test_point_outside_every_box_skips_database(self) -> None:
+        """Test that the bounding-box prefilter avoids a polygon query"""
+        self._locate(lat=2, lng=3)
+
+        # Only the regions version that keys the cached boxes is read
+        with self.assertNumQueries(1):
+            data = self._locate(lat=50, lng=50)
+        assert data == {"state": None, "district": None}
+
+    def test_index_refreshed_when_regions_change(self) -> None:
+        """Test that saving a region invalidates the cached boxes"""
+        assert self._locate(lat=50, lng=50)["state"] is None
+
+        Region.objects.create(
+            name="Elsewhere",
+            geoid="99",
+            type="state",
+            geom=MultiPolygon(Polygon.from_bbox((40, 40, 60, 60)), srid=4326),
+        )
+
+        assert self._locate(lat=50, lng=50)["state"]["name"] == "Elsewhere"
+
+    def test_invalid_coordinates(self) -> None:
+        """Test that out-of-range or missing coordinates are rejected"""
+        response = self.client.get("/api/regions/locate/?lat=91&lng=0")
+        assert response.status_code == 422
+
+        response = self.client.get("/api/regions/locate/?lat=10")
+        assert response.status_code == 422
+
+
+class StakeholderLocationAPITest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        self.region = Region.objects.create(
+            name="Kent County, MD",
+            geoid="24029",
+            type="county",
+            geom=MultiPolygon(Polygon.from_bbox((-76.3, 39.0, -75.8, 39.4)), srid=4326),
+        )
+        self.places = {
+            "chestertown": Point(-76.07, 39.21, srid=4326),
+            "annapolis": Point(-76.49, 38.98, srid=4326),
+        }
+        self.stakeholders = {
+            name: Stakeholder.objects.create(
+                name=name,
+                organization=name,
+                email=f"{name}@example.org",
+                state="MD",
+                type="farmer",
+                location=point,
+            )
+            for name, point in self.places.items()
+        }
+        # Stakeholders without a location never match a location filter
+        Stakeholder.objects.create(
+            name="Nowhere",
+            organization="Nowhere",
+            email="nowhere@example.org",
+            state="ZZ",
+            type="other",
+        )
+
+    def _names(self, query: str) -> list[str]:
+        response = self.client.get(f"/api/stakeholders/?{query}")
+        assert response.status_code == 200
+        return [s["name"] for s in response.json()]
+
+    def test_within_region(self) -> None:
+        """Test filtering stakeholders to those inside a region"""
+        assert self._names(f"within={self.region.id}") == ["chestertown"]
+
+    def test_within_radius(self) -> None:
+        """Test filtering stakeholders to those near a point"""
+        query = "lat=38.97&lng=-76.5&radius"
+        assert self._names(f"{query}=5") == ["annapolis"]
+        assert self._names(f"{query}=50") == ["chestertown", "annapolis"]
+
+    def test_within_radius_spatialite(self) -> None:
+        """Test the distance_lte fallback used on SpatiaLite"""
+        query = "lat=38.97&lng=-76.5&radius"
+        with patch.object(connection.ops, "spatialite", True):
+            assert self._names(f"{query}=5") == ["annapolis"]
+            assert self._names(f"{query}=50") == ["chestertown", "annapolis"]
+
+    def test_unknown_region(self) -> None:
+        """Test that an unknown region is a 404"""
+        response = self.client.get("/api/stakeholders/?within=999999")
+
+        assert response.status_code == 404
+
+    def test_partial_radius(self) -> None:
+        """Test that lat, lng and radius must be given together"""
+        response = self.client.get("/api/stakeholders/?lat=38.97&lng=-76.5")
+
+        assert response.status_code == 422
+
+
+class RegionTileAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        Region.objects.create(
+            name="Maryland",
+            geoid="24",
+            type="state",
+            geom=MultiPolygon(Polygon.from_bbox((-79, 38, -75, 40)), srid=4326),
+        )
+
+    def _get(self, path: str, **headers: str) -> HttpResponse:
+        with self.settings(REGION_TILE_CACHE_DIR=self.cache_dir.name):
+            return self.client.get(path, **headers)
+
+    def test_tile_with_region(self) -> None:
+        """Test that a tile over a region returns a non-empty vector tile"""
+        response = self._get("/api/regions/tiles/4/4/6.mvt")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/vnd.mapbox-vector-tile"
+        assert response.content
+        assert b"Maryland" in response.content
+
+    def test_tile_includes_buffer(self) -> None:
+        """Test that a region just outside the tile is drawn into its buffer"""
+        # Tile 4/4/6 ends at -67.5 degrees; its buffer reaches about 0.35 further
+        Region.objects.create(
+            name="Edge",
+            geoid="99",
+            type="state",
+            geom=MultiPolygon(Polygon.from_bbox((-67.4, 30, -67.3, 31)), srid=4326),
+        )
+
+        response = self._get("/api/regions/tiles/4/4/6.mvt")
+
+        assert b"Edge" in response.content
+
+    def test_empty_tile(self) -> None:
+        """Test that a tile away from every region is empty"""
+        response = self._get("/api/regions/tiles/4/0/0.mvt")
+
+        assert response.status_code == 200
+        assert response.content == b""
+
+    def test_type_filter(self) -> None:
+        """Test that ?type= limits the tile to one region type"""
+        response = self._get("/api/regions/tiles/4/4/6.mvt?type=cd119")
+
+        assert response.content == b""
+
+    def test_not_modified(self) -> None:
+        """Test tile revalidation with If-None-Match"""
+        response = self._get("/api/regions/tiles/4/4/6.mvt")
+        response = self._get(
+            "/api/regions/tiles/4/4/6.mvt",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        assert response.status_code == 304
+
+    def test_invalid_tile(self) -> None:
+        """Test that coordinates outside the zoom level return 404"""
+        response = self._get("/api/regions/tiles/2/4/0.mvt")
+
+        assert response.status_code == 404
+
+
+class RegionGeometryAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.state = Region.objects.create(
+            name="Maryland",
+            geoid="24",
+            label="MD",
+            type="state",
+        )
+        self.district = Region.objects.create(name="MD-01", geoid="2401", type="cd119")
+        for region in (self.state, self.district):
+            for zoom in (3, 9):
+                RegionGeometry.objects.create(
+                    region=region,
+                    zoom=zoom,
+                    tolerance=360 / (256 * 2**zoom),
+                    geojson=(
+                        f'{{"type":"MultiPolygon","coordinates":'
+                        f"[[[[{zoom},0],[1,0],[1,1],[{zoom},0]]]]}}"
+                    ),
+                )
+
+    def test_feature_collection(self) -> None:
+        """Test that regions are returned as GeoJSON features"""
+        response = self.client.get("/api/regions/?resolution=3")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/geo+json"
+        data = json.loads(response.content)
+        assert data["type"] == "FeatureCollection"
+        assert data["resolution"] == 3
+        assert [feature["id"] for feature in data["features"]] == [
+            self.state.id,
+            self.district.id,
+        ]
+        feature = data["features"][0]
+        assert feature["properties"] == {
+            "geoid": "24",
+            "name": "Maryland",
+            "label": "MD",
+            "type": "state",
+        }
+        assert feature["geometry"]["coordinates"][0][0][0] == [3, 0]
+
+    def test_resolution_rounds_up(self) -> None:
+        """Test that the next more detailed stored level is served"""
+        for requested, served in ((0, 3), (4, 9), (9, 9), (14, 9)):
+            response = self.client.get(f"/api/regions/?resolution={requested}")
+            assert json.loads(response.content)["resolution"] == served
+
+    def test_type_filter(self) -> None:
+        """Test that ?type= limits the collection to one region type"""
+        response = self.client.get("/api/regions/?type=cd119")
+
+        features = json.loads(response.content)["features"]
+        assert [feature["properties"]["name"] for feature in features] == ["MD-01"]
+
+    def test_no_geometries(self) -> None:
+        """Test an empty collection before simplify_regions has run"""
+        RegionGeometry.objects.all().delete()
+
+        data = json.loads(self.client.get("/api/regions/").content)
+
+        assert data == {"type": "FeatureCollection", "resolution": None, "features": []}
+
+    def test_not_modified(self) -> None:
+        """Test revalidation with If-None-Match"""
+        response = self.client.get("/api/regions/?resolution=6")
+        response = self.client.get(
+            "/api/regions/?resolution=6",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        assert response.status_code == 304
+
+    def test_invalid_resolution(self) -> None:
+        """Test that a resolution outside 0-22 is rejected"""
+        response = self.client.get("/api/regions/?resolution=30")
+
+        assert response.status_code == 422
+
+
+class LegislatorScorecardAPITest(TestCase):
+    URL = "/api/legislators/scorecard/"
+
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        water, soil = (
+            PolicyCampaign.objects.create(title=slug, slug=slug, summary="")
+            for slug in ("water", "soil")
+        )
+        members = [
+            ("S000001", "Smith", "House", "D", "MD"),
+            ("J000001", "Jones", "Senate", "R", "VA"),
+            ("L000001", "Lee", "House", "R", "MD"),
+        ]
+        smith, jones, lee = (
+            Legislator.objects.create(
+                bioguide_id=bioguide_id,
+                first_name="Pat",
+                last_name=last_name,
+                chamber=chamber,
+                party=party,
+                state=state,
+            )
+            for bioguide_id, last_name, chamber, party, state in members
+        )
+        for i, campaign in enumerate([water, water, soil]):
+            bill = Bill.objects.create(
+                policy=campaign,
+                number=f"H.R. {i}",
+                title="A bill",
+                chamber="House",
+                introduced_date="2025-02-01",
+            )
+            bill.cosponsors.add(jones)
+            if campaign == water:
+                bill.sponsors.add(smith)
+            else:
+                bill.sponsors.add(lee)
+
+    def _rows(self, query: str = "") -> list[tuple[str, str, int]]:
+        response = self.client.get(f"{self.URL}{query}")
+        assert response.status_code == 200
+        return [
+            (row["legislator"]["last_name"], row["campaign"], row["total"])
+            for row in response.json()
+        ]
+
+    def test_most_bills_first(self) -> None:
+        """Test that scores are listed by total, with legislator summaries"""
+        response = self.client.get(self.URL)
+
+        first = response.json()[0]
+        assert first["legislator"]["bioguide_id"] in {"S000001", "J000001"}
+        assert {k: first[k] for k in ("sponsored", "cosponsored", "total")} in [
+            {"sponsored": 2, "cosponsored": 0, "total": 2},
+            {"sponsored": 0, "cosponsored": 2, "total": 2},
+        ]
+        assert [total for _, _, total in self._rows()] == [2, 2, 1, 1]
+
+    def test_filters(self) -> None:
+        """Test filtering by campaign, chamber, party and state"""
+        assert sorted(self._rows("?campaign=soil")) == [
+            ("Jones", "soil", 1),
+            ("Lee", "soil", 1),
+        ]
+        assert self._rows("?chamber=Senate&campaign=water") == [
+            ("Jones", "water", 2),
+        ]
+        assert self._rows("?party=r&state=md") == [("Lee", "soil", 1)]
+
+    def test_reads_precomputed_rows(self) -> None:
+        """Test that a page is one query on the score table, joined for names"""
+        with CaptureQueriesContext(connection) as queries:
+            self._rows()
+
+        sql = [query["sql"] for query in queries]
+        assert len(sql) == 2  # Table versions, then the page
+        assert 'FROM "legislators_legislatorscore"' in sql[1]
+        assert "campaigns_bill" not in sql[1]
+
+    def test_paginates(self) -> None:
+        """Test cursor pagination over the ordered scores"""
+        response = self.client.get(f"{self.URL}?page_size=3")
+        rest = self.client.get(
+            f"{self.URL}?page_size=3&cursor={response['X-Next-Cursor']}",
+        )
+
+        assert len(response.json()) + len(rest.json()) == 4
+
+    def test_unknown_campaign(self) -> None:
+        """Test that an unknown campaign slug returns 404"""
+        response = self.client.get(f"{self.URL}?campaign=missing")
+
+        assert response.status_code == 404
+
+
+class LegislatorLocateAPITest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        self.client = Client()
+        maryland = Region.objects.create(
+            name="Maryland",
+            geoid="24",
+            label="MD",
+            type="state",
+            geom=MultiPolygon(Polygon.from_bbox((-79, 38, -75, 40)), srid=4326),
+        )
+        district = Region.objects.create(
+            name="MD-01",
+            geoid="2401",
+            type="cd119",
+            parent=maryland,
+            geom=MultiPolygon(Polygon.from_bbox((-77, 38, -75, 40)), srid=4326),
+        )
+        common = {"party": "D", "state": "MD", "first_name": "First"}
+        Legislator.objects.create(
+            bioguide_id="H000001",
+            last_name="Representative",
+            chamber="House",
+            district="1",
+            region=district,
+            **common,
+        )
+        Legislator.objects.create(
+            bioguide_id="S000002",
+            last_name="Junior",
+            chamber="Senate",
+            is_senior=False,
+            region=maryland,
+            **common,
+        )
+        Legislator.objects.create(
+            bioguide_id="S000001",
+            last_name="Senior",
+            chamber="Senate",
+            is_senior=True,
+            region=maryland,
+            **common,
+        )
+        Legislator.objects.create(
+            bioguide_id="S000003",
+            last_name="Former",
+            chamber="Senate",
+            in_office=False,
+            region=maryland,
+            **common,
+        )
+
+    def _locate(self, **params: float) -> list[dict]:
+        response = self.client.get("/api/legislators/locate/", params)
+        assert response.status_code == 200
+        return response.json()
+
+    def test_point_in_district(self) -> None:
+        """Test that a point returns its senators first, then its House member"""
+        data = self._locate(lat=39, lng=-76)
+
+        assert [item["last_name"] for item in data] == [
+            "Senior",
+            "Junior",
+            "Representative",
+        ]
+        assert data[2]["region"] == {
+            "id": data[2]["region"]["id"],
+            "geoid": "2401",
+            "name": "MD-01",
+            "label": None,
+            "type": "cd119",
+        }
+
+    def test_point_outside_district(self) -> None:
+        """Test a point in the state but outside every district"""
+        data = self._locate(lat=39, lng=-78)
+
+        assert [item["chamber"] for item in data] == ["Senate", "Senate"]
+
+    def test_single_query(self) -> None:
+        """Test that a lookup is one query once the box index is cached"""
+        self._locate(lat=39, lng=-76)
+
+        with self.assertNumQueries(1):
+            self._locate(lat=39, lng=-76)
+
+    def test_point_outside_every_region(self) -> None:
+        """Test that a point outside every region returns no legislators"""
+        assert self._locate(lat=10, lng=10) == []
+
+
+class CampaignEndorsementMapAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.maryland = Region.objects.create(
+            geoid="24",
+            name="Maryland",
+            label="MD",
+            type="state",
+            geojson={
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1, 0], [0, 1], [0, 0]]],
+            },
+        )
+        Region.objects.create(geoid="10", name="Delaware", label="DE", type="state")
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+        for i, (state, public) in enumerate(
+            [("MD", True), ("MD", True), ("MD", False), ("DE", False)],
+        ):
+            Endorsement.objects.create(
+                stakeholder=Stakeholder.objects.create(
+                    name=f"Farmer {i}",
+                    organization=f"Farm {i}",
+                    email=f"farmer{i}@example.com",
+                    state=state,
+                    type="farmer",
+                ),
+                campaign=self.campaign,
+                public_display=public,
+            )
+
+    def test_public_counts_per_state(self) -> None:
+        """Test that only states with public endorsements are returned"""
+        response = self.client.get(
+            "/api/campaigns/clean-water-act/endorsements/regions/",
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/geo+json"
+        data = response.json()
+        assert data["type"] == "FeatureCollection"
+        assert data["total"] == 2
+        (feature,) = data["features"]
+        assert feature["id"] == self.maryland.id
+        assert feature["geometry"] == self.maryland.geojson
+        assert feature["properties"] == {
+            "geoid": "24",
+            "name": "Maryland",
+            "label": "MD",
+            "type": "state",
+            "count": 2,
+        }
+
+    def test_single_query_for_counts(self) -> None:
+        """Test that the counts come from the aggregate table in one query"""
+        # Campaign lookup, table versions, counts
+        with self.assertNumQueries(3):
+            self.client.get("/api/campaigns/clean-water-act/endorsements/regions/")
+
+    def test_not_modified_until_endorsement_changes(self) -> None:
+        """Test revalidation with If-None-Match"""
+        url = "/api/campaigns/clean-water-act/endorsements/regions/"
+        etag = self.client.get(url)["ETag"]
+
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        Endorsement.objects.filter(public_display=False).first().delete()
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_unknown_campaign(self) -> None:
+        """Test that an unknown campaign returns 404"""
+        response = self.client.get("/api/campaigns/unknown/endorsements/regions/")
+
+        assert response.status_code == 404
+
+
+class CampaignEndorsementMapLoadedRegionsTest(RegionFileTestMixin, TestCase):
+    def test_geometry_from_load_regions(self) -> None:
+        """Test that states loaded by load_regions have a shape to draw"""
+        call_command(
+            "load_regions",
+            self.states_layer(),
+            "--type=state",
+            stdout=StringIO(),
+        )
+        campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="",
+        )
+        Endorsement.objects.create(
+            stakeholder=Stakeholder.objects.create(
+                name="Farmer",
+                organization="Farm",
+                email="farmer@example.com",
+                state="MD",
+                type="farmer",
+            ),
+            campaign=campaign,
+        )
+
+        data = self.client.get(
+            "/api/campaigns/clean-water-act/endorsements/regions/",
+        ).json()
+
+        (feature,) = data["features"]
+        assert feature["properties"]["name"] == "Maryland"
+        assert feature["geometry"]["type"] == "MultiPolygon"
+
+
+class SearchAPITest(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water",
+            summary="Protect farmland streams from runoff",
+        )
+        self.bill = Bill.objects.create(
+            policy=self.campaign,
+            number="H.R. 1234",
+            title="Farmland Water Quality Act",
+            chamber="House",
+            congress_session="119th",
+            introduced_date="2025-01-03",
+        )
+        self.stakeholder = Stakeholder.objects.create(
+            name="Jamie Smith",
+            organization="Bay Area Farmers Coalition",
+            email="jamie@example.org",
+            state="MD",
+            type="farmer",
+        )
+
+    def _search(self, query: str) -> list[dict]:
+        response = self.client.get(f"/api/search/?{query}")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_prefix_search_across_types(self) -> None:
+        """Test that partial words match stakeholders, campaigns and bills"""
+        results = self._search("q=farm")
+
+        assert {(r["type"], r["id"]) for r in results} == {
+            ("stakeholder", self.stakeholder.id),
+            ("campaign", self.campaign.id),
+            ("bill", self.bill.id),
+        }
+        bill = next(r for r in results if r["type"] == "bill")
+        assert bill["label"] == "H.R. 1234"
+        assert bill["slug"] == "clean-water"
+
+    def test_all_words_must_match(self) -> None:
+        """Test that every word of the query narrows the results"""
+        results = self._search("q=water+quality")
+
+        assert [(r["type"], r["id"]) for r in results] == [("bill", self.bill.id)]
+
+    def test_type_filter(self) -> None:
+        """Test limiting the search to one type"""
+        results = self._search("q=farm&type=stakeholder")
+
+        assert [r["label"] for r in results] == ["Jamie Smith"]
+
+    def test_edits_are_searchable(self) -> None:
+        """Test that the index follows updates and deletes"""
+        self.stakeholder.organization = "Chesapeake Watermen"
+        self.stakeholder.save()
+        self.campaign.delete()
+
+        assert self._search("q=farm") == []
+        assert self._search("q=chesapeake")[0]["detail"] == "Chesapeake Watermen"
+
+    def test_query_without_words(self) -> None:
+        """Test that punctuation or single letters match nothing"""
+        assert self._search("q=%22%2A+a") == []
+
+    def test_query_required(self) -> None:
+        """Test that q is required"""
+        response = self.client.get("/api/search/")
+
+        assert response.status_code == 422
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from django.contrib import admin
+from django.db.models import Count
 
 from .models import Bill, PolicyCampaign
 
@@ -24,7 +25,14 @@ class PolicyCampaignAdmin(admin.ModelAdmin):
 
     inlines = [BillInline]
 
-    list_display = ("title", "slug", "active", "created_at", "bill_count")
+    list_display = (
+        "title",
+        "slug",
+        "active",
+        "created_at",
+        "bill_count",
+        "current_bill_numbers",
+    )
 
     list_filter = ("active", "created_at")
 
@@ -49,13 +57,24 @@ class PolicyCampaignAdmin(admin.ModelAdmin):
 
     def bill_count(self, obj: PolicyCampaign) -> int:
         """Display count of associated bills"""
-        return obj.bills.count()
+        return obj.bill_total
 
     bill_count.short_description = "Bills"
+    bill_count.admin_order_field = "bill_total"
+
+    @admin.display(description="Current bills")
+    def current_bill_numbers(self, obj: PolicyCampaign) -> str:
+        return ", ".join(bill.number for bill in obj.current_bills())
 
     def get_queryset(self, request: "HttpRequest") -> "QuerySet[PolicyCampaign]":
-        """Order by most recently created first"""
-        return super().get_queryset(request).order_by("-created_at")
+        """Order by most recently created first, with bill counts annotated"""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(bill_total=Count("bills", distinct=True))
+            .prefetch_related(PolicyCampaign.current_bills_prefetch())
+            .order_by("-created_at")
+        )
 
 
 @admin.register(Bill)
@@ -75,7 +94,7 @@ class BillAdmin(admin.ModelAdmin):
 
     list_filter = (
         "chamber",
-        "congress_session",
+        "congress",
         "is_primary",
         "policy",
         "introduced_date",
@@ -85,6 +104,8 @@ class BillAdmin(admin.ModelAdmin):
 
     list_editable = ("is_primary",)
 
+    list_select_related = ("policy",)
+
     readonly_fields = ("congress_session",)
 
     filter_horizontal = ("sponsors", "cosponsors")
@@ -108,7 +129,7 @@ class BillAdmin(admin.ModelAdmin):
         (
             "Congressional Information",
             {
-                "fields": ("congress_session",),
+                "fields": ("congress", "congress_session"),
                 "classes": ("collapse",),
             },
         ),
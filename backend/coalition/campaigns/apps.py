@@ -5,3 +5,6 @@ class CampaignsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "coalition.campaigns"
     label = "campaigns"  # Use original table names
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
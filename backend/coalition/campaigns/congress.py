@@ -0,0 +1,44 @@
+"""
+Congress numbers.
+
+A Congress sits for two years from January 3 of an odd-numbered year (the
+1st met in 1789). Bills store the number in ``Bill.congress``, which is
+indexed for ``PolicyCampaign.current_bills``, and show it as an ordinal
+label in ``Bill.congress_session``, e.g. ``"119th"``.
+"""
+
+import re
+from datetime import date
+
+from django.utils import timezone
+
+from coalition.core.formatting import ordinal
+
+FIRST_CONGRESS_YEAR = 1789
+
+# Day of January each Congress has convened on since the 20th Amendment
+# (the 74th, in 1935); dates before then are only approximately right
+CONVENING_DAY = 3
+
+
+def congress_for(day: date) -> int:
+    """The Congress in session on ``day``; ``2025-01-03`` -> ``119``"""
+    years = day.year - FIRST_CONGRESS_YEAR
+    if years % 2 == 0 and day < date(day.year, 1, CONVENING_DAY):
+        years -= 1
+    return years // 2 + 1
+
+
+def current_congress() -> int:
+    return congress_for(timezone.localdate())
+
+
+def parse_congress(label: str) -> int | None:
+    """``"119th"`` or ``"119"`` -> ``119``; None when there is no number"""
+    match = re.match(r"\s*(\d+)", label)
+    return int(match.group(1)) if match else None
+
+
+def congress_label(number: int) -> str:
+    """``121`` -> ``"121st"``"""
+    return ordinal(number)
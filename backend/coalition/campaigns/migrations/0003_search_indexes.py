@@ -0,0 +1,42 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Copies of the coalition.core.search definitions as of this migration, so
+# later edits there can't change what it does
+SEARCH_INDEXES = [
+    ("PolicyCampaign", "campaign_search_idx", ("title", "summary")),
+    ("Bill", "bill_search_idx", ("number", "title")),
+]
+
+
+def search_index(name, fields):
+    return GinIndex(SearchVector(*fields, config="english"), name=name)
+
+
+def add_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, name, fields in SEARCH_INDEXES:
+        model = apps.get_model("campaigns", model_name)
+        schema_editor.add_index(model, search_index(name, fields))
+
+
+def remove_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, name, fields in SEARCH_INDEXES:
+        model = apps.get_model("campaigns", model_name)
+        schema_editor.remove_index(model, search_index(name, fields))
+
+
+class Migration(migrations.Migration):
+    """Full-text GIN indexes on PostgreSQL (see coalition.core.search)"""
+
+    dependencies = [
+        ("campaigns", "0002_policycampaign_campaign_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_indexes, remove_indexes, elidable=False),
+    ]
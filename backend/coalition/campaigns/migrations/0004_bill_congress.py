@@ -0,0 +1,73 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:47
+
+import re
+from datetime import date
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+# Copies of coalition.campaigns.congress as of this migration, so later edits
+# there can't change what it does
+def congress_for(day):
+    years = day.year - 1789
+    if years % 2 == 0 and day < date(day.year, 1, 3):
+        years -= 1
+    return years // 2 + 1
+
+
+def parse_congress(label):
+    match = re.match(r"\s*(\d+)", label)
+    return int(match.group(1)) if match else None
+
+
+def congress_label(number):
+    if number % 100 in (11, 12, 13):
+        return f"{number}th"
+    return f"{number}{({1: 'st', 2: 'nd', 3: 'rd'}).get(number % 10, 'th')}"
+
+
+def backfill_congress(apps, schema_editor):
+    """Number every bill from its session label, or failing that its date"""
+    Bill = apps.get_model("campaigns", "Bill")
+    bills = Bill.objects.only("congress_session", "introduced_date").order_by("pk")
+    while batch := list(bills.filter(congress__isnull=True)[:BATCH_SIZE]):
+        for bill in batch:
+            bill.congress = parse_congress(bill.congress_session) or congress_for(
+                bill.introduced_date,
+            )
+            # Also corrects labels written as "{n}th", such as "121th"
+            bill.congress_session = congress_label(bill.congress)
+        Bill.objects.bulk_update(batch, ["congress", "congress_session"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("campaigns", "0003_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bill",
+            name="congress",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="Congress number, e.g. 119; worked out from the introduced date when left blank",
+                null=True,
+            ),
+        ),
+        # Filled before the index is built, so it is built once
+        migrations.RunPython(
+            backfill_congress,
+            migrations.RunPython.noop,
+            elidable=True,
+        ),
+        migrations.AddIndex(
+            model_name="bill",
+            index=models.Index(
+                fields=["congress", "policy"],
+                name="bill_congress_policy_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,15 @@
+from typing import TYPE_CHECKING
+
 from django.db import models
-from django.utils import timezone
+from django.db.models import Prefetch
+
+from .congress import congress_for, congress_label, current_congress, parse_congress
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# Attribute current_bills_prefetch() stores each campaign's current bills in
+CURRENT_BILLS_ATTR = "prefetched_current_bills"
 
 
 class PolicyCampaign(models.Model):
@@ -9,12 +19,44 @@ class PolicyCampaign(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="campaign_created_id_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
-    def current_bills(self) -> "models.QuerySet[Bill]":
-        session = f"{((timezone.now().date().year - 1789) // 2) + 1}th"
-        return self.bills.filter(congress_session=session)
+    def current_bills(self) -> "models.QuerySet[Bill] | list[Bill]":
+        """
+        This campaign's bills in the current Congress.
+
+        A list when the campaign was fetched with
+        :meth:`current_bills_prefetch`, otherwise a query.
+        """
+        if hasattr(self, CURRENT_BILLS_ATTR):
+            return getattr(self, CURRENT_BILLS_ATTR)
+        return self.bills.filter(congress=current_congress())
+
+    @staticmethod
+    def current_bills_prefetch() -> Prefetch:
+        """
+        Fetch the current bills of a page of campaigns in one query.
+
+        ``PolicyCampaign.objects.prefetch_related(
+        PolicyCampaign.current_bills_prefetch())``
+        """
+        return Prefetch(
+            "bills",
+            queryset=Bill.objects.filter(congress=current_congress()).order_by(
+                "-is_primary",
+                "number",
+            ),
+            to_attr=CURRENT_BILLS_ATTR,
+        )
 
 
 class Bill(models.Model):
@@ -28,6 +70,14 @@ class Bill(models.Model):
     number = models.CharField(max_length=50)
     title = models.CharField(max_length=255)
     chamber = models.CharField(max_length=10, choices=CHAMBER_CHOICES)
+    congress = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text=(
+            "Congress number, e.g. 119; worked out from the introduced date "
+            "when left blank"
+        ),
+    )
     congress_session = models.CharField(max_length=10)
     introduced_date = models.DateField()
     status = models.CharField(max_length=100, blank=True)
@@ -44,5 +94,25 @@ class Bill(models.Model):
         blank=True,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["congress", "policy"],
+                name="bill_congress_policy_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.number} ({self.chamber}, {self.congress_session})"
+
+    def save(self, *args: "Any", **kwargs: "Any") -> None:
+        """Fill in the Congress number and keep its label in step"""
+        if self.congress is None:
+            introduced = self._meta.get_field("introduced_date").to_python(
+                self.introduced_date,
+            )
+            self.congress = parse_congress(self.congress_session) or congress_for(
+                introduced,
+            )
+        self.congress_session = congress_label(self.congress)
+        super().save(*args, **kwargs)
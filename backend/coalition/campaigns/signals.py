@@ -0,0 +1,119 @@
+"""
+Keep the cached ``/api/campaigns/{slug}/bills/`` payloads current.
+
+A campaign's payload changes when one of its bills is saved or deleted, when
+a bill's sponsors or cosponsors change (from either side of the relation),
+and when a legislator it names is edited or removed. M2M changes skip
+``post_save``, so they also bump the Bill table version here. Payloads are
+dropped once the change commits, so a request racing the transaction can't
+cache the old rows again.
+"""
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from coalition.core.cache import invalidate_campaign_bills
+from coalition.core.models import TableVersion
+from coalition.legislators.models import Legislator
+
+from .models import Bill
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    from django.db.models import Model
+
+
+def _invalidate_on_commit(campaign_ids: "Iterable[int]") -> None:
+    ids = set(campaign_ids)
+    if ids:
+        transaction.on_commit(lambda: invalidate_campaign_bills(ids))
+
+
+def legislator_campaigns(legislator_ids: "Iterable[int]") -> set[int]:
+    """Ids of the campaigns with a bill (co)sponsored by any of the legislators"""
+    ids = list(legislator_ids)
+    bills = Bill.objects.filter(Q(sponsors__in=ids) | Q(cosponsors__in=ids))
+    return set(bills.values_list("policy_id", flat=True).distinct())
+
+
+@receiver(pre_save, sender=Bill)
+def remember_bill_campaign(
+    sender: type,
+    instance: Bill,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Note which campaign an existing bill belonged to before it is changed"""
+    if not raw and instance.pk:
+        saved = Bill.objects.filter(pk=instance.pk).values_list("policy_id", flat=True)
+        instance._saved_policy_id = saved.first()
+
+
+@receiver(post_save, sender=Bill)
+def bill_saved(sender: type, instance: Bill, **kwargs: "Any") -> None:
+    previous = getattr(instance, "_saved_policy_id", None)
+    _invalidate_on_commit(
+        [instance.policy_id, *([previous] if previous is not None else [])],
+    )
+
+
+@receiver(post_delete, sender=Bill)
+def bill_deleted(sender: type, instance: Bill, **kwargs: "Any") -> None:
+    _invalidate_on_commit([instance.policy_id])
+
+
+@receiver(m2m_changed, sender=Bill.sponsors.through)
+@receiver(m2m_changed, sender=Bill.cosponsors.through)
+def sponsors_changed(
+    sender: type,
+    instance: "Model",
+    action: str,
+    reverse: bool,
+    pk_set: "set[int] | None",
+    **kwargs: "Any",
+) -> None:
+    """
+    Invalidate the campaigns whose bills gained or lost (co)sponsors.
+
+    ``reverse`` changes start from a legislator, e.g.
+    ``legislator.sponsored_bills.add(bill)``. A reverse ``clear()`` sends no
+    bill ids afterwards, so its campaigns are looked up before the rows go.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_campaigns = legislator_campaigns([instance.pk])
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        campaigns = {instance.policy_id}
+    elif pk_set:
+        bills = Bill.objects.filter(pk__in=pk_set)
+        campaigns = set(bills.values_list("policy_id", flat=True))
+    else:
+        campaigns = getattr(instance, "_cleared_campaigns", set())
+    TableVersion.bump(Bill)
+    _invalidate_on_commit(campaigns)
+
+
+@receiver(post_save, sender=Legislator)
+@receiver(pre_delete, sender=Legislator)
+def legislator_changed(
+    sender: type,
+    instance: Legislator,
+    created: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Invalidate the campaigns naming a legislator; before a delete drops the rows"""
+    if not created:
+        _invalidate_on_commit(legislator_campaigns([instance.pk]))
@@ -0,0 +1,133 @@
+from datetime import date
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from coalition.core.tests_support import ChangelistQueryBudgetTestCase
+
+from .congress import congress_for, current_congress
+from .models import Bill, PolicyCampaign
+
+
+class CampaignAdminTest(ChangelistQueryBudgetTestCase):
+    def setUp(self) -> None:
+        self.client.force_login(
+            User.objects.create_superuser("admin", "admin@example.org", "pw"),
+        )
+
+    def _add_campaigns(self, count: int, bills: int = 2) -> None:
+        start = PolicyCampaign.objects.count()
+        for i in range(start, start + count):
+            campaign = PolicyCampaign.objects.create(
+                title=f"Campaign {i}",
+                slug=f"campaign-{i}",
+                summary="",
+            )
+            for number in range(bills):
+                Bill.objects.create(
+                    policy=campaign,
+                    number=f"H.R. {i}{number}",
+                    title="A bill",
+                    chamber="House",
+                    congress_session="119th",
+                    introduced_date="2025-01-03",
+                )
+
+    def test_changelist_query_budgets(self) -> None:
+        """Test that campaign and bill lists don't add queries per row"""
+        self._add_campaigns(2)
+
+        self.assert_query_budget(
+            ["/admin/campaigns/policycampaign/", "/admin/campaigns/bill/"],
+            partial(self._add_campaigns, 20),
+        )
+
+    def test_sort_by_bill_count(self) -> None:
+        """Test that the bill count column sorts by the annotated count"""
+        self._add_campaigns(1, bills=1)
+        self._add_campaigns(1, bills=3)
+        # Column 5 of list_display is the bill count
+        response = self.client.get("/admin/campaigns/policycampaign/?o=-5")
+
+        campaigns = response.context["cl"].result_list
+        assert [c.bill_total for c in campaigns] == [3, 1]
+
+
+class CongressTest(TestCase):
+    def setUp(self) -> None:
+        self.campaigns = [
+            PolicyCampaign.objects.create(
+                title=f"Campaign {i}",
+                slug=f"campaign-{i}",
+                summary="",
+            )
+            for i in range(3)
+        ]
+
+    def _bill(self, campaign: PolicyCampaign, number: str, **fields: object) -> Bill:
+        return Bill.objects.create(
+            policy=campaign,
+            number=number,
+            title="A bill",
+            chamber="House",
+            introduced_date=fields.pop("introduced_date", date(2025, 2, 1)),
+            **fields,
+        )
+
+    def test_congress_for(self) -> None:
+        """Test that a Congress starts on January 3 of odd-numbered years"""
+        assert congress_for(date(1789, 3, 4)) == 1
+        assert congress_for(date(2025, 1, 2)) == 118
+        assert congress_for(date(2025, 1, 3)) == 119
+        assert congress_for(date(2026, 12, 31)) == 119
+        assert congress_for(date(2027, 1, 3)) == 120
+
+    def test_save_fills_congress(self) -> None:
+        """Test that saving numbers a bill and labels it with the right suffix"""
+        labelled = self._bill(self.campaigns[0], "H.R. 1", congress_session="121th")
+        dated = self._bill(self.campaigns[0], "H.R. 2")
+        numbered = self._bill(self.campaigns[0], "H.R. 3", congress=122)
+
+        assert (labelled.congress, labelled.congress_session) == (121, "121st")
+        assert (dated.congress, dated.congress_session) == (119, "119th")
+        assert (numbered.congress, numbered.congress_session) == (122, "122nd")
+
+    def test_save_parses_string_date(self) -> None:
+        """Test that an unlabelled bill is numbered from a string date"""
+        bill = self._bill(self.campaigns[0], "H.R. 4", introduced_date="2027-01-03")
+
+        assert (bill.congress, bill.congress_session) == (120, "120th")
+
+    def test_current_bills(self) -> None:
+        """Test that only bills of the current Congress are current"""
+        current = current_congress()
+        self._bill(self.campaigns[0], "H.R. 1", congress=current)
+        self._bill(self.campaigns[0], "H.R. 2", congress=current - 1)
+
+        bills = self.campaigns[0].current_bills()
+
+        assert [bill.number for bill in bills] == ["H.R. 1"]
+
+    def test_prefetch_current_bills(self) -> None:
+        """Test that one query fetches the current bills of every campaign"""
+        current = current_congress()
+        for campaign in self.campaigns:
+            self._bill(campaign, f"S. {campaign.pk}", congress=current)
+            self._bill(campaign, f"H.R. {campaign.pk}", congress=current - 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            campaigns = list(
+                PolicyCampaign.objects.order_by("pk").prefetch_related(
+                    PolicyCampaign.current_bills_prefetch(),
+                ),
+            )
+            numbers = [
+                [bill.number for bill in campaign.current_bills()]
+                for campaign in campaigns
+            ]
+
+        assert len(queries) == 2
+        assert numbers == [[f"S. {c.pk}"] for c in self.campaigns]
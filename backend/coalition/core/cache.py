@@ -0,0 +1,171 @@
+"""
+Two-tier cache helpers.
+
+Reads go to the per-process L1 (the ``default`` cache) first and fall back to
+the shared L2 (the ``shared`` cache, when ``CACHE_L2_BACKEND`` is set). Writes
+and deletes go to both tiers. Another process's L1 cannot be cleared from
+here, so L1 entries use the shorter ``CACHE_L1_TIMEOUT`` whenever an L2 is
+configured; that timeout bounds how long an invalidation takes to reach every
+worker.
+
+The L2 tiers may query the database, so async callers go through
+``sync_to_async`` rather than touching the caches from the event loop.
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.cache.backends.base import BaseCache
+
+T = TypeVar("T")
+
+L1_ALIAS = "default"
+L2_ALIAS = "shared"
+
+ACTIVE_HOMEPAGE_CACHE_KEY = "homepage:active:json"
+CAMPAIGN_BILLS_CACHE_PREFIX = "campaign:bills"
+
+_MISSING = object()
+
+
+class CachedPayload(NamedTuple):
+    """A pre-rendered response body together with its HTTP validators"""
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+def has_shared_cache() -> bool:
+    """Whether a shared (cross-process) L2 cache is configured"""
+    return L2_ALIAS in settings.CACHES
+
+
+def _l1_timeout(timeout: int | None) -> int:
+    if timeout is None:
+        timeout = settings.CACHE_TIMEOUT
+    if has_shared_cache():
+        return min(timeout, settings.CACHE_L1_TIMEOUT)
+    return timeout
+
+
+def _tiers() -> "list[BaseCache]":
+    tiers = [caches[L1_ALIAS]]
+    if has_shared_cache():
+        tiers.append(caches[L2_ALIAS])
+    return tiers
+
+
+def cache_key(*parts: object) -> str:
+    """Join key parts into a single colon-separated cache key"""
+    return ":".join(str(part) for part in parts)
+
+
+def cache_get(key: str, default: "Any" = None, version: int | None = None) -> "Any":
+    """Read ``key`` from L1, falling back to L2 and refilling L1 on a hit"""
+    l1 = caches[L1_ALIAS]
+    value = l1.get(key, _MISSING, version=version)
+    if value is not _MISSING:
+        return value
+
+    if has_shared_cache():
+        value = caches[L2_ALIAS].get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            l1.set(key, value, timeout=_l1_timeout(None), version=version)
+            return value
+
+    return default
+
+
+def cache_set(
+    key: str,
+    value: "Any",
+    timeout: int | None = None,
+    version: int | None = None,
+) -> None:
+    """Write ``key`` to every tier; ``timeout`` defaults to CACHE_TIMEOUT"""
+    if timeout is None:
+        timeout = settings.CACHE_TIMEOUT
+    caches[L1_ALIAS].set(key, value, timeout=_l1_timeout(timeout), version=version)
+    if has_shared_cache():
+        caches[L2_ALIAS].set(key, value, timeout=timeout, version=version)
+
+
+def cache_delete(key: str, version: int | None = None) -> None:
+    """Remove ``key`` from every tier"""
+    for tier in _tiers():
+        tier.delete(key, version=version)
+
+
+def cache_clear() -> None:
+    """Empty every tier (mainly useful in tests)"""
+    for tier in _tiers():
+        tier.clear()
+
+
+def get_or_build(
+    key: str,
+    builder: Callable[[], T],
+    timeout: int | None = None,
+    version: int | None = None,
+) -> T:
+    """
+    Read-through cache: return the cached value for ``key`` or build it.
+
+    ``builder`` is only called on a miss in both tiers; its result is written
+    back to both. Pass ``version`` to keep several incompatible generations of
+    a value apart, e.g. after changing its shape.
+    """
+    value = cache_get(key, _MISSING, version=version)
+    if value is _MISSING:
+        value = builder()
+        cache_set(key, value, timeout=timeout, version=version)
+    return value
+
+
+def get_active_homepage_payload() -> CachedPayload | None:
+    """Return the cached JSON body of the active homepage, if present"""
+    return cache_get(ACTIVE_HOMEPAGE_CACHE_KEY)
+
+
+def set_active_homepage_payload(payload: CachedPayload) -> None:
+    """Cache the serialized active homepage for HOMEPAGE_CACHE_TIMEOUT seconds"""
+    cache_set(
+        ACTIVE_HOMEPAGE_CACHE_KEY,
+        payload,
+        timeout=settings.HOMEPAGE_CACHE_TIMEOUT,
+    )
+
+
+async def aget_active_homepage_payload() -> CachedPayload | None:
+    """Async version of :func:`get_active_homepage_payload`"""
+    return await sync_to_async(get_active_homepage_payload)()
+
+
+async def aset_active_homepage_payload(payload: CachedPayload) -> None:
+    """Async version of :func:`set_active_homepage_payload`"""
+    await sync_to_async(set_active_homepage_payload)(payload)
+
+
+def invalidate_homepage_cache() -> None:
+    """Drop the cached active homepage so the next request rebuilds it"""
+    cache_delete(ACTIVE_HOMEPAGE_CACHE_KEY)
+
+
+def campaign_bills_cache_key(campaign_id: int) -> str:
+    """Key of a campaign's serialized bills with their sponsors"""
+    return cache_key(CAMPAIGN_BILLS_CACHE_PREFIX, campaign_id, "json")
+
+
+def invalidate_campaign_bills(campaign_ids: Iterable[int]) -> None:
+    """Drop the cached bills of each campaign so the next request rebuilds them"""
+    for campaign_id in set(campaign_ids):
+        cache_delete(campaign_bills_cache_key(campaign_id))
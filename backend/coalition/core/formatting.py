@@ -0,0 +1,8 @@
+"""Text formatting helpers shared by several apps"""
+
+
+def ordinal(number: int) -> str:
+    """``1`` -> ``"1st"``, ``12`` -> ``"12th"``, ``22`` -> ``"22nd"``"""
+    if number % 100 in (11, 12, 13):
+        return f"{number}th"
+    return f"{number}{({1: 'st', 2: 'nd', 3: 'rd'}).get(number % 10, 'th')}"
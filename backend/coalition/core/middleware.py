@@ -0,0 +1,186 @@
+"""
+Compression of API responses.
+
+JSON, GeoJSON, NDJSON and vector tile responses under ``/api/`` are
+compressed with brotli (when the optional ``brotli`` package is installed) or
+gzip, whichever the client prefers in ``Accept-Encoding``. Streaming responses
+are compressed chunk by chunk as they are sent. For responses that carry an
+ETag, the compressed bytes are cached under that ETag, so an unchanged payload
+(such as the cached homepage) is compressed once rather than on every request.
+"""
+
+import hashlib
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from .cache import cache_key, get_or_build
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest, HttpResponseBase
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+API_PREFIX = "/api/"
+
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/geo+json",
+        "application/x-ndjson",
+        "application/vnd.mapbox-vector-tile",
+    },
+)
+
+_Compressor = tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Content codings this server can produce, most preferred first"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported coding for an ``Accept-Encoding`` header"""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in supported_encodings():
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def _compressor(encoding: str) -> _Compressor:
+    """Return ``(compress, finish)`` functions for an incremental compressor"""
+    if encoding == "br":
+        compressor = brotli.Compressor(
+            quality=settings.API_COMPRESSION_BROTLI_QUALITY,
+        )
+        return compressor.process, compressor.finish
+    # wbits=31 writes a gzip header (with a zero mtime, so output is stable)
+    compressor = zlib.compressobj(
+        settings.API_COMPRESSION_GZIP_LEVEL,
+        zlib.DEFLATED,
+        31,
+    )
+    return compressor.compress, compressor.flush
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a complete body with ``encoding`` (``"br"`` or ``"gzip"``)"""
+    process, finish = _compressor(encoding)
+    return process(data) + finish()
+
+
+def _compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    process, finish = _compressor(encoding)
+    for chunk in chunks:
+        if data := process(chunk):
+            yield data
+    yield finish()
+
+
+async def _acompress_stream(
+    chunks: AsyncIterator[bytes],
+    encoding: str,
+) -> AsyncIterator[bytes]:
+    process, finish = _compressor(encoding)
+    async for chunk in chunks:
+        if data := process(chunk):
+            yield data
+    yield finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Compress API responses according to the client's Accept-Encoding"""
+
+    def process_response(
+        self,
+        request: "HttpRequest",
+        response: "HttpResponseBase",
+    ) -> "HttpResponseBase":
+        if not self._is_compressible(request, response):
+            return response
+
+        # Set even when this response goes out uncompressed, so shared caches
+        # keep the encoded and plain variants of the URL apart
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            content = response.streaming_content
+            response.streaming_content = (
+                _acompress_stream(content, encoding)
+                if response.is_async
+                else _compress_stream(content, encoding)
+            )
+            del response["Content-Length"]
+        else:
+            if len(response.content) < settings.API_COMPRESSION_MIN_SIZE:
+                return response
+            compressed = self._compress_content(request, response, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # The encoded bytes differ from the original, so a strong validator no
+        # longer applies; a weak one still matches If-None-Match
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = f"W/{etag}"
+        response["Content-Encoding"] = encoding
+        return response
+
+    def _is_compressible(
+        self,
+        request: "HttpRequest",
+        response: "HttpResponseBase",
+    ) -> bool:
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        return (
+            request.path.startswith(API_PREFIX)
+            and response.status_code == 200
+            and content_type in COMPRESSIBLE_TYPES
+            and not response.has_header("Content-Encoding")
+            and "no-transform" not in response.get("Cache-Control", "")
+        )
+
+    def _compress_content(
+        self,
+        request: "HttpRequest",
+        response: "HttpResponseBase",
+        encoding: str,
+    ) -> bytes:
+        """Compress the body, reusing an earlier result for the same ETag"""
+        etag = response.get("ETag")
+        if not etag or request.method not in ("GET", "HEAD"):
+            return compress(response.content, encoding)
+
+        # ETags are only unique per URL, so the path is part of the key
+        digest = hashlib.sha256(f"{request.get_full_path()}|{etag}".encode())
+        key = cache_key("compressed", encoding, digest.hexdigest()[:32])
+        return get_or_build(key, lambda: compress(response.content, encoding))
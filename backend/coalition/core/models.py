@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 
 if TYPE_CHECKING:
     from typing import Any
@@ -139,6 +140,20 @@ class HomePage(models.Model):
             # If somehow multiple active exist, return the most recent
             return cls.objects.filter(is_active=True).order_by("-updated_at").first()
 
+    @classmethod
+    async def aget_active(cls) -> "HomePage | None":
+        """Async version of :meth:`get_active`"""
+        try:
+            return await cls.objects.aget(is_active=True)
+        except cls.DoesNotExist:
+            return None
+        except cls.MultipleObjectsReturned:
+            return (
+                await cls.objects.filter(is_active=True)
+                .order_by("-updated_at")
+                .afirst()
+            )
+
 
 class ContentBlock(models.Model):
     """
@@ -223,3 +238,55 @@ class ContentBlock(models.Model):
 
     def __str__(self) -> str:
         return f"Block: {self.title or self.block_type} (Order: {self.order})"
+
+
+class TableVersion(models.Model):
+    """
+    Monotonic change counter per database table.
+
+    Bumped whenever a row in a tracked table is saved or deleted (see
+    ``coalition.core.signals``), so API views can build HTTP validators
+    (ETag / Last-Modified) from a single indexed lookup instead of scanning
+    the table.
+    """
+
+    table = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Table Version"
+        verbose_name_plural = "Table Versions"
+
+    def __str__(self) -> str:
+        return f"{self.table} v{self.version}"
+
+    @classmethod
+    def bump(cls, model: "type[models.Model]") -> None:
+        """Record that rows in ``model``'s table have changed"""
+        table = model._meta.db_table
+        now = timezone.now()
+        updated = cls.objects.filter(table=table).update(
+            version=models.F("version") + 1,
+            updated_at=now,
+        )
+        if not updated:
+            obj, created = cls.objects.get_or_create(
+                table=table,
+                defaults={"version": 1, "updated_at": now},
+            )
+            if not created:
+                cls.objects.filter(pk=obj.pk).update(
+                    version=models.F("version") + 1,
+                    updated_at=now,
+                )
+
+    @classmethod
+    def get_version(cls, model: "type[models.Model]") -> int:
+        """Current change counter of ``model``'s table (0 if never changed)"""
+        version = (
+            cls.objects.filter(table=model._meta.db_table)
+            .values_list("version", flat=True)
+            .first()
+        )
+        return version or 0
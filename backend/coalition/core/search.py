@@ -0,0 +1,220 @@
+"""
+Full-text search over stakeholders, campaigns and bills.
+
+On PostgreSQL each searchable table has a GIN index on the same
+``to_tsvector`` expression that queries filter on (created by the migrations,
+which keep their own copy of it), and matches are ranked with ``ts_rank``. On
+SQLite, used in development, each table is shadowed by an FTS5 table kept in
+sync by triggers and ranked with ``bm25``. SQLite rebuilds a table, dropping
+its triggers, whenever a migration alters it, so the FTS5 tables are
+(re)installed after every ``migrate`` instead of in a migration.
+
+Every term is matched as a prefix, so partial words typed into a search box
+already find results.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection, connections
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.db.models import Model
+
+SEARCH_CONFIG = "english"
+
+# Shorter terms match too much of the table to rank quickly
+MIN_TERM_LENGTH = 2
+MAX_TERMS = 8
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """A searchable model and its two indexed fields, shown as label and detail"""
+
+    kind: str
+    model: str
+    fields: tuple[str, str]
+    # Campaign slug to link a result to, if any
+    slug: str | None = None
+
+
+SEARCH_SOURCES = {
+    source.kind: source
+    for source in [
+        SearchSource(
+            "stakeholder",
+            "stakeholders.Stakeholder",
+            ("name", "organization"),
+        ),
+        SearchSource(
+            "campaign",
+            "campaigns.PolicyCampaign",
+            ("title", "summary"),
+            slug="slug",
+        ),
+        SearchSource(
+            "bill",
+            "campaigns.Bill",
+            ("number", "title"),
+            slug="policy__slug",
+        ),
+    ]
+}
+
+
+@dataclass
+class SearchHit:
+    type: str
+    id: int
+    label: str
+    detail: str
+    slug: str | None
+    rank: float
+
+
+def search_terms(text: str) -> list[str]:
+    """Split a search box's text into words, dropping punctuation"""
+    words = [word.casefold() for word in re.findall(r"\w+", text)]
+    return [word for word in words if len(word) >= MIN_TERM_LENGTH][:MAX_TERMS]
+
+
+def search_vector(fields: "tuple[str, ...]") -> SearchVector:
+    """The expression both the GIN index and the search queries use"""
+    return SearchVector(*fields, config=SEARCH_CONFIG)
+
+
+def _fts_table(model: "type[Model]") -> str:
+    return f"{model._meta.db_table}_fts"
+
+
+def _fts_sql(
+    model: "type[Model]",
+    source: SearchSource,
+    quote: "Callable[[str], str]",
+) -> list[str]:
+    """Statements that create and fill an external-content FTS5 table"""
+    table, fts = quote(model._meta.db_table), quote(_fts_table(model))
+    columns = [model._meta.get_field(name).column for name in source.fields]
+    cols = ", ".join(map(quote, columns))
+    new = ", ".join(f"new.{quote(column)}" for column in columns)
+    old = ", ".join(f"old.{quote(column)}" for column in columns)
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});"
+    )
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});"
+
+    def trigger(suffix: str, event: str, body: str) -> str:
+        name = quote(f"{_fts_table(model)}_{suffix}")
+        return (
+            f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} "
+            f"BEGIN {body} END"
+        )
+
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, "
+        f"content={table}, content_rowid='id', tokenize='porter unicode61')",
+        trigger("ai", "INSERT", insert),
+        trigger("ad", "DELETE", delete),
+        trigger("au", "UPDATE", f"{delete} {insert}"),
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def install_sqlite_search(using: str = "default") -> None:
+    """Create (or refresh) the FTS5 tables and triggers on a SQLite database"""
+    database = connections[using]
+    if database.vendor != "sqlite":
+        return
+    with database.cursor() as cursor:
+        for source in SEARCH_SOURCES.values():
+            model = apps.get_model(source.model)
+            for statement in _fts_sql(model, source, database.ops.quote_name):
+                cursor.execute(statement)
+
+
+def _values(source: SearchSource) -> list[str]:
+    return ["id", *source.fields, *([source.slug] if source.slug else [])]
+
+
+def _hit(source: SearchSource, row: dict, rank: float) -> SearchHit:
+    label, detail = source.fields
+    return SearchHit(
+        type=source.kind,
+        id=row["id"],
+        label=row[label],
+        detail=row[detail],
+        slug=row[source.slug] if source.slug else None,
+        rank=rank,
+    )
+
+
+def _postgres_search(
+    source: SearchSource,
+    terms: list[str],
+    limit: int,
+) -> list[SearchHit]:
+    # Terms are plain words (see search_terms), so the raw query is safe
+    query = SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        config=SEARCH_CONFIG,
+        search_type="raw",
+    )
+    vector = search_vector(source.fields)
+    rows = (
+        apps.get_model(source.model)
+        .objects.annotate(search=vector)
+        .filter(search=query)
+        .annotate(rank=SearchRank(vector, query))
+        .order_by("-rank", "id")
+        .values("rank", *_values(source))[:limit]
+    )
+    return [_hit(source, row, row["rank"]) for row in rows]
+
+
+def _sqlite_search(
+    source: SearchSource,
+    terms: list[str],
+    limit: int,
+) -> list[SearchHit]:
+    model = apps.get_model(source.model)
+    fts = connection.ops.quote_name(_fts_table(model))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s "
+            f"ORDER BY bm25({fts}) LIMIT %s",
+            [" ".join(f'"{term}"*' for term in terms), limit],
+        )
+        ranks = dict(cursor.fetchall())
+    rows = model.objects.filter(pk__in=ranks).values(*_values(source))
+    hits = [_hit(source, row, ranks[row["id"]]) for row in rows]
+    return sorted(hits, key=lambda hit: (-hit.rank, hit.id))
+
+
+def search(
+    text: str,
+    kinds: "list[str] | None" = None,
+    limit: int = 10,
+) -> list[SearchHit]:
+    """
+    Find up to ``limit`` stakeholders, campaigns and bills matching ``text``.
+
+    Each kind contributes its best ``limit`` matches, and the results are
+    merged by rank. Text without any searchable word matches nothing.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return []
+    run = _postgres_search if connection.vendor == "postgresql" else _sqlite_search
+    hits = [
+        hit
+        for kind in kinds or SEARCH_SOURCES
+        for hit in run(SEARCH_SOURCES[kind], terms, limit)
+    ]
+    hits.sort(key=lambda hit: -hit.rank)
+    return hits[:limit]
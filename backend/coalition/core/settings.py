@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -38,6 +39,34 @@ ORGANIZATION_NAME = os.getenv("ORGANIZATION_NAME", "Coalition Builder")
 TAGLINE = os.getenv("ORG_TAGLINE", "Building strong advocacy partnerships")
 CONTACT_EMAIL = os.getenv("CONTACT_EMAIL", "info@example.org")
 
+# API list endpoints use cursor pagination; page_size is clamped to the max
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "100"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "500"))
+# Rows fetched per database round-trip by the streaming /export/ endpoints
+API_EXPORT_CHUNK_SIZE = int(os.getenv("API_EXPORT_CHUNK_SIZE", "2000"))
+# Rows written per transaction by POST /api/stakeholders/bulk/
+BULK_IMPORT_BATCH_SIZE = int(os.getenv("BULK_IMPORT_BATCH_SIZE", "500"))
+# Upper bound on how long a serialized homepage stays cached; saves invalidate
+# it immediately, the timeout only bounds staleness across processes
+HOMEPAGE_CACHE_TIMEOUT = int(os.getenv("HOMEPAGE_CACHE_TIMEOUT", "300"))
+# Lifetime of the cached region indexes (the bounding boxes used by
+# /api/regions/locate/ and the place-name gazetteer used for geocoding);
+# they are keyed by the regions table version, so edits are seen immediately
+REGION_BOXES_CACHE_TIMEOUT = int(os.getenv("REGION_BOXES_CACHE_TIMEOUT", "86400"))
+# Rendered vector tiles are cached here, one subdirectory per version of the
+# regions table; set to an empty string to render every request
+REGION_TILE_CACHE_DIR = os.getenv(
+    "REGION_TILE_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "coalition-tiles"),
+)
+# gzip/brotli compression of /api/ JSON (brotli needs the optional `brotli`
+# package); smaller bodies are sent uncompressed
+API_COMPRESSION_MIN_SIZE = int(os.getenv("API_COMPRESSION_MIN_SIZE", "1024"))
+API_COMPRESSION_GZIP_LEVEL = int(os.getenv("API_COMPRESSION_GZIP_LEVEL", "6"))
+API_COMPRESSION_BROTLI_QUALITY = int(
+    os.getenv("API_COMPRESSION_BROTLI_QUALITY", "5"),
+)
+
 
 # Application definition
 
@@ -63,6 +92,8 @@ DEFAULT_APP_CONFIG = None
 
 MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Early in the list so it compresses the final response body
+    "coalition.core.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -95,15 +126,44 @@ WSGI_APPLICATION = "coalition.core.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Reuse connections across requests instead of paying a new handshake each
+# time. CONN_MAX_AGE is in seconds (0 closes after every request, "None" keeps
+# connections open indefinitely); health checks discard dead connections
+# before a request uses them.
+_conn_max_age = os.getenv("DB_CONN_MAX_AGE", "60")
+DB_CONN_MAX_AGE = None if _conn_max_age.lower() == "none" else int(_conn_max_age)
+DB_CONN_HEALTH_CHECKS = os.getenv("DB_CONN_HEALTH_CHECKS", "True").lower() in (
+    "true",
+    "1",
+    "t",
+)
+DB_POOL = os.getenv("DB_POOL", "False").lower() in ("true", "1", "t")
+
 # Use SQLite as a fallback if DATABASE_URL is not set
 if os.getenv("DATABASE_URL"):
     # Parse DATABASE_URL and ensure PostGIS is used for PostgreSQL
-    db_config = dj_database_url.config(default=os.getenv("DATABASE_URL"))
+    db_config = dj_database_url.config(
+        default=os.getenv("DATABASE_URL"),
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=DB_CONN_HEALTH_CHECKS,
+    )
 
     # If using PostgreSQL, make sure to use the PostGIS backend
     if db_config.get("ENGINE") == "django.db.backends.postgresql":
         db_config["ENGINE"] = "django.contrib.gis.db.backends.postgis"
 
+    # Optional psycopg_pool connection pool (requires `psycopg[pool]`).
+    # Django refuses to combine pooling with persistent connections, so the
+    # pool takes over from CONN_MAX_AGE.
+    if DB_POOL and db_config["ENGINE"] == "django.contrib.gis.db.backends.postgis":
+        db_config["CONN_MAX_AGE"] = 0
+        db_config.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "600")),
+        }
+
     # For tests, use admin user to create test databases with PostGIS extension
     if "test" in sys.argv:
         # Use admin credentials for test database creation
@@ -126,6 +186,54 @@ else:
         },
     }
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Two tiers: a per-process local-memory L1 ("default") and an optional shared
+# L2 ("shared") that every worker can see. The L2 is file-based or uses the
+# database cache table, so neither tier needs an external service. Access
+# both through the helpers in coalition.core.cache.
+CACHE_TIMEOUT = int(os.getenv("CACHE_TIMEOUT", "300"))
+# With an L2 configured, L1 entries expire sooner so that invalidations made
+# by another process are picked up quickly
+CACHE_L1_TIMEOUT = int(os.getenv("CACHE_L1_TIMEOUT", "30"))
+CACHE_L2_BACKEND = os.getenv("CACHE_L2_BACKEND", "").lower()
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "coalition")
+# Bump to invalidate every cached value at once (e.g. after a schema change)
+CACHE_VERSION = int(os.getenv("CACHE_VERSION", "1"))
+
+_cache_options = {
+    "TIMEOUT": CACHE_TIMEOUT,
+    "KEY_PREFIX": CACHE_KEY_PREFIX,
+    "VERSION": CACHE_VERSION,
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "coalition-l1",
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CACHE_L1_MAX_ENTRIES", "1000"))},
+        **_cache_options,
+    },
+}
+
+if CACHE_L2_BACKEND == "file":
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "CACHE_L2_LOCATION",
+            os.path.join(tempfile.gettempdir(), "coalition-cache"),
+        ),
+        **_cache_options,
+    }
+elif CACHE_L2_BACKEND == "db":
+    # Create the table with `python manage.py createcachetable`
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": os.getenv("CACHE_L2_LOCATION", "coalition_cache"),
+        **_cache_options,
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
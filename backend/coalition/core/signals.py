@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_homepage_cache
+from .models import ContentBlock, HomePage, TableVersion
+from .search import install_sqlite_search
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.apps import AppConfig
+
+# Tables served by the API, whose TableVersion feeds the ETag / Last-Modified
+# validators in coalition.api.conditional and keys the region tile cache
+VERSIONED_MODELS = [
+    "campaigns.PolicyCampaign",
+    "campaigns.Bill",
+    "stakeholders.Stakeholder",
+    "endorsements.Endorsement",
+    "legislators.Legislator",
+    "regions.Region",
+    "regions.RegionGeometry",
+]
+
+
+@receiver(post_save, sender=HomePage)
+@receiver(post_delete, sender=HomePage)
+@receiver(post_save, sender=ContentBlock)
+@receiver(post_delete, sender=ContentBlock)
+def homepage_content_changed(sender: type, **kwargs: "Any") -> None:
+    """
+    Invalidate the cached homepage payload whenever homepage content changes.
+
+    This covers admin edits, inline content block edits and ContentBlock
+    ``list_editable`` changes, all of which go through ``Model.save()``. The
+    payload is dropped once the change commits; dropping it earlier would
+    let a concurrent request cache the old rows again.
+    """
+    transaction.on_commit(invalidate_homepage_cache)
+
+
+@receiver(post_migrate)
+def migrated(sender: "AppConfig", using: str = "default", **kwargs: "Any") -> None:
+    """Reinstall the SQLite full-text tables, once per ``migrate``"""
+    if sender.name == "coalition.core":
+        install_sqlite_search(using)
+
+
+def table_changed(sender: type, **kwargs: "Any") -> None:
+    """Bump the change counter of the table a saved/deleted row belongs to"""
+    TableVersion.bump(sender)
+
+
+for model in VERSIONED_MODELS:
+    post_save.connect(table_changed, sender=model)
+    post_delete.connect(table_changed, sender=model)
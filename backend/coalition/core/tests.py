@@ -1,7 +1,18 @@
+import gzip
+import json
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
+
+from coalition.stakeholders.models import Stakeholder
 
-from .models import ContentBlock, HomePage
+from . import middleware
+from .cache import cache_clear, cache_delete, cache_get, cache_set, get_or_build
+from .middleware import negotiate_encoding, supported_encodings
+from .models import ContentBlock, HomePage, TableVersion
 
 
 class HomePageModelTest(TestCase):
@@ -286,3 +297,223 @@ class ContentBlockModelTest(TestCase):
         # Filter for all blocks
         all_blocks = ContentBlock.objects.all()
         assert all_blocks.count() == 2
+
+
+class TableVersionModelTest(TestCase):
+    def create_stakeholder(self) -> Stakeholder:
+        return Stakeholder.objects.create(
+            name="Test Farmer",
+            organization="Test Farm",
+            email="test@farm.com",
+            state="MD",
+            type="farmer",
+        )
+
+    def test_bump_creates_and_increments(self) -> None:
+        """Test that bump starts a table at version 1 and increments it"""
+        TableVersion.bump(HomePage)
+        TableVersion.bump(HomePage)
+
+        version = TableVersion.objects.get(table=HomePage._meta.db_table)
+        assert version.version == 2
+
+    def test_save_and_delete_bump_tracked_tables(self) -> None:
+        """Test that saving and deleting tracked rows bumps their table"""
+        stakeholder = self.create_stakeholder()
+        table = Stakeholder._meta.db_table
+        assert TableVersion.objects.get(table=table).version == 1
+
+        stakeholder.delete()
+        assert TableVersion.objects.get(table=table).version == 2
+
+    def test_untracked_tables_are_not_versioned(self) -> None:
+        """Test that only the API list tables are versioned automatically"""
+        ContentBlock.objects.create(
+            homepage=HomePage.objects.create(
+                organization_name="Org",
+                tagline="Tagline",
+                hero_title="Hero",
+                about_section_content="Content",
+                contact_email="org@test.org",
+            ),
+            content="Block",
+        )
+
+        assert not TableVersion.objects.exists()
+
+
+TIERED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-l1",
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-l2",
+    },
+}
+
+
+class CacheHelpersTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+
+    def test_get_or_build_only_builds_on_miss(self) -> None:
+        """Test that the builder runs once and later reads are served cached"""
+        calls = []
+
+        def build() -> list[int]:
+            calls.append(1)
+            return [1, 2, 3]
+
+        assert get_or_build("numbers", build) == [1, 2, 3]
+        assert get_or_build("numbers", build) == [1, 2, 3]
+        assert len(calls) == 1
+
+    def test_get_or_build_caches_none(self) -> None:
+        """Test that a None result is cached rather than rebuilt every time"""
+        calls = []
+
+        def build() -> None:
+            calls.append(1)
+
+        get_or_build("nothing", build)
+        get_or_build("nothing", build)
+        assert len(calls) == 1
+
+    def test_versions_are_kept_apart(self) -> None:
+        """Test that the same key under different versions holds separate values"""
+        cache_set("shape", "old", version=1)
+        cache_set("shape", "new", version=2)
+
+        assert cache_get("shape", version=1) == "old"
+        assert cache_get("shape", version=2) == "new"
+
+    @override_settings(CACHES=TIERED_CACHES, CACHE_L1_TIMEOUT=5)
+    def test_l2_hit_refills_l1(self) -> None:
+        """Test that a value found only in the shared tier is copied into L1"""
+        caches["shared"].set("key", "value")
+
+        assert cache_get("key") == "value"
+        assert caches["default"].get("key") == "value"
+
+    @override_settings(CACHES=TIERED_CACHES)
+    def test_set_and_delete_touch_both_tiers(self) -> None:
+        """Test that writes and deletes go to both tiers"""
+        cache_set("key", "value")
+        assert caches["default"].get("key") == "value"
+        assert caches["shared"].get("key") == "value"
+
+        cache_delete("key")
+        assert caches["default"].get("key") is None
+        assert caches["shared"].get("key") is None
+
+
+class HealthCheckTest(TestCase):
+    def test_health_reports_connection_settings(self) -> None:
+        """Test that the health check describes connection reuse"""
+        response = self.client.get("/health/")
+
+        assert response.status_code == 200
+        connections = response.json()["database"]["connections"]
+        assert "maxAge" in connections
+        assert "healthChecks" in connections
+        assert connections["pool"] is None
+
+
+@override_settings(API_COMPRESSION_MIN_SIZE=0)
+class CompressionMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        for i in range(20):
+            Stakeholder.objects.create(
+                name=f"Stakeholder {i}",
+                organization="Chesapeake Farmers Cooperative",
+                email=f"person{i}@example.org",
+                state="MD",
+                type="farmer",
+            )
+
+    def test_negotiate_encoding(self) -> None:
+        """Test Accept-Encoding parsing, including q-values and wildcards"""
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("deflate") is None
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("*") == supported_encodings()[0]
+        assert negotiate_encoding("") is None
+
+    def test_gzip_json(self) -> None:
+        """Test that API JSON is gzipped with a weak ETag and Vary header"""
+        plain = self.client.get("/api/stakeholders/")
+        response = self.client.get("/api/stakeholders/", HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert response["ETag"] == f"W/{plain['ETag']}"
+        assert int(response["Content-Length"]) < len(plain.content)
+        assert gzip.decompress(response.content) == plain.content
+
+    def test_weak_etag_revalidates(self) -> None:
+        """Test that the weakened ETag still yields a 304"""
+        response = self.client.get("/api/stakeholders/", HTTP_ACCEPT_ENCODING="gzip")
+        response = self.client.get(
+            "/api/stakeholders/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        assert response.status_code == 304
+
+    def test_skips_small_and_unaccepted_responses(self) -> None:
+        """Test the size threshold and clients that don't accept gzip"""
+        response = self.client.get("/api/stakeholders/")
+        assert not response.has_header("Content-Encoding")
+        assert "Accept-Encoding" in response["Vary"]
+
+        with self.settings(API_COMPRESSION_MIN_SIZE=1_000_000):
+            response = self.client.get(
+                "/api/stakeholders/",
+                HTTP_ACCEPT_ENCODING="gzip",
+            )
+        assert not response.has_header("Content-Encoding")
+
+    def test_streaming_export(self) -> None:
+        """Test that streaming exports are compressed as they are sent"""
+        response = self.client.get(
+            "/api/stakeholders/export/",
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+
+        assert response.streaming
+        assert response["Content-Encoding"] == "gzip"
+        body = gzip.decompress(b"".join(response.streaming_content))
+        assert len(body.decode().splitlines()) == 20
+
+    def test_compressed_bytes_are_cached(self) -> None:
+        """Test that an unchanged payload is compressed only once"""
+        with patch(
+            "coalition.core.middleware.compress",
+            wraps=middleware.compress,
+        ) as compress:
+            first = self.client.get(
+                "/api/stakeholders/",
+                HTTP_ACCEPT_ENCODING="gzip",
+            )
+            second = self.client.get(
+                "/api/stakeholders/",
+                HTTP_ACCEPT_ENCODING="gzip",
+            )
+
+        assert compress.call_count == 1
+        assert first.content == second.content
+
+    @skipUnless(middleware.brotli, "brotli is not installed")
+    def test_brotli_preferred(self) -> None:
+        """Test that brotli wins over gzip when both are acceptable"""
+        response = self.client.get(
+            "/api/stakeholders/",
+            HTTP_ACCEPT_ENCODING="gzip, br",
+        )
+
+        assert response["Content-Encoding"] == "br"
+        assert json.loads(middleware.brotli.decompress(response.content))
@@ -0,0 +1,36 @@
+"""Helpers shared by the apps' test modules"""
+
+from collections.abc import Callable
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class ChangelistQueryBudgetTestCase(TestCase):
+    """Admin tests checking that a changelist doesn't add queries per row"""
+
+    # Session, user, counts, filters and the page itself; none of it per row
+    QUERY_BUDGET = 8
+
+    def changelist_queries(self, url: str) -> int:
+        """Count the queries made rendering ``url``"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        assert response.status_code == 200
+        return len(queries)
+
+    def assert_query_budget(
+        self,
+        urls: list[str],
+        add_rows: Callable[[], object],
+    ) -> None:
+        """
+        Assert that ``urls`` stay within the budget and that ``add_rows``
+        doesn't change how many queries they make.
+        """
+        few = [self.changelist_queries(url) for url in urls]
+        add_rows()
+
+        assert [self.changelist_queries(url) for url in urls] == few
+        assert max(few) <= self.QUERY_BUDGET
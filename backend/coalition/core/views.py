@@ -223,6 +223,34 @@ def robots_txt(request: HttpRequest) -> HttpResponse:
     return HttpResponse("User-agent: *\nDisallow: /\n", content_type="text/plain")
 
 
+def _get_connection_info() -> dict:
+    """Describe connection reuse settings and, if enabled, pool statistics"""
+    db_settings = settings.DATABASES["default"]
+    info = {
+        "maxAge": db_settings.get("CONN_MAX_AGE", 0),
+        "healthChecks": db_settings.get("CONN_HEALTH_CHECKS", False),
+        "pool": None,
+    }
+
+    try:
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            stats = pool.get_stats()
+            info["pool"] = {
+                "name": pool.name,
+                "minSize": pool.min_size,
+                "maxSize": pool.max_size,
+                "size": stats.get("pool_size", 0),
+                "available": stats.get("pool_available", 0),
+                "waiting": stats.get("requests_waiting", 0),
+            }
+    except Exception as e:
+        logger.error("Error retrieving connection pool statistics: %s", e)
+        info["pool"] = {"error": "An error occurred while retrieving pool stats"}
+
+    return info
+
+
 @require_GET
 def health_check(request: HttpRequest) -> JsonResponse:
     """
@@ -230,7 +258,7 @@ def health_check(request: HttpRequest) -> JsonResponse:
 
     This endpoint checks:
     1. Application status
-    2. Database connectivity
+    2. Database connectivity and connection pool status
     3. Available memory and system resources
 
     Returns a JSON response with health status information.
@@ -250,6 +278,8 @@ def health_check(request: HttpRequest) -> JsonResponse:
         db_status = "unhealthy"
         logger.error("Health check database connection failed: %s", e)
 
+    connection_info = _get_connection_info()
+
     # Get memory info
     import psutil
 
@@ -280,6 +310,7 @@ def health_check(request: HttpRequest) -> JsonResponse:
             "responseTime": f"{db_response_time}ms",
             "engine": settings.DATABASES["default"]["ENGINE"],
             "name": str(settings.DATABASES["default"]["NAME"]),
+            "connections": connection_info,
         },
         "memory": memory,
         "responseTime": f"{round((time.time() - start_time) * 1000)}ms",
@@ -13,4 +13,5 @@ class EndorsementAdmin(admin.ModelAdmin):
         "campaign__title",
     )
     raw_id_fields = ("stakeholder", "campaign")
+    list_select_related = ("stakeholder", "campaign")
     ordering = ("-created_at",)
@@ -0,0 +1,140 @@
+"""
+Endorsement counts per campaign and region.
+
+Stakeholders only record a state, so endorsements are counted against state
+regions, matched on the region's postal abbreviation (``Region.label``).
+Signals apply each change as an ``F()`` increment of a single
+``RegionEndorsementCount`` row, so a dashboard reads a few dozen
+precomputed rows instead of aggregating every endorsement. Writes that skip
+signals (bulk imports, fixtures, loading regions after endorsements exist)
+are followed by ``rebuild_region_counts``.
+"""
+
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest, Upper
+
+from coalition.core.models import TableVersion
+from coalition.regions.models import Region
+
+from .models import Endorsement, RegionEndorsementCount
+
+# How one endorsement is counted: (campaign id, stakeholder state, public)
+CountKey = tuple[int, str, bool]
+
+
+def state_region_id(state: str) -> int | None:
+    return (
+        Region.objects.filter(type="state", label=state.upper())
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def add_to_counts(
+    campaign_id: int,
+    state: str,
+    count: int,
+    public_count: int,
+) -> None:
+    """Add (possibly negative) amounts to a campaign's counts in a state"""
+    region_id = state_region_id(state) if count or public_count else None
+    if region_id is None:
+        return
+    counts = RegionEndorsementCount.objects.filter(
+        campaign_id=campaign_id,
+        region_id=region_id,
+    )
+    # Clamped at zero, so counts that drifted before a rebuild can't go negative
+    updated = counts.update(
+        count=Greatest(F("count") + count, 0),
+        public_count=Greatest(F("public_count") + public_count, 0),
+    )
+    if updated or count <= 0:
+        return
+    _, created = RegionEndorsementCount.objects.get_or_create(
+        campaign_id=campaign_id,
+        region_id=region_id,
+        defaults={"count": count, "public_count": max(public_count, 0)},
+    )
+    if not created:
+        # Created concurrently between the update and get_or_create
+        counts.update(
+            count=F("count") + count,
+            public_count=Greatest(F("public_count") + public_count, 0),
+        )
+
+
+def count_endorsement(key: CountKey, sign: int) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) one endorsement from the counts"""
+    campaign_id, state, public_display = key
+    add_to_counts(campaign_id, state, sign, sign if public_display else 0)
+
+
+def endorsement_key(endorsement_id: int) -> CountKey | None:
+    """How a saved endorsement is currently counted, read from the database"""
+    return (
+        Endorsement.objects.filter(pk=endorsement_id)
+        .values_list("campaign_id", "stakeholder__state", "public_display")
+        .first()
+    )
+
+
+def move_stakeholder(stakeholder_id: int, old_state: str, new_state: str) -> None:
+    """Move a stakeholder's endorsements between states after an edit"""
+    campaigns = (
+        Endorsement.objects.filter(stakeholder_id=stakeholder_id)
+        .values("campaign_id")
+        .annotate(
+            total=Count("id"),
+            public=Count("id", filter=Q(public_display=True)),
+        )
+        .order_by()
+    )
+    for row in campaigns:
+        add_to_counts(row["campaign_id"], old_state, -row["total"], -row["public"])
+        add_to_counts(row["campaign_id"], new_state, row["total"], row["public"])
+
+
+def rebuild_region_counts(campaign_ids: Iterable[int] | None = None) -> int:
+    """
+    Recompute the counts of some (by default all) campaigns from scratch.
+
+    Uses one grouped query over endorsements; returns the number of
+    ``RegionEndorsementCount`` rows written.
+    """
+    endorsements = Endorsement.objects.all()
+    existing = RegionEndorsementCount.objects.all()
+    if campaign_ids is not None:
+        campaign_ids = list(campaign_ids)
+        endorsements = endorsements.filter(campaign_id__in=campaign_ids)
+        existing = existing.filter(campaign_id__in=campaign_ids)
+
+    states = dict(
+        Region.objects.filter(type="state").values_list(Upper("label"), "id"),
+    )
+    grouped = (
+        endorsements.values("campaign_id", state=Upper("stakeholder__state"))
+        .annotate(
+            total=Count("id"),
+            public=Count("id", filter=Q(public_display=True)),
+        )
+        .order_by()
+    )
+    with transaction.atomic():
+        counts = [
+            RegionEndorsementCount(
+                campaign_id=row["campaign_id"],
+                region_id=states[row["state"]],
+                count=row["total"],
+                public_count=row["public"],
+            )
+            for row in grouped
+            if row["state"] in states
+        ]
+        existing.delete()
+        RegionEndorsementCount.objects.bulk_create(counts)
+    TableVersion.bump(RegionEndorsementCount)
+    return len(counts)
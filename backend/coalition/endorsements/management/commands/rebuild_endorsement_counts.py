@@ -0,0 +1,42 @@
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from coalition.campaigns.models import PolicyCampaign
+from coalition.endorsements.aggregates import rebuild_region_counts
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute per-region endorsement counts from the endorsements table. "
+        "Run after loading regions or fixtures."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument(
+            "--campaign",
+            action="append",
+            dest="slugs",
+            help="Only rebuild this campaign (by slug); repeatable",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        campaign_ids = None
+        if options["slugs"]:
+            campaigns = dict(
+                PolicyCampaign.objects.filter(slug__in=options["slugs"]).values_list(
+                    "slug",
+                    "id",
+                ),
+            )
+            missing = set(options["slugs"]) - campaigns.keys()
+            if missing:
+                raise CommandError(f"Unknown campaign: {', '.join(sorted(missing))}")
+            campaign_ids = campaigns.values()
+
+        written = rebuild_region_counts(campaign_ids)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} region counts"))
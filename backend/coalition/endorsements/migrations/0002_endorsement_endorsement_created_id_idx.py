@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("campaigns", "0002_policycampaign_campaign_created_id_idx"),
+        ("endorsements", "0001_initial"),
+        ("stakeholders", "0002_stakeholder_stakeholder_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="endorsement",
+            index=models.Index(
+                fields=["created_at", "id"],
+                name="endorsement_created_id_idx",
+            ),
+        ),
+    ]
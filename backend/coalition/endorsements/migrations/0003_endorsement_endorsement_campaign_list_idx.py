@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("campaigns", "0002_policycampaign_campaign_created_id_idx"),
+        ("endorsements", "0002_endorsement_endorsement_created_id_idx"),
+        ("stakeholders", "0003_stakeholder_stakeholder_location_type_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="endorsement",
+            index=models.Index(
+                fields=["campaign", "public_display", "created_at", "id"],
+                name="endorsement_campaign_list_idx",
+            ),
+        ),
+    ]
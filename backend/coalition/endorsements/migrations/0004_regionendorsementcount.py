@@ -0,0 +1,61 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("campaigns", "0002_policycampaign_campaign_created_id_idx"),
+        ("endorsements", "0003_endorsement_endorsement_campaign_list_idx"),
+        ("regions", "0002_regiongeometry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegionEndorsementCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "public_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Endorsements with public_display set",
+                    ),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="region_endorsement_counts",
+                        to="campaigns.policycampaign",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="endorsement_counts",
+                        to="regions.region",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "region"),
+                        name="unique__campaign__region",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -20,6 +20,54 @@ class Endorsement(models.Model):
 
     class Meta:
         unique_together = ["stakeholder", "campaign"]
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="endorsement_created_id_idx",
+            ),
+            # Campaign pages: one campaign's public endorsements, newest page
+            # first via the (created_at, id) keyset
+            models.Index(
+                fields=["campaign", "public_display", "created_at", "id"],
+                name="endorsement_campaign_list_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.stakeholder} endorses {self.campaign}"
+
+
+class RegionEndorsementCount(models.Model):
+    """
+    Number of endorsements of a campaign from stakeholders in one region.
+
+    Maintained incrementally by ``coalition.endorsements.signals`` and rebuilt
+    in bulk by ``coalition.endorsements.aggregates.rebuild_region_counts``.
+    """
+
+    campaign = models.ForeignKey(
+        "campaigns.PolicyCampaign",
+        on_delete=models.CASCADE,
+        related_name="region_endorsement_counts",
+    )
+    region = models.ForeignKey(
+        "regions.Region",
+        on_delete=models.CASCADE,
+        related_name="endorsement_counts",
+    )
+    count = models.PositiveIntegerField(default=0)
+    public_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Endorsements with public_display set",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "region"],
+                name="unique__campaign__region",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.campaign} in {self.region}: {self.count}"
@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from coalition.stakeholders.models import Stakeholder
+
+from .aggregates import (
+    CountKey,
+    count_endorsement,
+    endorsement_key,
+    move_stakeholder,
+)
+from .models import Endorsement
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(pre_save, sender=Endorsement)
+def remember_endorsement_key(
+    sender: type,
+    instance: Endorsement,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Note how an existing endorsement is counted before it is changed"""
+    if not raw:
+        instance._counted_key = endorsement_key(instance.pk) if instance.pk else None
+
+
+def _current_key(endorsement: Endorsement) -> CountKey:
+    return (
+        endorsement.campaign_id,
+        endorsement.stakeholder.state,
+        endorsement.public_display,
+    )
+
+
+@receiver(post_save, sender=Endorsement)
+def endorsement_saved(
+    sender: type,
+    instance: Endorsement,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Count a new endorsement, or move the count of a changed one"""
+    if raw:
+        return
+    old_key = getattr(instance, "_counted_key", None)
+    new_key = _current_key(instance)
+    if old_key == new_key:
+        return
+    if old_key is not None:
+        count_endorsement(old_key, -1)
+    count_endorsement(new_key, 1)
+
+
+@receiver(post_delete, sender=Endorsement)
+def endorsement_deleted(sender: type, instance: Endorsement, **kwargs: "Any") -> None:
+    """Remove a deleted endorsement from the counts"""
+    try:
+        key = _current_key(instance)
+    except Stakeholder.DoesNotExist:
+        return
+    count_endorsement(key, -1)
+
+
+@receiver(pre_save, sender=Stakeholder)
+def remember_stakeholder_state(
+    sender: type,
+    instance: Stakeholder,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Note a stakeholder's state before it is changed"""
+    if not raw and instance.pk:
+        instance._counted_state = (
+            Stakeholder.objects.filter(pk=instance.pk)
+            .values_list("state", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Stakeholder)
+def stakeholder_saved(
+    sender: type,
+    instance: Stakeholder,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Move a stakeholder's endorsements to their new state"""
+    old_state = getattr(instance, "_counted_state", None)
+    if raw or created or old_state is None:
+        return
+    if old_state.upper() != instance.state.upper():
+        move_stakeholder(instance.pk, old_state, instance.state)
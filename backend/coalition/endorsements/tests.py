@@ -1,10 +1,15 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.db import IntegrityError
 from django.test import TestCase
 
 from coalition.campaigns.models import PolicyCampaign
+from coalition.regions.models import Region
 from coalition.stakeholders.models import Stakeholder
 
-from .models import Endorsement
+from .aggregates import rebuild_region_counts
+from .models import Endorsement, RegionEndorsementCount
 
 
 class EndorsementModelTest(TestCase):
@@ -134,3 +139,164 @@ class EndorsementModelTest(TestCase):
         endorsements = self.campaign.endorsements.all()
         assert endorsements.count() == 1
         assert endorsements.first() == endorsement
+
+
+class RegionEndorsementCountTest(TestCase):
+    def setUp(self) -> None:
+        self.maryland = Region.objects.create(
+            geoid="24",
+            name="Maryland",
+            label="MD",
+            type="state",
+        )
+        self.delaware = Region.objects.create(
+            geoid="10",
+            name="Delaware",
+            label="DE",
+            type="state",
+        )
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water Act",
+            slug="clean-water-act",
+            summary="Protecting our waterways",
+        )
+        self.other_campaign = PolicyCampaign.objects.create(
+            title="Soil Health",
+            slug="soil-health",
+            summary="Healthy soils",
+        )
+
+    def _stakeholder(self, email: str, state: str = "MD") -> Stakeholder:
+        return Stakeholder.objects.create(
+            name="Test Farmer",
+            organization="Test Farm",
+            email=email,
+            state=state,
+            type="farmer",
+        )
+
+    def _counts(self) -> dict[tuple[str, str], tuple[int, int]]:
+        rows = RegionEndorsementCount.objects.values_list(
+            "campaign__slug",
+            "region__label",
+            "count",
+            "public_count",
+        )
+        return {
+            (slug, label): (count, public_count)
+            for slug, label, count, public_count in rows
+            if count
+        }
+
+    def test_create_and_delete(self) -> None:
+        """Test that endorsements are counted as they are created and deleted"""
+        first = Endorsement.objects.create(
+            stakeholder=self._stakeholder("a@farm.com"),
+            campaign=self.campaign,
+        )
+        Endorsement.objects.create(
+            stakeholder=self._stakeholder("b@farm.com"),
+            campaign=self.campaign,
+            public_display=False,
+        )
+        Endorsement.objects.create(
+            stakeholder=self._stakeholder("c@farm.com", state="de"),
+            campaign=self.campaign,
+        )
+
+        assert self._counts() == {
+            ("clean-water-act", "MD"): (2, 1),
+            ("clean-water-act", "DE"): (1, 1),
+        }
+
+        first.delete()
+
+        assert self._counts()[("clean-water-act", "MD")] == (1, 0)
+
+    def test_update_moves_count(self) -> None:
+        """Test that changing visibility or campaign moves the count"""
+        endorsement = Endorsement.objects.create(
+            stakeholder=self._stakeholder("a@farm.com"),
+            campaign=self.campaign,
+        )
+
+        endorsement.public_display = False
+        endorsement.save()
+        assert self._counts() == {("clean-water-act", "MD"): (1, 0)}
+
+        endorsement.campaign = self.other_campaign
+        endorsement.save()
+        assert self._counts() == {("soil-health", "MD"): (1, 0)}
+
+    def test_stakeholder_moves_state(self) -> None:
+        """Test that a stakeholder's endorsements follow them to a new state"""
+        stakeholder = self._stakeholder("a@farm.com")
+        Endorsement.objects.create(stakeholder=stakeholder, campaign=self.campaign)
+        Endorsement.objects.create(
+            stakeholder=stakeholder,
+            campaign=self.other_campaign,
+            public_display=False,
+        )
+
+        stakeholder.state = "DE"
+        stakeholder.save()
+
+        assert self._counts() == {
+            ("clean-water-act", "DE"): (1, 1),
+            ("soil-health", "DE"): (1, 0),
+        }
+
+    def test_stakeholder_deleted(self) -> None:
+        """Test that deleting a stakeholder removes their endorsements' counts"""
+        stakeholder = self._stakeholder("a@farm.com")
+        Endorsement.objects.create(stakeholder=stakeholder, campaign=self.campaign)
+
+        stakeholder.delete()
+
+        assert self._counts() == {}
+
+    def test_state_without_region(self) -> None:
+        """Test that states with no loaded region are not counted"""
+        Endorsement.objects.create(
+            stakeholder=self._stakeholder("a@farm.com", state="VA"),
+            campaign=self.campaign,
+        )
+
+        assert not RegionEndorsementCount.objects.exists()
+
+    def test_rebuild_matches_incremental_counts(self) -> None:
+        """Test that a rebuild reproduces the incrementally kept counts"""
+        for i, state in enumerate(["MD", "MD", "DE", "VA"]):
+            Endorsement.objects.create(
+                stakeholder=self._stakeholder(f"{i}@farm.com", state=state),
+                campaign=self.campaign,
+                public_display=i != 1,
+            )
+        incremental = self._counts()
+        RegionEndorsementCount.objects.update(count=0, public_count=0)
+
+        assert rebuild_region_counts() == 2
+        assert self._counts() == incremental
+
+    def test_rebuild_command(self) -> None:
+        """Test the rebuild_endorsement_counts command for one campaign"""
+        Endorsement.objects.bulk_create(
+            [
+                Endorsement(
+                    stakeholder=self._stakeholder("a@farm.com"),
+                    campaign=self.campaign,
+                ),
+                Endorsement(
+                    stakeholder=self._stakeholder("b@farm.com"),
+                    campaign=self.other_campaign,
+                ),
+            ],
+        )
+
+        call_command(
+            "rebuild_endorsement_counts",
+            "--campaign=clean-water-act",
+            stdout=StringIO(),
+        )
+
+        assert self._counts() == {("clean-water-act", "MD"): (1, 1)}
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from django.contrib import admin
+from django.db.models import Count
 
 from .models import Legislator
 
@@ -30,7 +31,7 @@ class LegislatorAdmin(admin.ModelAdmin):
 
     list_editable = ("in_office",)
 
-    readonly_fields = ("bioguide_id",)
+    readonly_fields = ("bioguide_id", "region")
 
     fieldsets = (
         (
@@ -47,6 +48,7 @@ class LegislatorAdmin(admin.ModelAdmin):
                     "is_senior",
                     "party",
                     "in_office",
+                    "region",
                 ),
             },
         ),
@@ -67,20 +69,27 @@ class LegislatorAdmin(admin.ModelAdmin):
 
     def sponsored_bills_count(self, obj: Legislator) -> int:
         """Display count of sponsored bills"""
-        return obj.sponsored_bills.count()
+        return obj.sponsored_count
 
     sponsored_bills_count.short_description = "Sponsored Bills"
+    sponsored_bills_count.admin_order_field = "sponsored_count"
 
     def cosponsored_bills_count(self, obj: Legislator) -> int:
         """Display count of cosponsored bills"""
-        return obj.cosponsored_bills.count()
+        return obj.cosponsored_count
 
     cosponsored_bills_count.short_description = "Cosponsored Bills"
+    cosponsored_bills_count.admin_order_field = "cosponsored_count"
 
     def get_queryset(self, request: "HttpRequest") -> "QuerySet[Legislator]":
-        """Order by state, chamber, and then name"""
+        """Order by state, chamber, and then name, with bill counts annotated"""
+        # Both joins multiply rows, so each count has to be distinct
         return (
             super()
             .get_queryset(request)
+            .annotate(
+                sponsored_count=Count("sponsored_bills", distinct=True),
+                cosponsored_count=Count("cosponsored_bills", distinct=True),
+            )
             .order_by("state", "chamber", "last_name", "first_name")
         )
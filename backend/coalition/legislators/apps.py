@@ -5,3 +5,6 @@ class LegislatorsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "coalition.legislators"
     label = "legislators"  # Use original table names
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,37 @@
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from coalition.legislators.regions import link_legislator_regions
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Link each legislator to the district (House) or state (Senate) they "
+        "represent. Run after loading regions or legislators."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Legislators updated per query (default: BULK_IMPORT_BATCH_SIZE)",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        result = link_legislator_regions(batch_size=options["batch_size"])
+        for legislator in result.unmatched:
+            self.stderr.write(
+                f"No region for {legislator} "
+                f"({legislator.chamber}, district {legislator.district or '-'})",
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated {result.updated} legislators; "
+                f"{len(result.unmatched)} in office without a region",
+            ),
+        )
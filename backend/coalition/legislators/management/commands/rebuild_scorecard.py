@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from coalition.legislators.models import Legislator
+from coalition.legislators.scorecard import rebuild_scorecard
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute legislator scorecards from bill sponsorships. "
+        "Run after loading bills, legislators or fixtures."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument(
+            "--legislator",
+            action="append",
+            dest="bioguide_ids",
+            help="Only rebuild this legislator (by bioguide ID); repeatable",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        legislator_ids = None
+        if options["bioguide_ids"]:
+            legislators = dict(
+                Legislator.objects.filter(
+                    bioguide_id__in=options["bioguide_ids"],
+                ).values_list("bioguide_id", "id"),
+            )
+            missing = set(options["bioguide_ids"]) - legislators.keys()
+            if missing:
+                raise CommandError(
+                    f"Unknown legislator: {', '.join(sorted(missing))}",
+                )
+            legislator_ids = legislators.values()
+
+        written = rebuild_scorecard(legislator_ids)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} legislator scores"))
@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from coalition.legislators.regions import link_legislator_regions
+from coalition.legislators.sync import read_records, sync_legislators
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Create and update legislators from a local copy of the "
+        "congress-legislators dataset (legislators-current.json or .yaml), "
+        "marking legislators missing from it as out of office."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument("path", help="Path to a .json or .yaml roster")
+        parser.add_argument(
+            "--keep-missing",
+            action="store_true",
+            help=(
+                "Leave legislators missing from the file in office, e.g. when "
+                "syncing legislators-historical"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Rows written per query (default: BULK_IMPORT_BATCH_SIZE)",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        try:
+            result = sync_legislators(
+                read_records(options["path"]),
+                retire_missing=not options["keep_missing"],
+                batch_size=options["batch_size"],
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read {options['path']}: {e}") from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {result.created}, updated {result.updated}, "
+                f"retired {result.retired} legislators "
+                f"({result.unchanged} unchanged, {result.skipped} skipped)",
+            ),
+        )
+        if result.created or result.updated:
+            linked = link_legislator_regions(batch_size=options["batch_size"])
+            self.stdout.write(f"Linked {linked.updated} legislators to regions")
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("legislators", "0001_initial"),
+        ("regions", "0002_regiongeometry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="legislator",
+            name="region",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="District (House) or state (Senate) represented; set by the link_legislator_regions command",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="legislators",
+                to="regions.region",
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("campaigns", "0004_bill_congress"),
+        ("legislators", "0002_legislator_region"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LegislatorScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "chamber",
+                    models.CharField(
+                        choices=[("House", "House"), ("Senate", "Senate")],
+                        max_length=10,
+                    ),
+                ),
+                ("party", models.CharField(max_length=1)),
+                ("state", models.CharField(max_length=2)),
+                ("sponsored", models.PositiveIntegerField(default=0)),
+                ("cosponsored", models.PositiveIntegerField(default=0)),
+                (
+                    "total",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="sponsored plus cosponsored",
+                    ),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="legislator_scores",
+                        to="campaigns.policycampaign",
+                    ),
+                ),
+                (
+                    "legislator",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scores",
+                        to="legislators.legislator",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["campaign", "-total", "id"],
+                        name="score_campaign_total_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("legislator", "campaign"),
+                        name="unique__legislator__campaign",
+                    ),
+                ],
+            },
+        ),
+    ]
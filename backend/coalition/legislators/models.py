@@ -14,6 +14,17 @@ class Legislator(models.Model):
     party = models.CharField(max_length=1)
     in_office = models.BooleanField(default=True)
     url = models.URLField(blank=True)
+    region = models.ForeignKey(
+        "regions.Region",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="legislators",
+        help_text=(
+            "District (House) or state (Senate) represented; set by the "
+            "link_legislator_regions command"
+        ),
+    )
 
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name} ({self.party}-{self.state})"
@@ -29,3 +40,50 @@ class Legislator(models.Model):
         elif self.chamber == "House" and self.district:
             suffix = f" – District {self.district}"
         return f"{self.first_name} {self.last_name}{suffix} – {self.state}"
+
+
+class LegislatorScore(models.Model):
+    """
+    How many of one campaign's bills a legislator sponsored and cosponsored.
+
+    Maintained by ``coalition.legislators.signals`` and rebuilt in bulk by
+    ``coalition.legislators.scorecard.rebuild_scorecard``.
+    """
+
+    legislator = models.ForeignKey(
+        Legislator,
+        on_delete=models.CASCADE,
+        related_name="scores",
+    )
+    campaign = models.ForeignKey(
+        "campaigns.PolicyCampaign",
+        on_delete=models.CASCADE,
+        related_name="legislator_scores",
+    )
+    # Copied from the legislator, so the scorecard filters without a join
+    chamber = models.CharField(max_length=10, choices=Legislator.CHAMBER_CHOICES)
+    party = models.CharField(max_length=1)
+    state = models.CharField(max_length=2)
+    sponsored = models.PositiveIntegerField(default=0)
+    cosponsored = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(
+        default=0,
+        help_text="sponsored plus cosponsored",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["legislator", "campaign"],
+                name="unique__legislator__campaign",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["campaign", "-total", "id"],
+                name="score_campaign_total_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.legislator} on {self.campaign}: {self.total}"
@@ -0,0 +1,133 @@
+"""
+Links between legislators and the regions they represent.
+
+Senators are linked to their state and House members to their district, so
+"who represents this point?" is one spatial query on regions joined to
+legislators instead of string matching on ``state`` and ``district``.
+"""
+
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.db.models import F
+
+from coalition.core.models import TableVersion
+from coalition.regions.locate import candidate_region_ids
+from coalition.regions.models import Region
+
+from .models import Legislator
+
+DISTRICT_TYPE = "cd119"
+
+# District codes of a state's only seat: 00 for at-large representatives and
+# 98 for the non-voting delegates of DC and the territories
+AT_LARGE_CODES = ("00", "98")
+
+
+@dataclass
+class LinkResult:
+    """Outcome of linking legislators to regions"""
+
+    updated: int = 0
+    # Legislators in office with no matching region
+    unmatched: list[Legislator] = field(default_factory=list)
+
+
+class RegionIndex:
+    """States by postal abbreviation and districts by GEOID"""
+
+    def __init__(self) -> None:
+        self.states: dict[str, tuple[int, str]] = {}
+        self.districts: dict[str, int] = {}
+        regions = Region.objects.filter(type__in=["state", DISTRICT_TYPE])
+        for region_id, geoid, label, region_type in regions.values_list(
+            "id",
+            "geoid",
+            "label",
+            "type",
+        ):
+            if region_type == "state":
+                self.states[(label or "").upper()] = (region_id, geoid)
+            else:
+                self.districts[geoid] = region_id
+
+    def region_id(self, legislator: Legislator) -> int | None:
+        """The id of the region ``legislator`` represents, if it is loaded"""
+        state = self.states.get(legislator.state.upper())
+        if state is None:
+            return None
+        state_id, fips = state
+        if legislator.chamber == "Senate":
+            return state_id
+
+        district = legislator.district.strip()
+        if district.isdigit() and int(district) != 0:
+            codes: tuple[str, ...] = (f"{int(district):02d}",)
+        else:
+            codes = AT_LARGE_CODES
+        for code in codes:
+            if f"{fips}{code}" in self.districts:
+                return self.districts[f"{fips}{code}"]
+        return None
+
+
+def link_legislator_regions(batch_size: int | None = None) -> LinkResult:
+    """Point every legislator's ``region`` at the state or district they serve"""
+    index = RegionIndex()
+    result = LinkResult()
+    changed = []
+    legislators = Legislator.objects.only(
+        "first_name",
+        "last_name",
+        "chamber",
+        "state",
+        "district",
+        "in_office",
+        "region",
+    ).order_by("id")
+    for legislator in legislators:
+        region_id = index.region_id(legislator)
+        if region_id is None and legislator.in_office:
+            result.unmatched.append(legislator)
+        if region_id != legislator.region_id:
+            legislator.region_id = region_id
+            changed.append(legislator)
+
+    Legislator.objects.bulk_update(
+        changed,
+        ["region"],
+        batch_size=batch_size or settings.BULK_IMPORT_BATCH_SIZE,
+    )
+    result.updated = len(changed)
+    if changed:
+        # bulk_update skips model signals, so bump the API validators
+        TableVersion.bump(Legislator)
+    return result
+
+
+def legislators_at_point(lat: float, lng: float) -> list[Legislator]:
+    """
+    Legislators in office who represent a point, senators first.
+
+    The point-in-polygon test and the legislator rows come from one query,
+    with each legislator's region (minus its geometry) joined in.
+    """
+    candidates = candidate_region_ids(lat, lng)
+    if not candidates:
+        return []
+    legislators = (
+        Legislator.objects.filter(
+            in_office=True,
+            region__in=candidates,
+            region__geom__intersects=Point(lng, lat, srid=4326),
+        )
+        .select_related("region")
+        .defer("region__coords", "region__geom", "region__geojson")
+        .order_by(
+            F("chamber").desc(),
+            F("is_senior").desc(nulls_last=True),
+            "last_name",
+        )
+    )
+    return list(legislators)
@@ -0,0 +1,116 @@
+"""
+Legislator scorecards.
+
+Each ``LegislatorScore`` row counts the bills of one campaign a legislator
+sponsored and cosponsored, so ``/api/legislators/scorecard/`` reads
+precomputed rows instead of aggregating both sponsorship tables per request.
+Signals refresh the rows of the legislators each change touches; writes
+that skip signals (fixtures, bulk loads) are followed by
+``rebuild_scorecard``.
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from coalition.campaigns.models import Bill
+from coalition.core.models import TableVersion
+
+from .models import Legislator, LegislatorScore
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+# (legislator id, campaign id)
+ScoreKey = tuple[int, int]
+
+
+def _bill_counts(
+    through: "type[Model]",
+    legislator_ids: list[int] | None,
+) -> dict[ScoreKey, int]:
+    """Bills per legislator and campaign in one sponsorship table"""
+    rows = through.objects.all()
+    if legislator_ids is not None:
+        rows = rows.filter(legislator_id__in=legislator_ids)
+    grouped = (
+        rows.values("legislator_id", campaign_id=F("bill__policy_id"))
+        .annotate(bills=Count("bill_id"))
+        .order_by()
+    )
+    return {(row["legislator_id"], row["campaign_id"]): row["bills"] for row in grouped}
+
+
+def bill_legislators(bill_ids: Iterable[int]) -> set[int]:
+    """Ids of the legislators who sponsor or cosponsor any of the bills"""
+    bill_ids = list(bill_ids)
+    return {
+        legislator_id
+        for relation in (Bill.sponsors, Bill.cosponsors)
+        for legislator_id in relation.through.objects.filter(
+            bill_id__in=bill_ids,
+        ).values_list("legislator_id", flat=True)
+    }
+
+
+def rebuild_scorecard(legislator_ids: Iterable[int] | None = None) -> int:
+    """
+    Recompute the scores of some (by default all) legislators from scratch.
+
+    Uses one grouped query per sponsorship table; returns the number of
+    ``LegislatorScore`` rows written.
+    """
+    existing = LegislatorScore.objects.all()
+    legislators = Legislator.objects.all()
+    if legislator_ids is not None:
+        legislator_ids = list(set(legislator_ids))
+        if not legislator_ids:
+            return 0
+        existing = existing.filter(legislator_id__in=legislator_ids)
+        legislators = legislators.filter(pk__in=legislator_ids)
+
+    sponsored = _bill_counts(Bill.sponsors.through, legislator_ids)
+    cosponsored = _bill_counts(Bill.cosponsors.through, legislator_ids)
+    profiles = {
+        pk: (chamber, party, state)
+        for pk, chamber, party, state in legislators.values_list(
+            "id",
+            "chamber",
+            "party",
+            "state",
+        )
+    }
+    with transaction.atomic():
+        scores = []
+        for key in sorted(sponsored.keys() | cosponsored.keys()):
+            legislator_id, campaign_id = key
+            chamber, party, state = profiles[legislator_id]
+            scores.append(
+                LegislatorScore(
+                    legislator_id=legislator_id,
+                    campaign_id=campaign_id,
+                    chamber=chamber,
+                    party=party,
+                    state=state,
+                    sponsored=sponsored.get(key, 0),
+                    cosponsored=cosponsored.get(key, 0),
+                    total=sponsored.get(key, 0) + cosponsored.get(key, 0),
+                ),
+            )
+        existing.delete()
+        LegislatorScore.objects.bulk_create(scores)
+    TableVersion.bump(LegislatorScore)
+    return len(scores)
+
+
+def copy_profile(legislator: Legislator) -> None:
+    """Copy an edited legislator's chamber, party and state to their scores"""
+    updated = LegislatorScore.objects.filter(legislator=legislator).update(
+        chamber=legislator.chamber,
+        party=legislator.party,
+        state=legislator.state,
+    )
+    if updated:
+        TableVersion.bump(LegislatorScore)
@@ -0,0 +1,93 @@
+"""
+Keep ``LegislatorScore`` rows current as sponsorships change.
+
+Each change rebuilds the scores of just the legislators it touches (see
+``coalition.legislators.scorecard``). Deleting a bill removes its
+sponsorship rows without ``m2m_changed``, so its legislators are noted
+before the delete and rescored after it.
+"""
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from coalition.campaigns.models import Bill
+
+from .models import Legislator
+from .scorecard import bill_legislators, copy_profile, rebuild_scorecard
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.db.models import Model
+
+
+@receiver(m2m_changed, sender=Bill.sponsors.through)
+@receiver(m2m_changed, sender=Bill.cosponsors.through)
+def sponsorships_changed(
+    sender: "type[Model]",
+    instance: "Model",
+    action: str,
+    reverse: bool,
+    pk_set: "set[int] | None",
+    **kwargs: "Any",
+) -> None:
+    """Rescore the legislators added to or removed from a bill"""
+    if action == "pre_clear" and not reverse:
+        instance._cleared_legislators = set(
+            sender.objects.filter(bill_id=instance.pk).values_list(
+                "legislator_id",
+                flat=True,
+            ),
+        )
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        rebuild_scorecard([instance.pk])
+    elif action == "post_clear":
+        rebuild_scorecard(getattr(instance, "_cleared_legislators", set()))
+    else:
+        rebuild_scorecard(pk_set or set())
+
+
+@receiver(post_save, sender=Bill)
+def bill_saved(
+    sender: type,
+    instance: Bill,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """Rescore a bill's legislators when it moves to another campaign"""
+    # Noted by coalition.campaigns.signals.remember_bill_campaign
+    previous = getattr(instance, "_saved_policy_id", None)
+    if not created and not raw and previous not in (None, instance.policy_id):
+        rebuild_scorecard(bill_legislators([instance.pk]))
+
+
+@receiver(pre_delete, sender=Bill)
+def remember_bill_legislators(sender: type, instance: Bill, **kwargs: "Any") -> None:
+    instance._scored_legislators = bill_legislators([instance.pk])
+
+
+@receiver(post_delete, sender=Bill)
+def bill_deleted(sender: type, instance: Bill, **kwargs: "Any") -> None:
+    rebuild_scorecard(getattr(instance, "_scored_legislators", set()))
+
+
+@receiver(post_save, sender=Legislator)
+def legislator_saved(
+    sender: type,
+    instance: Legislator,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    if not created and not raw:
+        copy_profile(instance)
@@ -0,0 +1,217 @@
+"""
+Syncing legislators from the congress-legislators dataset.
+
+The `unitedstates/congress-legislators
+<https://github.com/unitedstates/congress-legislators>`_ project publishes
+every member of Congress as JSON and YAML (``legislators-current`` and
+``legislators-historical``). A sync reads a local copy record by record,
+compares each with the stored legislator of the same bioguide ID in memory,
+and writes only the differences in one transaction: ``bulk_create`` for new
+members, ``bulk_update`` for changed ones, and one ``UPDATE`` marking
+legislators missing from the roster as out of office. JSON is streamed;
+YAML needs PyYAML and is parsed whole.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from coalition.campaigns.signals import legislator_campaigns
+from coalition.core.cache import invalidate_campaign_bills
+from coalition.core.models import TableVersion
+
+from .models import Legislator
+from .scorecard import rebuild_scorecard
+
+if TYPE_CHECKING:
+    from typing import Any, TextIO
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML is optional
+    yaml = None
+
+# Columns a sync compares and writes
+SYNC_FIELDS = [
+    "first_name",
+    "last_name",
+    "chamber",
+    "state",
+    "district",
+    "is_senior",
+    "party",
+    "in_office",
+    "url",
+]
+
+CHAMBERS = {"sen": "Senate", "rep": "House"}
+SENIORITY = {"senior": True, "junior": False}
+
+JSON_CHUNK_SIZE = 1 << 16
+
+
+@dataclass
+class SyncResult:
+    """Counts of legislators handled by a sync"""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # In office before the sync but missing from the roster
+    retired: int = 0
+    # Records without a bioguide ID or a term, or repeated
+    skipped: int = 0
+
+
+def _json_array(file: "TextIO", chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[dict]:
+    """Yield the items of a top-level JSON array without reading it whole"""
+    decoder = json.JSONDecoder()
+    buffer, opened = "", False
+    while chunk := file.read(chunk_size):
+        buffer += chunk
+        while buffer := buffer.lstrip():
+            if not opened:
+                if not buffer.startswith("["):
+                    raise ValueError("Expected a JSON array of legislators")
+                buffer, opened = buffer[1:], True
+            elif buffer.startswith("]"):
+                return
+            elif buffer.startswith(","):
+                buffer = buffer[1:]
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    break  # The item continues in the next chunk
+                yield item
+                buffer = buffer[end:]
+    raise ValueError("Unterminated JSON array")
+
+
+def read_records(path: str) -> Iterator[dict]:
+    """Yield the records of a ``.json`` or ``.yaml`` congress-legislators file"""
+    suffix = Path(path).suffix.lower()
+    if suffix in (".yaml", ".yml") and yaml is None:
+        raise ValueError("Reading YAML needs PyYAML; use the JSON file instead")
+    if suffix not in (".json", ".yaml", ".yml"):
+        raise ValueError(f"Unsupported file type {suffix!r}; use .json or .yaml")
+    with Path(path).open(encoding="utf-8") as file:
+        if suffix == ".json":
+            yield from _json_array(file)
+        else:
+            # The C loader, when PyYAML was built with libyaml, is much faster
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            yield from yaml.load(file, Loader=loader)
+
+
+def legislator_fields(record: "dict[str, Any]", today: date) -> "dict[str, Any] | None":
+    """
+    Legislator field values from a record's latest term.
+
+    Returns None for a record without a bioguide ID or a House or Senate
+    term. A legislator is in office until the end date of that term.
+    """
+    bioguide_id = record.get("id", {}).get("bioguide")
+    terms = record.get("terms") or [{}]
+    term, name = terms[-1], record.get("name", {})
+    if not bioguide_id or term.get("type") not in CHAMBERS:
+        return None
+    district = term.get("district")
+    end = term.get("end")
+    return {
+        "bioguide_id": bioguide_id,
+        "first_name": name.get("first", ""),
+        "last_name": name.get("last", ""),
+        "chamber": CHAMBERS[term["type"]],
+        "state": term.get("state", ""),
+        # At-large seats are district 0; senators have none
+        "district": f"{district:02d}" if isinstance(district, int) else "",
+        "is_senior": SENIORITY.get(term.get("state_rank")),
+        "party": (term.get("party") or "")[:1],
+        "in_office": end is None or date.fromisoformat(str(end)) >= today,
+        "url": term.get("url", ""),
+    }
+
+
+def _apply(legislator: Legislator, fields: "dict[str, Any]") -> set[str]:
+    """Copy ``fields`` onto ``legislator``; returns the names that changed"""
+    changed = {
+        name for name in SYNC_FIELDS if getattr(legislator, name) != fields[name]
+    }
+    for name in changed:
+        setattr(legislator, name, fields[name])
+    return changed
+
+
+def sync_legislators(
+    records: Iterable[dict],
+    retire_missing: bool = True,
+    batch_size: int | None = None,
+    today: date | None = None,
+) -> SyncResult:
+    """
+    Bring the legislators table in line with congress-legislators records.
+
+    Legislators are matched on bioguide ID. With ``retire_missing``, those
+    in office but absent from ``records`` are marked out of office, so pass
+    the current roster, or turn it off for a partial or historical file.
+    """
+    batch_size = batch_size or settings.BULK_IMPORT_BATCH_SIZE
+    today = today or timezone.localdate()
+    existing = {
+        legislator.bioguide_id: legislator
+        for legislator in Legislator.objects.only("bioguide_id", *SYNC_FIELDS)
+    }
+    result = SyncResult()
+    created, changed = [], []
+    seen, changed_fields = set(), set()
+    for record in records:
+        fields = legislator_fields(record, today)
+        if fields is None or fields["bioguide_id"] in seen:
+            result.skipped += 1
+            continue
+        seen.add(fields["bioguide_id"])
+        legislator = existing.get(fields["bioguide_id"])
+        if legislator is None:
+            created.append(Legislator(**fields))
+        elif names := _apply(legislator, fields):
+            changed.append(legislator)
+            changed_fields |= names
+        else:
+            result.unchanged += 1
+
+    retired = [
+        legislator.pk
+        for bioguide_id, legislator in existing.items()
+        if retire_missing and legislator.in_office and bioguide_id not in seen
+    ]
+    with transaction.atomic():
+        Legislator.objects.bulk_create(created, batch_size=batch_size)
+        if changed:
+            # Only the columns that differ, which keeps the CASE statements short
+            Legislator.objects.bulk_update(
+                changed,
+                sorted(changed_fields),
+                batch_size=batch_size,
+            )
+        Legislator.objects.filter(pk__in=retired).update(in_office=False)
+    result.created, result.updated, result.retired = (
+        len(created),
+        len(changed),
+        len(retired),
+    )
+
+    if created or changed or retired:
+        # Bulk writes skip the signals that keep these current
+        TableVersion.bump(Legislator)
+        changed_ids = [legislator.pk for legislator in changed]
+        invalidate_campaign_bills(legislator_campaigns(changed_ids))
+        rebuild_scorecard(changed_ids)
+    return result
@@ -0,0 +1,444 @@
+import json
+import tempfile
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from unittest import skipIf
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from coalition.campaigns.models import Bill, PolicyCampaign
+from coalition.core.models import TableVersion
+from coalition.core.tests_support import ChangelistQueryBudgetTestCase
+from coalition.regions.models import Region
+
+from .models import Legislator, LegislatorScore
+from .sync import _json_array, read_records, yaml
+
+
+class LinkLegislatorRegionsTest(TestCase):
+    def setUp(self) -> None:
+        self.maryland = Region.objects.create(
+            geoid="24",
+            name="Maryland",
+            label="MD",
+            type="state",
+        )
+        self.md01 = Region.objects.create(
+            geoid="2401",
+            name="MD-01",
+            type="cd119",
+            parent=self.maryland,
+        )
+        self.alaska = Region.objects.create(
+            geoid="02",
+            name="Alaska",
+            label="AK",
+            type="state",
+        )
+        self.ak_at_large = Region.objects.create(
+            geoid="0200",
+            name="AK-AL",
+            type="cd119",
+            parent=self.alaska,
+        )
+
+    def _legislator(self, bioguide_id: str, **kwargs: str | bool) -> Legislator:
+        return Legislator.objects.create(
+            bioguide_id=bioguide_id,
+            first_name="First",
+            last_name=bioguide_id,
+            party="D",
+            **kwargs,
+        )
+
+    def _run(self) -> tuple[str, str]:
+        out, err = StringIO(), StringIO()
+        call_command("link_legislator_regions", stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_links_states_and_districts(self) -> None:
+        """Test that senators get their state and representatives their district"""
+        senator = self._legislator("S000001", chamber="Senate", state="MD")
+        representative = self._legislator(
+            "H000001",
+            chamber="House",
+            state="md",
+            district="1",
+        )
+        at_large = self._legislator("H000002", chamber="House", state="AK")
+        version = TableVersion.get_version(Legislator)
+
+        out, _ = self._run()
+
+        for legislator in (senator, representative, at_large):
+            legislator.refresh_from_db()
+        assert senator.region == self.maryland
+        assert representative.region == self.md01
+        assert at_large.region == self.ak_at_large
+        assert "Updated 3 legislators" in out
+        assert TableVersion.get_version(Legislator) == version + 1
+
+    def test_unmatched_reported(self) -> None:
+        """Test that legislators without a loaded region are reported"""
+        self._legislator("H000003", chamber="House", state="VA", district="2")
+        self._legislator(
+            "H000004",
+            chamber="House",
+            state="VA",
+            district="3",
+            in_office=False,
+        )
+
+        out, err = self._run()
+
+        assert "1 in office without a region" in out
+        assert "H000003" in err
+        assert "H000004" not in err
+
+    def test_rerun_only_updates_changes(self) -> None:
+        """Test that a second run leaves already-linked legislators alone"""
+        representative = self._legislator(
+            "H000001",
+            chamber="House",
+            state="MD",
+            district="01",
+        )
+        self._run()
+        version = TableVersion.get_version(Legislator)
+
+        out, _ = self._run()
+
+        assert "Updated 0 legislators" in out
+        assert TableVersion.get_version(Legislator) == version
+
+        self.md01.delete()
+        representative.refresh_from_db()
+        assert representative.region is None
+
+
+class LegislatorAdminTest(ChangelistQueryBudgetTestCase):
+    URL = "/admin/legislators/legislator/"
+
+    def setUp(self) -> None:
+        self.client.force_login(
+            User.objects.create_superuser("admin", "admin@example.org", "pw"),
+        )
+        self.campaign = PolicyCampaign.objects.create(
+            title="Clean Water",
+            slug="clean-water",
+            summary="",
+        )
+
+    def _add_legislators(self, count: int) -> None:
+        start = Legislator.objects.count()
+        for i in range(start, start + count):
+            legislator = Legislator.objects.create(
+                bioguide_id=f"L{i:06d}",
+                first_name="Pat",
+                last_name=f"Member {i}",
+                chamber="House",
+                state="MD",
+                party="D",
+            )
+            bill = self._bill(f"H.R. {i}")
+            bill.sponsors.add(legislator)
+            bill.cosponsors.add(legislator)
+
+    def _bill(self, number: str) -> Bill:
+        return Bill.objects.create(
+            policy=self.campaign,
+            number=number,
+            title="A bill",
+            chamber="House",
+            congress_session="119th",
+            introduced_date="2025-01-03",
+        )
+
+    def test_changelist_query_budget(self) -> None:
+        """Test that the bill counts don't add queries per legislator"""
+        self._add_legislators(2)
+
+        self.assert_query_budget([self.URL], partial(self._add_legislators, 20))
+
+    def test_sort_by_bill_counts(self) -> None:
+        """Test that the count columns sort and show the annotated counts"""
+        self._add_legislators(3)
+        first, second, third = Legislator.objects.order_by("id")
+        for number in range(2):
+            self._bill(f"S. {number}").sponsors.add(second)
+        self._bill("S. 2").cosponsors.add(third)
+        # Columns 7 and 8 of list_display are the bill counts
+        response = self.client.get(f"{self.URL}?o=-7.-8")
+
+        assert response.status_code == 200
+        assert [
+            (legislator.pk, legislator.sponsored_count, legislator.cosponsored_count)
+            for legislator in response.context["cl"].result_list
+        ] == [(second.pk, 3, 1), (third.pk, 1, 2), (first.pk, 1, 1)]
+
+        response = self.client.get(f"{self.URL}?o=-8.7")
+
+        assert [legislator.pk for legislator in response.context["cl"].result_list] == [
+            third.pk,
+            first.pk,
+            second.pk,
+        ]
+
+
+class ScorecardTest(TestCase):
+    def setUp(self) -> None:
+        self.water, self.soil = (
+            PolicyCampaign.objects.create(title=slug, slug=slug, summary="")
+            for slug in ("water", "soil")
+        )
+        self.smith, self.jones = (
+            Legislator.objects.create(
+                bioguide_id=bioguide_id,
+                first_name="Pat",
+                last_name=last_name,
+                chamber="House",
+                state="MD",
+                district="01",
+                party="D",
+            )
+            for bioguide_id, last_name in (("S000001", "Smith"), ("J000001", "Jones"))
+        )
+        self.bills = [
+            Bill.objects.create(
+                policy=campaign,
+                number=f"H.R. {i}",
+                title="A bill",
+                chamber="House",
+                introduced_date="2025-02-01",
+            )
+            for i, campaign in enumerate([self.water, self.water, self.soil])
+        ]
+
+    def _scores(self) -> dict[tuple[str, str], tuple[int, int, int]]:
+        return {
+            (score.legislator.last_name, score.campaign.slug): (
+                score.sponsored,
+                score.cosponsored,
+                score.total,
+            )
+            for score in LegislatorScore.objects.select_related(
+                "legislator",
+                "campaign",
+            )
+        }
+
+    def test_sponsorships_update_scores(self) -> None:
+        """Test that adding and removing (co)sponsors rescores legislators"""
+        first, second, soil_bill = self.bills
+        first.sponsors.add(self.smith)
+        second.cosponsors.add(self.smith, self.jones)
+        self.jones.sponsored_bills.add(soil_bill)
+
+        assert self._scores() == {
+            ("Smith", "water"): (1, 1, 2),
+            ("Jones", "water"): (0, 1, 1),
+            ("Jones", "soil"): (1, 0, 1),
+        }
+
+        second.cosponsors.clear()
+        self.jones.sponsored_bills.remove(soil_bill)
+
+        assert self._scores() == {("Smith", "water"): (1, 0, 1)}
+
+    def test_bill_moves_and_deletes(self) -> None:
+        """Test that moving or deleting a bill moves or drops its scores"""
+        first, second, _ = self.bills
+        first.sponsors.add(self.smith)
+        second.sponsors.add(self.smith)
+
+        first.policy = self.soil
+        first.save()
+        assert self._scores() == {
+            ("Smith", "water"): (1, 0, 1),
+            ("Smith", "soil"): (1, 0, 1),
+        }
+
+        second.delete()
+        assert self._scores() == {("Smith", "soil"): (1, 0, 1)}
+
+    def test_legislator_edit_copied(self) -> None:
+        """Test that a legislator's new party reaches their scores"""
+        self.bills[0].sponsors.add(self.smith)
+
+        self.smith.party = "I"
+        self.smith.save()
+
+        assert LegislatorScore.objects.get().party == "I"
+
+    def test_rebuild_command(self) -> None:
+        """Test that the command recomputes scores written without signals"""
+        Bill.sponsors.through.objects.bulk_create(
+            Bill.sponsors.through(bill_id=bill.pk, legislator_id=self.jones.pk)
+            for bill in self.bills
+        )
+        version = TableVersion.get_version(LegislatorScore)
+        out = StringIO()
+
+        call_command("rebuild_scorecard", stdout=out)
+
+        assert "Wrote 2 legislator scores" in out.getvalue()
+        assert self._scores() == {
+            ("Jones", "water"): (2, 0, 2),
+            ("Jones", "soil"): (1, 0, 1),
+        }
+        assert TableVersion.get_version(LegislatorScore) > version
+
+    def test_rebuild_unknown_legislator(self) -> None:
+        """Test that the command rejects an unknown bioguide ID"""
+        with self.assertRaisesMessage(CommandError, "Unknown legislator: X000000"):
+            call_command("rebuild_scorecard", legislator=["X000000"])
+
+
+def _record(bioguide_id: str, last: str, **term: object) -> dict:
+    return {
+        "id": {"bioguide": bioguide_id},
+        "name": {"first": "Pat", "last": last},
+        "terms": [
+            {"type": "rep", "start": "2019-01-03", "end": "2021-01-03"},
+            {
+                "type": "rep",
+                "start": "2025-01-03",
+                "end": "2027-01-03",
+                "state": "MD",
+                "district": 1,
+                "party": "Democrat",
+                **term,
+            },
+        ],
+    }
+
+
+class SyncLegislatorsTest(TestCase):
+    ROSTER = [
+        _record("S000001", "Smith"),
+        _record(
+            "J000001",
+            "Jones",
+            type="sen",
+            state="VA",
+            district=None,
+            state_rank="senior",
+            party="Republican",
+            url="https://www.jones.senate.gov",
+        ),
+        _record("L000001", "Lee", state="AK", district=0, party="Independent"),
+    ]
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def _write(self, records: list[dict], name: str = "roster.json") -> str:
+        path = Path(self.dir.name) / name
+        path.write_text(json.dumps(records, indent=2))
+        return str(path)
+
+    def _sync(self, records: list[dict], *args: str) -> str:
+        out = StringIO()
+        call_command("sync_legislators", self._write(records), *args, stdout=out)
+        return out.getvalue()
+
+    def test_creates_legislators(self) -> None:
+        """Test that each record's latest term becomes a legislator"""
+        output = self._sync(self.ROSTER)
+
+        assert "Created 3, updated 0, retired 0 legislators" in output
+        rows = Legislator.objects.order_by("bioguide_id").values_list(
+            "last_name",
+            "chamber",
+            "state",
+            "district",
+            "party",
+            "is_senior",
+            "in_office",
+        )
+        assert list(rows) == [
+            ("Jones", "Senate", "VA", "", "R", True, True),
+            ("Lee", "House", "AK", "00", "I", None, True),
+            ("Smith", "House", "MD", "01", "D", None, True),
+        ]
+
+    def test_applies_only_changes(self) -> None:
+        """Test that a re-sync updates changed rows and retires departures"""
+        self._sync(self.ROSTER)
+        smith = Legislator.objects.get(bioguide_id="S000001")
+        Bill.objects.create(
+            policy=PolicyCampaign.objects.create(title="W", slug="w", summary=""),
+            number="H.R. 1",
+            title="A bill",
+            chamber="House",
+            introduced_date="2025-02-01",
+        ).sponsors.add(smith)
+        roster = [_record("S000001", "Smith", party="Independent"), self.ROSTER[1]]
+
+        output = self._sync(roster)
+
+        assert "Created 0, updated 1, retired 1 legislators" in output
+        assert "(1 unchanged, 0 skipped)" in output
+        assert Legislator.objects.get(bioguide_id="S000001").party == "I"
+        assert not Legislator.objects.get(bioguide_id="L000001").in_office
+        # Bulk writes still reach the scorecard
+        assert LegislatorScore.objects.get(legislator=smith).party == "I"
+
+    def test_query_count_is_constant(self) -> None:
+        """Test that syncing 40 legislators takes as many queries as syncing 4"""
+        TableVersion.bump(Legislator)
+        counts = []
+        for total in (4, 40):
+            Legislator.objects.all().delete()
+            roster = [_record(f"M{i:06}", f"Member{i}") for i in range(total)]
+            with CaptureQueriesContext(connection) as queries:
+                self._sync(roster)
+            counts.append(len(queries))
+
+        assert counts[0] == counts[1]
+
+    def test_keep_missing(self) -> None:
+        """Test that --keep-missing leaves absent legislators in office"""
+        self._sync(self.ROSTER)
+
+        output = self._sync(self.ROSTER[:1], "--keep-missing")
+
+        assert "retired 0" in output
+        assert Legislator.objects.filter(in_office=True).count() == 3
+
+    def test_ended_terms_and_bad_records(self) -> None:
+        """Test that ended terms are out of office and unusable records skipped"""
+        ended = _record("O000001", "Old", end="2021-01-03")
+        output = self._sync([ended, {"id": {}}, ended])
+
+        assert "Created 1" in output
+        assert "2 skipped" in output
+        assert not Legislator.objects.get().in_office
+
+    def test_streams_json(self) -> None:
+        """Test that records split across read chunks are parsed"""
+        with Path(self._write(self.ROSTER)).open() as file:
+            records = list(_json_array(file, chunk_size=7))
+
+        assert records == self.ROSTER
+
+    @skipIf(yaml is None, "PyYAML is not installed")
+    def test_reads_yaml(self) -> None:
+        """Test that the YAML edition of the dataset is read too"""
+        path = Path(self.dir.name) / "roster.yaml"
+        path.write_text(yaml.safe_dump(self.ROSTER))
+
+        assert list(read_records(str(path))) == self.ROSTER
+
+    def test_unsupported_file(self) -> None:
+        """Test that other file types are rejected"""
+        path = self._write(self.ROSTER, name="roster.csv")
+
+        with self.assertRaisesMessage(CommandError, "Unsupported file type '.csv'"):
+            call_command("sync_legislators", path)
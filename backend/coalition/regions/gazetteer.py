@@ -0,0 +1,98 @@
+"""
+Offline place-name lookup.
+
+Maps a state code, and optionally a county name, to the internal point
+(``Region.coords``) of the matching county or state region. The index is
+built from the regions table in one query and cached under the regions
+``TableVersion`` like the bounding-box index in ``coalition.regions.locate``,
+so geocoding a batch of addresses only reads that version.
+"""
+
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.gis.geos import Point
+
+from coalition.core.cache import cache_key, get_or_build
+from coalition.core.models import TableVersion
+
+from .models import Region
+
+GAZETTEER_CACHE_KEY = "regions:gazetteer"
+
+# Legal/statistical area descriptions that may or may not follow a county
+# name; "Baltimore County" and "Baltimore" both match the county, while
+# "Baltimore city" keeps its suffix and matches the independent city
+COUNTY_SUFFIXES = (
+    " city and borough",
+    " census area",
+    " municipality",
+    " borough",
+    " county",
+    " parish",
+)
+
+_Coords = tuple[float, float]
+
+
+def normalize_county(name: str) -> str:
+    """Case-fold a county name and drop a trailing area description"""
+    name = " ".join(name.casefold().split())
+    for suffix in COUNTY_SUFFIXES:
+        if name.endswith(suffix):
+            return name.removesuffix(suffix)
+    return name
+
+
+class Gazetteer(NamedTuple):
+    """Internal points of states by code and of counties by (code, name)"""
+
+    states: dict[str, _Coords]
+    counties: dict[tuple[str, str], _Coords]
+
+    def locate(self, state: str, county: str = "") -> tuple[Point | None, str]:
+        """
+        Return the point for a place and the type of region it came from.
+
+        A county that isn't known falls back to its state's point; an
+        unknown state gives ``(None, "")``.
+        """
+        state = state.strip().upper()
+        coords = self.counties.get((state, normalize_county(county)))
+        precision = "county"
+        if coords is None:
+            coords = self.states.get(state)
+            precision = "state"
+        if coords is None:
+            return None, ""
+        return Point(*coords, srid=4326), precision
+
+
+def build_gazetteer() -> Gazetteer:
+    """Read the internal point of every state and county from the database"""
+    gazetteer = Gazetteer(states={}, counties={})
+    regions = Region.objects.filter(
+        type__in=["state", "county"],
+        coords__isnull=False,
+    ).values_list("type", "label", "parent__label", "coords")
+    for region_type, label, state, coords in regions:
+        if region_type == "state" and label:
+            gazetteer.states[label.upper()] = coords.coords
+        elif region_type == "county" and label and state:
+            key = (state.upper(), normalize_county(label))
+            gazetteer.counties[key] = coords.coords
+    return gazetteer
+
+
+def get_gazetteer() -> Gazetteer:
+    """
+    Return the cached gazetteer, building it on a miss.
+
+    Keyed by the regions ``TableVersion``, so regions loaded or edited in
+    any process are picked up by every worker.
+    """
+    return get_or_build(
+        cache_key(GAZETTEER_CACHE_KEY, TableVersion.get_version(Region)),
+        build_gazetteer,
+        timeout=settings.REGION_BOXES_CACHE_TIMEOUT,
+    )
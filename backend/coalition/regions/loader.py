@@ -0,0 +1,233 @@
+"""
+Loading regions from Census TIGER/Line and cartographic boundary files.
+
+Features are streamed with GDAL from any vector source it can open (a
+shapefile, a zipped shapefile through ``/vsizip/``, or a GeoPackage) and
+inserted in batches with ``bulk_create``, each in its own transaction.
+Regions that are already in the database are skipped, so running an
+interrupted load again resumes where it stopped. Districts and counties are
+linked to their state through the two-digit state FIPS prefix of their GEOID,
+so states must be loaded first.
+"""
+
+import json
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.gis.gdal import CoordTransform, DataSource, SpatialReference
+from django.contrib.gis.geos import MultiPolygon, Point
+
+from coalition.core.formatting import ordinal
+from coalition.core.models import TableVersion
+
+from .models import Region
+from .simplify import simplified_geojson, zoom_tolerance
+
+if TYPE_CHECKING:
+    from django.contrib.gis.gdal import Feature, Layer
+    from django.contrib.gis.geos import GEOSGeometry
+
+# District numbers TIGER uses for a state's single at-large seat (98 is the
+# non-voting delegate of DC and the territories), and for areas, mostly
+# water, that belong to no district
+AT_LARGE_DISTRICTS = frozenset({"00", "98"})
+UNASSIGNED_DISTRICT = "ZZ"
+
+# Columns written when --replace updates regions that already exist
+REPLACE_FIELDS = ["name", "label", "parent", "coords", "geom", "geojson"]
+
+# Map zoom level the shape kept in Region.geojson is simplified for; the
+# campaign endorsement choropleth draws the whole country from it
+GEOJSON_ZOOM = 4
+
+
+@dataclass
+class LoadResult:
+    """Counts of features handled by a load"""
+
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    # State FIPS codes of regions skipped because the state is not loaded
+    missing_states: set[str] = field(default_factory=set)
+
+
+def _geometry(feature: "Feature", transform: CoordTransform | None) -> MultiPolygon:
+    geom = feature.geom
+    if transform is not None:
+        geom.transform(transform)
+    geos = geom.geos
+    if not isinstance(geos, MultiPolygon):
+        geos = MultiPolygon(geos)
+    geos.srid = 4326
+    return geos
+
+
+def _internal_point(feature: "Feature", geom: "GEOSGeometry") -> Point:
+    """The Census internal point when the file has one, else a point on the shape"""
+    if "INTPTLAT" in feature.fields and "INTPTLON" in feature.fields:
+        lat, lng = feature.get("INTPTLAT"), feature.get("INTPTLON")
+        if lat and lng:
+            return Point(float(lng), float(lat), srid=4326)
+    point = geom.point_on_surface
+    point.srid = 4326
+    return point
+
+
+def _state_region(feature: "Feature") -> Region:
+    return Region(
+        geoid=feature.get("GEOID"),
+        name=feature.get("NAME"),
+        label=feature.get("STUSPS"),
+        type="state",
+    )
+
+
+def _district_region(
+    feature: "Feature",
+    region_type: str,
+    states: dict[str, Region],
+) -> Region:
+    """Name a district after its state, e.g. ``MD-01`` / ``Maryland 1st``"""
+    geoid = feature.get("GEOID")
+    state = states[geoid[:2]]
+    number = feature.get(f"CD{region_type.removeprefix('cd')}FP")
+    if number in AT_LARGE_DISTRICTS:
+        code, label = "AL", f"{state.name} At-Large"
+    else:
+        code, label = number, f"{state.name} {ordinal(int(number))}"
+    return Region(
+        geoid=geoid,
+        name=f"{state.label}-{code}",
+        label=label,
+        type=region_type,
+        parent=state,
+    )
+
+
+def _county_region(feature: "Feature", states: dict[str, Region]) -> Region:
+    """Name a county after its state, e.g. ``Kent County, MD`` / ``Kent County``"""
+    geoid = feature.get("GEOID")
+    state = states[geoid[:2]]
+    full_name = feature.get("NAMELSAD")
+    return Region(
+        geoid=geoid,
+        name=f"{full_name}, {state.label}",
+        label=full_name,
+        type="county",
+        parent=state,
+    )
+
+
+def _feature_region(
+    feature: "Feature",
+    region_type: str,
+    states: dict[str, Region],
+    result: LoadResult,
+) -> Region | None:
+    """Build a region's attributes, or None (counted as skipped) to leave it out"""
+    geoid = feature.get("GEOID")
+    if region_type == "state":
+        return _state_region(feature)
+    if geoid[:2] not in states:
+        result.missing_states.add(geoid[:2])
+    elif region_type == "county":
+        return _county_region(feature, states)
+    elif not geoid.endswith(UNASSIGNED_DISTRICT):
+        return _district_region(feature, region_type, states)
+    result.skipped += 1
+    return None
+
+
+def read_regions(
+    layer: "Layer",
+    region_type: str,
+    states: dict[str, Region],
+    skip: "Collection[str]",
+    result: LoadResult,
+) -> Iterator[Region]:
+    """
+    Yield unsaved regions for the features of ``layer``.
+
+    ``states`` maps state FIPS codes to loaded states (the parents of
+    districts and counties), and features whose GEOID is in ``skip`` are
+    passed over without reading their geometry.
+    """
+    srs = layer.srs
+    transform = (
+        CoordTransform(srs, SpatialReference(4326))
+        if srs is not None and srs.srid != 4326
+        else None
+    )
+    for feature in layer:
+        if feature.get("GEOID") in skip:
+            result.skipped += 1
+            continue
+        region = _feature_region(feature, region_type, states, result)
+        if region is not None:
+            region.geom = _geometry(feature, transform)
+            region.coords = _internal_point(feature, region.geom)
+            geojson = simplified_geojson(region.geom, zoom_tolerance(GEOJSON_ZOOM))
+            region.geojson = json.loads(geojson) if geojson else None
+            yield region
+
+
+def load_regions(
+    path: str,
+    region_type: str,
+    layer: int | str = 0,
+    batch_size: int | None = None,
+    replace: bool = False,
+    progress: "Callable[[LoadResult], None] | None" = None,
+) -> LoadResult:
+    """
+    Load one region type from a TIGER/Line or cartographic boundary file.
+
+    Existing regions (matched on GEOID and type) are skipped, or updated in
+    place when ``replace`` is set. ``progress`` is called after each batch.
+    """
+    batch_size = batch_size or settings.BULK_IMPORT_BATCH_SIZE
+    existing = set(
+        Region.objects.filter(type=region_type).values_list("geoid", flat=True),
+    )
+    states = (
+        {}
+        if region_type == "state"
+        else {
+            state.geoid: state
+            for state in Region.objects.filter(type="state").only(
+                "geoid",
+                "name",
+                "label",
+            )
+        }
+    )
+    result = LoadResult()
+    regions = read_regions(
+        DataSource(path)[layer],
+        region_type,
+        states,
+        skip=set() if replace else existing,
+        result=result,
+    )
+    while batch := list(islice(regions, batch_size)):
+        Region.objects.bulk_create(
+            batch,
+            update_conflicts=replace,
+            unique_fields=["geoid", "type"] if replace else None,
+            update_fields=REPLACE_FIELDS if replace else None,
+        )
+        updated = sum(region.geoid in existing for region in batch)
+        result.updated += updated
+        result.created += len(batch) - updated
+        if progress is not None:
+            progress(result)
+
+    if result.created or result.updated:
+        # bulk_create skips model signals; the version also keys the point
+        # lookup and gazetteer caches
+        TableVersion.bump(Region)
+    return result
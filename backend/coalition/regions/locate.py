@@ -0,0 +1,96 @@
+"""
+Point-in-region lookup.
+
+Each lookup starts from a cached index of region bounding boxes, so a point
+outside every region only costs the regions ``TableVersion`` read and a
+point inside only tests the handful of polygons whose boxes contain it. That final test
+is an ``intersects`` query, which PostGIS answers through the GiST index on
+``Region.geom``.
+"""
+
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.gis.db.models.functions import Envelope
+from django.contrib.gis.geos import Point
+
+from coalition.core.cache import cache_key, get_or_build
+from coalition.core.models import TableVersion
+
+from .models import Region
+
+REGION_BOXES_CACHE_KEY = "regions:boxes"
+
+# Region types returned by a lookup, mapped to the key they are returned under
+LOCATE_TYPES = {"state": "state", "cd119": "district"}
+
+# Columns needed to describe a matched region; the polygons stay in the database
+REGION_SUMMARY_FIELDS = ("id", "geoid", "name", "label", "type")
+
+
+class RegionBox(NamedTuple):
+    """Bounding box of one region's geometry, in degrees"""
+
+    id: int
+    xmin: float
+    ymin: float
+    xmax: float
+    ymax: float
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.xmin <= x <= self.xmax and self.ymin <= y <= self.ymax
+
+
+def build_region_boxes() -> list[RegionBox]:
+    """Read the bounding box of every locatable region from the database"""
+    regions = (
+        Region.objects.filter(type__in=list(LOCATE_TYPES), geom__isnull=False)
+        .annotate(envelope=Envelope("geom"))
+        .values_list("id", "envelope")
+    )
+    return [RegionBox(region_id, *envelope.extent) for region_id, envelope in regions]
+
+
+def get_region_boxes() -> list[RegionBox]:
+    """
+    Return the cached bounding-box index, building it on a miss.
+
+    The key includes the regions ``TableVersion``, so a change made by any
+    process (including ``load_regions``) is seen by every worker.
+    """
+    return get_or_build(
+        cache_key(REGION_BOXES_CACHE_KEY, TableVersion.get_version(Region)),
+        build_region_boxes,
+        timeout=settings.REGION_BOXES_CACHE_TIMEOUT,
+    )
+
+
+def candidate_region_ids(lat: float, lng: float) -> list[int]:
+    """Ids of locatable regions whose bounding box contains a point"""
+    return [box.id for box in get_region_boxes() if box.contains(lng, lat)]
+
+
+def locate_point(lat: float, lng: float) -> dict[str, Region | None]:
+    """
+    Find the state and congressional district containing a point.
+
+    Returns ``{"state": ..., "district": ...}``; either is ``None`` when no
+    region of that type contains the point. Matched regions are loaded
+    without their geometry.
+    """
+    found: dict[str, Region | None] = dict.fromkeys(LOCATE_TYPES.values())
+    candidates = candidate_region_ids(lat, lng)
+    if not candidates:
+        return found
+
+    point = Point(lng, lat, srid=4326)
+    regions = (
+        Region.objects.filter(id__in=candidates, geom__intersects=point)
+        .only(*REGION_SUMMARY_FIELDS)
+        .order_by("id")
+    )
+    for region in regions:
+        key = LOCATE_TYPES[region.type]
+        if found[key] is None:
+            found[key] = region
+    return found
@@ -0,0 +1,83 @@
+from typing import TYPE_CHECKING
+
+from django.contrib.gis.gdal import GDALException
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from coalition.regions.loader import LoadResult, load_regions
+from coalition.regions.models import Region
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Load regions from a Census TIGER/Line or cartographic boundary file "
+        "(shapefile, /vsizip/ archive or GeoPackage). Load states before "
+        "districts and counties; re-running resumes an interrupted load."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument("path", help="Path of the file to load")
+        parser.add_argument(
+            "--type",
+            required=True,
+            choices=[choice for choice, _ in Region.REGION_TYPE_CHOICES],
+            dest="region_type",
+            help="Region type of the features in the file",
+        )
+        parser.add_argument(
+            "--layer",
+            default="0",
+            help="Layer index or name (default: the first layer)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Regions inserted per transaction (default: BULK_IMPORT_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--replace",
+            action="store_true",
+            help="Update regions that already exist instead of skipping them",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        layer = options["layer"]
+        try:
+            result = load_regions(
+                options["path"],
+                options["region_type"],
+                layer=int(layer) if layer.isdigit() else layer,
+                batch_size=options["batch_size"],
+                replace=options["replace"],
+                progress=self._progress,
+            )
+        except (GDALException, IndexError) as e:
+            raise CommandError(f"Could not read {options['path']}: {e}") from e
+        except DatabaseError as e:
+            raise CommandError(
+                f"Load stopped by a database error: {e}. Regions written by "
+                "earlier batches were kept; run the command again to resume.",
+            ) from e
+
+        if result.missing_states:
+            self.stderr.write(
+                "Skipped regions in states that are not loaded (FIPS "
+                f"{', '.join(sorted(result.missing_states))}); load states first.",
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {result.created}, updated {result.updated} and "
+                f"skipped {result.skipped} regions",
+            ),
+        )
+        if result.created or result.updated:
+            self.stdout.write(
+                "Run simplify_regions to rebuild the simplified geometries.",
+            )
+
+    def _progress(self, result: LoadResult) -> None:
+        self.stdout.write(f"Loaded {result.created + result.updated} regions")
@@ -0,0 +1,128 @@
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from coalition.core.models import TableVersion
+from coalition.regions.models import Region, RegionGeometry
+from coalition.regions.simplify import DEFAULT_ZOOMS, simplify_region
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from collections.abc import Iterable
+    from contextlib import AbstractContextManager
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute simplified region geometries for each map zoom level, "
+        "served by GET /api/regions/?resolution="
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument(
+            "--zoom",
+            type=int,
+            action="append",
+            dest="zooms",
+            help=f"Zoom level to build; repeatable (default: {DEFAULT_ZOOMS})",
+        )
+        parser.add_argument(
+            "--type",
+            choices=[choice for choice, _ in Region.REGION_TYPE_CHOICES],
+            action="append",
+            dest="types",
+            help="Only simplify regions of this type; repeatable (default: all)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes; 1 runs in this process (default: CPU count)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Regions read and written per batch (default: 50)",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        zooms = sorted(set(options["zooms"] or DEFAULT_ZOOMS))
+        if any(not 0 <= zoom <= 22 for zoom in zooms):
+            raise CommandError("Zoom levels must be between 0 and 22")
+        if options["workers"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--workers and --batch-size must be at least 1")
+
+        regions = Region.objects.filter(geom__isnull=False).order_by("id")
+        if options["types"]:
+            regions = regions.filter(type__in=options["types"])
+        rows = regions.values_list("id", "geom").iterator(
+            chunk_size=options["batch_size"],
+        )
+
+        simplified = written = 0
+        with self._executor(options["workers"]) as executor:
+            run = partial(executor.map if executor else map, simplify_region)
+            for batch in batched(rows, options["batch_size"], strict=False):
+                region_ids = [region_id for region_id, _ in batch]
+                wkbs = [bytes(geom.ewkb) for _, geom in batch]
+                results = list(run(region_ids, wkbs, [zooms] * len(batch)))
+                written += self._save(region_ids, zooms, results)
+                simplified += len(batch)
+                self.stdout.write(f"Simplified {simplified} regions")
+
+        if written:
+            TableVersion.bump(RegionGeometry)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {written} geometries for {simplified} regions "
+                f"at zoom levels {', '.join(map(str, zooms))}",
+            ),
+        )
+
+    def _executor(self, workers: int) -> "AbstractContextManager[Executor | None]":
+        """
+        A process pool, or no pool (``None``) when running in this process.
+
+        Workers are spawned rather than forked so that they never inherit this
+        process's open database connection.
+        """
+        if workers == 1:
+            return nullcontext()
+        context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+    @transaction.atomic
+    def _save(
+        self,
+        region_ids: list[int],
+        zooms: list[int],
+        results: "Iterable[list[tuple[int, int, float, str]]]",
+    ) -> int:
+        """
+        Replace the batch's geometries at ``zooms``; returns the number of rows.
+
+        Existing rows are deleted first, so a zoom level at which a region now
+        vanishes doesn't keep serving its old shape.
+        """
+        RegionGeometry.objects.filter(region_id__in=region_ids, zoom__in=zooms).delete()
+        geometries = [
+            RegionGeometry(
+                region_id=region_id,
+                zoom=zoom,
+                tolerance=tolerance,
+                geojson=geojson,
+            )
+            for rows in results
+            for region_id, zoom, tolerance, geojson in rows
+        ]
+        RegionGeometry.objects.bulk_create(geometries)
+        return len(geometries)
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("regions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegionGeometry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("zoom", models.PositiveSmallIntegerField()),
+                (
+                    "tolerance",
+                    models.FloatField(help_text="Simplification tolerance in degrees"),
+                ),
+                ("geojson", models.TextField()),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="simplified_geometries",
+                        to="regions.region",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("region", "zoom"),
+                        name="unique__region__zoom",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("regions", "0002_regiongeometry"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="region",
+            name="type",
+            field=models.CharField(
+                choices=[
+                    ("state", "State"),
+                    ("cd119", "Congressional District 119th Congress"),
+                    ("county", "County"),
+                ],
+                db_index=True,
+                max_length=20,
+            ),
+        ),
+    ]
@@ -6,6 +6,7 @@ class Region(models.Model):
     REGION_TYPE_CHOICES = [
         ("state", "State"),
         ("cd119", "Congressional District 119th Congress"),
+        ("county", "County"),
     ]
 
     parent = models.ForeignKey(
@@ -47,3 +48,33 @@ class Region(models.Model):
 
     def natural_key(self) -> tuple[str]:
         return (self.name,)
+
+
+class RegionGeometry(models.Model):
+    """
+    A simplified copy of a region's geometry for one map zoom level.
+
+    Rows are written by the ``simplify_regions`` management command. The shape
+    is stored as compact GeoJSON text with coordinates rounded to the
+    tolerance, so it can be served without being parsed or re-encoded.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="simplified_geometries",
+    )
+    zoom = models.PositiveSmallIntegerField()
+    tolerance = models.FloatField(help_text="Simplification tolerance in degrees")
+    geojson = models.TextField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["region", "zoom"],
+                name="unique__region__zoom",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.region} (zoom {self.zoom})"
@@ -0,0 +1,107 @@
+"""
+Multi-resolution simplification of region geometries.
+
+Each zoom level gets a tolerance of about one screen pixel at that zoom, and
+coordinates are rounded to the decimal places that tolerance can resolve, so
+low-zoom payloads are a small fraction of the full-resolution shape. This
+module only depends on GEOS (not the ORM), so ``simplify_region`` can run in
+worker processes of the ``simplify_regions`` management command.
+"""
+
+import json
+import math
+from collections.abc import Iterable, Sequence
+
+from django.contrib.gis.geos import GEOSGeometry, MultiPolygon, Polygon
+
+DEFAULT_ZOOMS = (3, 6, 9, 12)
+
+# Width in pixels of a web map tile; one tile spans 360 degrees at zoom 0
+TILE_SIZE = 256
+
+_Ring = list[list[float]]
+
+
+def zoom_tolerance(zoom: int) -> float:
+    """Simplification tolerance, in degrees, of one pixel at ``zoom``"""
+    return 360 / (TILE_SIZE * 2**zoom)
+
+
+def coordinate_precision(tolerance: float) -> int:
+    """Decimal places that keep rounding error well below ``tolerance``"""
+    return max(0, math.ceil(-math.log10(tolerance / 10)))
+
+
+def _round_ring(coords: Iterable[Sequence[float]], digits: int) -> _Ring | None:
+    """Round a ring's coordinates, or return None if it collapses"""
+    ring: _Ring = []
+    for x, y, *_ in coords:
+        point = [round(x, digits), round(y, digits)]
+        if not ring or point != ring[-1]:
+            ring.append(point)
+    # A valid linear ring has at least three distinct points plus the closing one
+    return ring if len(ring) >= 4 and ring[0] == ring[-1] else None
+
+
+def _polygon_coordinates(polygon: Polygon, digits: int) -> list[_Ring] | None:
+    exterior, *interiors = polygon.coords
+    shell = _round_ring(exterior, digits)
+    if shell is None:
+        return None
+    holes = (_round_ring(ring, digits) for ring in interiors)
+    return [shell, *(hole for hole in holes if hole is not None)]
+
+
+def _polygons(geom: GEOSGeometry) -> list[Polygon]:
+    if isinstance(geom, Polygon):
+        return [geom]
+    if isinstance(geom, MultiPolygon):
+        return list(geom)
+    return []
+
+
+def simplified_geojson(geom: GEOSGeometry, tolerance: float) -> str | None:
+    """
+    Simplify ``geom`` and encode it as a compact GeoJSON MultiPolygon.
+
+    Simplification preserves the topology of each polygon (rings never
+    collapse or cross), and parts smaller than a pixel are dropped unless
+    nothing else would be left. Returns None for an empty result.
+    """
+    simplified = geom.simplify(tolerance, preserve_topology=True)
+    polygons = _polygons(simplified)
+    visible = [p for p in polygons if p.area >= tolerance**2]
+    if not visible and polygons:
+        visible = [max(polygons, key=lambda p: p.area)]
+
+    digits = coordinate_precision(tolerance)
+    parts = (_polygon_coordinates(polygon, digits) for polygon in visible)
+    coordinates = [part for part in parts if part is not None]
+    if not coordinates:
+        return None
+    return json.dumps(
+        {"type": "MultiPolygon", "coordinates": coordinates},
+        separators=(",", ":"),
+    )
+
+
+def simplify_region(
+    region_id: int,
+    wkb: bytes,
+    zooms: Sequence[int] = DEFAULT_ZOOMS,
+) -> list[tuple[int, int, float, str]]:
+    """
+    Simplify one region's geometry for each zoom level.
+
+    ``wkb`` is the (E)WKB of the full-resolution geometry. Returns
+    ``(region_id, zoom, tolerance, geojson)`` rows; zoom levels at which the
+    region vanishes entirely are omitted.
+    """
+    geom = GEOSGeometry(memoryview(wkb))
+    rows = []
+    for zoom in zooms:
+        tolerance = zoom_tolerance(zoom)
+        geojson = simplified_geojson(geom, tolerance)
+        if geojson is not None:
+            rows.append((region_id, zoom, tolerance, geojson))
+    return rows
@@ -0,0 +1,621 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.gis.gdal import DataSource
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from coalition.core.cache import cache_clear
+from coalition.core.formatting import ordinal
+from coalition.core.models import TableVersion
+
+from .gazetteer import Gazetteer, get_gazetteer, normalize_county
+from .loader import LoadResult, read_regions
+from .locate import RegionBox, get_region_boxes
+from .models import Region, RegionGeometry
+from .simplify import (
+    coordinate_precision,
+    simplified_geojson,
+    simplify_region,
+    zoom_tolerance,
+)
+from .tiles import (
+    WORLD_HALF,
+    encode_polygon_geometry,
+    encode_tile,
+    get_tile,
+    is_valid_tile,
+    tile_bounds,
+)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _read_fields(data: bytes) -> list[tuple[int, int | bytes]]:
+    """Minimal protobuf reader for varint and length-delimited fields"""
+    fields = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        else:
+            length, pos = _read_varint(data, pos)
+            value, pos = data[pos : pos + length], pos + length
+        fields.append((number, value))
+    return fields
+
+
+def _decode_rings(commands: list[int]) -> list[list[tuple[int, int]]]:
+    """Decode polygon commands back into rings of absolute tile coordinates"""
+    rings: list[list[tuple[int, int]]] = []
+    x = y = pos = 0
+    while pos < len(commands):
+        command, count = commands[pos] & 7, commands[pos] >> 3
+        pos += 1
+        if command == 7:
+            continue
+        if command == 1:
+            rings.append([])
+        for _ in range(count):
+            dx, dy = commands[pos], commands[pos + 1]
+            x += (dx >> 1) ^ -(dx & 1)
+            y += (dy >> 1) ^ -(dy & 1)
+            rings[-1].append((x, y))
+            pos += 2
+    return rings
+
+
+def _area(ring: list[tuple[int, int]]) -> int:
+    return sum(
+        x1 * y2 - x2 * y1
+        for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1], strict=True)
+    )
+
+
+class TileEncodingTest(SimpleTestCase):
+    # Square covering the north-east quarter of the world's north-east quarter
+    square = Polygon.from_bbox((0, 0, WORLD_HALF / 2, WORLD_HALF / 2))
+
+    def test_tile_bounds(self) -> None:
+        """Test XYZ to Web Mercator bounds"""
+        assert tile_bounds(0, 0, 0) == (
+            -WORLD_HALF,
+            -WORLD_HALF,
+            WORLD_HALF,
+            WORLD_HALF,
+        )
+        assert tile_bounds(1, 0, 0) == (-WORLD_HALF, 0, 0, WORLD_HALF)
+        assert is_valid_tile(1, 1, 1)
+        assert not is_valid_tile(1, 2, 0)
+
+    def test_polygon_commands(self) -> None:
+        """Test MoveTo/LineTo/ClosePath encoding with zigzag deltas"""
+        commands = encode_polygon_geometry(self.square, tile_bounds(0, 0, 0))
+
+        assert commands == [9, 4096, 4096, 26, 0, 2047, 2048, 0, 0, 2048, 15]
+
+    def test_winding_order(self) -> None:
+        """Test that exterior rings come out clockwise and holes anticlockwise"""
+        reversed_square = Polygon(self.square.exterior_ring.coords[::-1])
+        quarter = WORLD_HALF / 4
+        with_hole = Polygon(
+            self.square.exterior_ring,
+            Polygon.from_bbox((quarter / 2, quarter / 2, quarter, quarter))[0],
+        )
+
+        (exterior,) = _decode_rings(
+            encode_polygon_geometry(reversed_square, tile_bounds(0, 0, 0)),
+        )
+        assert _area(exterior) > 0
+        outer, hole = _decode_rings(
+            encode_polygon_geometry(with_hole, tile_bounds(0, 0, 0)),
+        )
+        assert _area(outer) > 0
+        assert _area(hole) < 0
+
+    def test_collapsed_rings_are_dropped(self) -> None:
+        """Test that polygons smaller than a tile pixel produce no geometry"""
+        tiny = Polygon.from_bbox((0, 0, 1, 1))
+
+        assert encode_polygon_geometry(tiny, tile_bounds(0, 0, 0)) == []
+        assert encode_tile([(1, tiny, {})], tile_bounds(0, 0, 0)) == b""
+
+    def test_encode_tile(self) -> None:
+        """Test the layer, feature id, tags and property tables"""
+        tile = encode_tile(
+            [(7, MultiPolygon(self.square), {"name": "Maryland", "label": None})],
+            tile_bounds(0, 0, 0),
+        )
+
+        ((number, layer),) = _read_fields(tile)
+        assert number == 3
+        layer_fields = _read_fields(layer)
+        assert (15, 2) in layer_fields
+        assert (1, b"regions") in layer_fields
+        assert (3, b"name") in layer_fields
+        assert (4, b"\n\x08Maryland") in layer_fields
+        assert (5, 4096) in layer_fields
+        feature = dict(_read_fields(next(v for n, v in layer_fields if n == 2)))
+        assert feature[1] == 7
+        assert feature[2] == b"\x00\x00"
+        assert feature[3] == 3
+
+
+class TileCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        override = override_settings(REGION_TILE_CACHE_DIR=self.cache_dir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    @patch("coalition.regions.tiles.render_tile", return_value=b"tile")
+    def test_tiles_cached_per_version(self, render_tile: "patch") -> None:
+        """Test that tiles are rendered once per regions table version"""
+        assert get_tile(3, 1, 2, ["state"]) == b"tile"
+        assert get_tile(3, 1, 2, ["state"]) == b"tile"
+        assert render_tile.call_count == 1
+        assert (Path(self.cache_dir.name) / "v0/state/3/1/2.mvt").exists()
+
+        TableVersion.bump(Region)
+        get_tile(3, 1, 2, ["state"])
+
+        assert render_tile.call_count == 2
+        assert not (Path(self.cache_dir.name) / "v0").exists()
+        assert (Path(self.cache_dir.name) / "v1/state/3/1/2.mvt").exists()
+
+    @patch("coalition.regions.tiles.render_tile", return_value=b"tile")
+    def test_stale_version_keeps_newer_tiles(self, render_tile: "patch") -> None:
+        """Test that a request holding an old version doesn't prune newer ones"""
+        TableVersion.bump(Region)
+        get_tile(3, 1, 2, ["state"])
+
+        get_tile(3, 1, 2, ["state"], version=0)
+
+        assert render_tile.call_count == 2
+        assert (Path(self.cache_dir.name) / "v1/state/3/1/2.mvt").exists()
+
+    @patch("coalition.regions.tiles.tempfile.mkstemp", side_effect=FileNotFoundError)
+    @patch("coalition.regions.tiles.render_tile", return_value=b"tile")
+    def test_write_failure_serves_tile(
+        self,
+        render_tile: "patch",
+        mkstemp: "patch",
+    ) -> None:
+        """Test that a tile that can't be cached is still returned"""
+        with self.assertLogs("coalition.regions.tiles", "WARNING"):
+            assert get_tile(3, 1, 2, ["state"]) == b"tile"
+
+        render_tile.assert_called_once()
+        mkstemp.assert_called_once()
+
+    @patch("coalition.regions.tiles.render_tile", return_value=b"")
+    def test_cache_disabled(self, render_tile: "patch") -> None:
+        """Test that an empty REGION_TILE_CACHE_DIR renders every request"""
+        with self.settings(REGION_TILE_CACHE_DIR=""):
+            get_tile(0, 0, 0, ["state"])
+            get_tile(0, 0, 0, ["state"])
+
+        assert render_tile.call_count == 2
+
+
+class SimplifyTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.circle = Point(-76.5, 38.9).buffer(1, quadsegs=64)
+
+    def test_tolerance_per_zoom(self) -> None:
+        """Test that tolerance is one pixel and halves with each zoom level"""
+        assert zoom_tolerance(0) == 360 / 256
+        assert zoom_tolerance(4) == zoom_tolerance(3) / 2
+        assert coordinate_precision(zoom_tolerance(3)) == 2
+        assert coordinate_precision(zoom_tolerance(12)) == 5
+
+    def test_fewer_points_at_lower_zoom(self) -> None:
+        """Test that lower zoom levels produce smaller geometries"""
+        rows = simplify_region(7, bytes(MultiPolygon(self.circle).ewkb), [3, 12])
+
+        assert [(region_id, zoom) for region_id, zoom, _, _ in rows] == [
+            (7, 3),
+            (7, 12),
+        ]
+        coarse, fine = (json.loads(geojson) for *_, geojson in rows)
+        assert coarse["type"] == "MultiPolygon"
+        assert len(coarse["coordinates"][0][0]) < len(fine["coordinates"][0][0])
+        assert len(rows[0][3]) < len(rows[1][3])
+
+    def test_coordinates_rounded(self) -> None:
+        """Test that coordinates are rounded to the tolerance's precision"""
+        geojson = json.loads(simplified_geojson(self.circle, zoom_tolerance(3)))
+        ring = geojson["coordinates"][0][0]
+
+        assert ring[0] == ring[-1]
+        assert all(round(x, 2) == x and round(y, 2) == y for x, y in ring)
+
+    def test_subpixel_parts_dropped(self) -> None:
+        """Test that parts smaller than a pixel are left out"""
+        island = Polygon.from_bbox((-75.001, 38.001, -75.0, 38.002))
+        geom = MultiPolygon(self.circle, island)
+
+        coarse = json.loads(simplified_geojson(geom, zoom_tolerance(3)))
+        fine = json.loads(simplified_geojson(geom, zoom_tolerance(16)))
+
+        assert len(coarse["coordinates"]) == 1
+        assert len(fine["coordinates"]) == 2
+
+    def test_tiny_region_kept(self) -> None:
+        """Test that a region smaller than a pixel keeps its largest part"""
+        tiny = Polygon.from_bbox((-75.001, 38.001, -75.0, 38.002))
+
+        assert simplified_geojson(tiny, zoom_tolerance(3)) is None
+        geojson = json.loads(simplified_geojson(tiny, zoom_tolerance(10)))
+        assert len(geojson["coordinates"]) == 1
+
+
+class SimplifyRegionsCommandTest(TestCase):
+    def setUp(self) -> None:
+        self.state = Region.objects.create(
+            name="Maryland",
+            geoid="24",
+            type="state",
+            geom=MultiPolygon(Point(-76.5, 38.9).buffer(1), srid=4326),
+        )
+        self.district = Region.objects.create(
+            name="MD-01",
+            geoid="2401",
+            type="cd119",
+            geom=MultiPolygon(Point(-76, 38.5).buffer(0.5), srid=4326),
+        )
+
+    def _run(self, *args: str) -> None:
+        call_command("simplify_regions", "--workers=1", *args, stdout=StringIO())
+
+    def test_builds_each_zoom(self) -> None:
+        """Test that every region gets one geometry per zoom level"""
+        self._run("--zoom=3", "--zoom=9")
+
+        rows = RegionGeometry.objects.values_list("region__name", "zoom")
+        assert sorted(rows) == [
+            ("MD-01", 3),
+            ("MD-01", 9),
+            ("Maryland", 3),
+            ("Maryland", 9),
+        ]
+        assert TableVersion.get_version(RegionGeometry) >= 1
+
+    def test_rerun_replaces(self) -> None:
+        """Test that running again updates rows instead of duplicating them"""
+        self._run("--zoom=6")
+        self.state.geom = MultiPolygon(Point(-76.5, 38.9).buffer(2), srid=4326)
+        self.state.save()
+        before = RegionGeometry.objects.get(region=self.state).geojson
+
+        self._run("--zoom=6")
+
+        assert RegionGeometry.objects.count() == 2
+        assert RegionGeometry.objects.get(region=self.state).geojson != before
+
+    def test_rerun_drops_vanished_zoom(self) -> None:
+        """Test that a zoom level at which a region now vanishes loses its row"""
+        self._run("--zoom=3", "--zoom=10")
+        self.state.geom = MultiPolygon(
+            Polygon.from_bbox((-75.001, 38.001, -75.0, 38.002)),
+            srid=4326,
+        )
+        self.state.save()
+
+        self._run("--zoom=3", "--zoom=10")
+
+        rows = RegionGeometry.objects.filter(region=self.state)
+        assert list(rows.values_list("zoom", flat=True)) == [10]
+
+    def test_rerun_keeps_other_zooms(self) -> None:
+        """Test that rebuilding some zoom levels leaves the others alone"""
+        self._run("--zoom=3", "--zoom=9")
+        self._run("--zoom=9")
+
+        assert RegionGeometry.objects.filter(zoom=3).count() == 2
+
+    def test_type_filter(self) -> None:
+        """Test that --type limits which regions are simplified"""
+        self._run("--zoom=6", "--type=cd119")
+
+        assert list(RegionGeometry.objects.values_list("region", flat=True)) == [
+            self.district.id,
+        ]
+
+
+def _feature(properties: dict, bbox: tuple[float, float, float, float]) -> dict:
+    return {
+        "type": "Feature",
+        "properties": properties,
+        "geometry": json.loads(Polygon.from_bbox(bbox).json),
+    }
+
+
+class RegionFileTestMixin:
+    """Writes TIGER-like GeoJSON files, which GDAL reads like a shapefile"""
+
+    def write_layer(self, *features: dict) -> str:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = Path(tmp.name) / "regions.geojson"
+        path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+        return str(path)
+
+    def states_layer(self) -> str:
+        return self.write_layer(
+            _feature(
+                {
+                    "GEOID": "24",
+                    "NAME": "Maryland",
+                    "STUSPS": "MD",
+                    "INTPTLAT": "+38.9466584",
+                    "INTPTLON": "-076.6744939",
+                },
+                (-79.5, 37.9, -75.0, 39.7),
+            ),
+            _feature(
+                {"GEOID": "10", "NAME": "Delaware", "STUSPS": "DE"},
+                (-75.8, 38.4, -75.0, 39.8),
+            ),
+        )
+
+    def districts_layer(self) -> str:
+        return self.write_layer(
+            _feature(
+                {"GEOID": "2401", "STATEFP": "24", "CD119FP": "01"},
+                (-76.5, 37.9, -75.0, 39.7),
+            ),
+            _feature(
+                {"GEOID": "1000", "STATEFP": "10", "CD119FP": "00"},
+                (-75.8, 38.4, -75.0, 39.8),
+            ),
+            _feature(
+                {"GEOID": "24ZZ", "STATEFP": "24", "CD119FP": "ZZ"},
+                (-76.0, 38.0, -75.9, 38.1),
+            ),
+            _feature(
+                {"GEOID": "5101", "STATEFP": "51", "CD119FP": "01"},
+                (-77.0, 37.0, -76.0, 38.0),
+            ),
+        )
+
+    def counties_layer(self) -> str:
+        return self.write_layer(
+            _feature(
+                {
+                    "GEOID": "24003",
+                    "STATEFP": "24",
+                    "NAME": "Anne Arundel",
+                    "NAMELSAD": "Anne Arundel County",
+                },
+                (-76.8, 38.7, -76.4, 39.2),
+            ),
+            _feature(
+                {"GEOID": "51001", "STATEFP": "51", "NAMELSAD": "Accomack County"},
+                (-75.9, 37.5, -75.2, 38.0),
+            ),
+        )
+
+
+class ReadRegionsTest(RegionFileTestMixin, SimpleTestCase):
+    def test_ordinal(self) -> None:
+        """Test English ordinal suffixes"""
+        assert [ordinal(n) for n in (1, 2, 3, 4, 11, 12, 13, 21, 22, 52)] == [
+            "1st",
+            "2nd",
+            "3rd",
+            "4th",
+            "11th",
+            "12th",
+            "13th",
+            "21st",
+            "22nd",
+            "52nd",
+        ]
+
+    def test_states(self) -> None:
+        """Test that states are read with a label and an internal point"""
+        layer = DataSource(self.states_layer())[0]
+        result = LoadResult()
+
+        maryland, delaware = read_regions(layer, "state", {}, set(), result)
+
+        assert (maryland.geoid, maryland.name, maryland.label) == (
+            "24",
+            "Maryland",
+            "MD",
+        )
+        assert isinstance(maryland.geom, MultiPolygon)
+        assert maryland.geom.srid == 4326
+        assert maryland.coords.coords == (-76.6744939, 38.9466584)
+        # Without INTPTLAT/INTPTLON, the internal point is computed
+        assert delaware.geom.contains(delaware.coords)
+
+    def test_districts(self) -> None:
+        """Test district naming, parent links and skipped features"""
+        layer = DataSource(self.districts_layer())[0]
+        states = {
+            "24": Region(id=1, geoid="24", name="Maryland", label="MD"),
+            "10": Region(id=2, geoid="10", name="Delaware", label="DE"),
+        }
+        result = LoadResult()
+
+        districts = list(read_regions(layer, "cd119", states, set(), result))
+
+        assert [(d.name, d.label, d.parent_id) for d in districts] == [
+            ("MD-01", "Maryland 1st", 1),
+            ("DE-AL", "Delaware At-Large", 2),
+        ]
+        assert result.skipped == 2
+        assert result.missing_states == {"51"}
+
+    def test_counties(self) -> None:
+        """Test county naming and parent links"""
+        layer = DataSource(self.counties_layer())[0]
+        states = {"24": Region(id=1, geoid="24", name="Maryland", label="MD")}
+        result = LoadResult()
+
+        (county,) = read_regions(layer, "county", states, set(), result)
+
+        assert (county.name, county.label, county.parent_id) == (
+            "Anne Arundel County, MD",
+            "Anne Arundel County",
+            1,
+        )
+        assert result.missing_states == {"51"}
+
+    def test_skip_existing(self) -> None:
+        """Test that GEOIDs already loaded are skipped"""
+        layer = DataSource(self.states_layer())[0]
+        result = LoadResult()
+
+        regions = list(read_regions(layer, "state", {}, {"24"}, result))
+
+        assert [region.geoid for region in regions] == ["10"]
+        assert result.skipped == 1
+
+
+class LoadRegionsCommandTest(RegionFileTestMixin, TestCase):
+    def _run(self, *args: str) -> str:
+        out = StringIO()
+        call_command("load_regions", *args, stdout=out, stderr=StringIO())
+        return out.getvalue()
+
+    def test_load_states_then_districts(self) -> None:
+        """Test loading both region types with parent links"""
+        self._run(self.states_layer(), "--type=state")
+        self._run(self.districts_layer(), "--type=cd119", "--batch-size=1")
+
+        maryland = Region.objects.get(geoid="24", type="state")
+        district = Region.objects.get(geoid="2401", type="cd119")
+        assert district.parent == maryland
+        assert district.name == "MD-01"
+        assert Region.objects.filter(type="cd119").count() == 2
+        assert TableVersion.get_version(Region) >= 2
+
+    def test_resume(self) -> None:
+        """Test that a second run skips regions that were already loaded"""
+        Region.objects.create(geoid="24", name="Maryland", label="MD", type="state")
+
+        output = self._run(self.states_layer(), "--type=state")
+
+        assert "Created 1, updated 0 and skipped 1" in output
+        assert Region.objects.get(geoid="24").geom is None
+
+    def test_replace(self) -> None:
+        """Test that --replace updates regions that already exist"""
+        Region.objects.create(geoid="24", name="Old name", type="state")
+
+        self._run(self.states_layer(), "--type=state", "--replace")
+
+        maryland = Region.objects.get(geoid="24")
+        assert maryland.name == "Maryland"
+        assert maryland.geom is not None
+        assert maryland.geojson["type"] == "MultiPolygon"
+
+    def test_missing_file(self) -> None:
+        """Test that an unreadable file is reported as a command error"""
+        with self.assertRaises(CommandError):
+            self._run("/nonexistent/regions.shp", "--type=state")
+
+
+class RegionBoxesTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+
+    @patch("coalition.regions.locate.build_region_boxes", return_value=[])
+    def test_rebuilt_when_regions_version_changes(self, build: "patch") -> None:
+        """Test that a load elsewhere is seen without an explicit invalidate"""
+        assert get_region_boxes() == []
+        assert get_region_boxes() == []
+        assert build.call_count == 1
+
+        # What load_regions does after bulk_create, possibly in another process
+        TableVersion.bump(Region)
+        build.return_value = [RegionBox(1, 0, 0, 10, 10)]
+
+        assert get_region_boxes() == [RegionBox(1, 0, 0, 10, 10)]
+        assert build.call_count == 2
+
+
+class GazetteerTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.gazetteer = Gazetteer(
+            states={"MD": (-76.7, 38.9)},
+            counties={
+                ("MD", "anne arundel"): (-76.6, 39.0),
+                ("MD", "baltimore city"): (-76.6, 39.3),
+            },
+        )
+
+    def test_normalize_county(self) -> None:
+        """Test that case, spacing and the area description are ignored"""
+        assert normalize_county("  Anne  ARUNDEL County ") == "anne arundel"
+        assert normalize_county("Orleans Parish") == "orleans"
+        assert normalize_county("Baltimore city") == "baltimore city"
+
+    def test_locate_county(self) -> None:
+        """Test that a known county gives its internal point"""
+        point, precision = self.gazetteer.locate("md", "Anne Arundel County")
+
+        assert point.coords == (-76.6, 39.0)
+        assert point.srid == 4326
+        assert precision == "county"
+
+    def test_locate_state_fallback(self) -> None:
+        """Test that a blank or unknown county falls back to the state"""
+        assert self.gazetteer.locate("MD", "")[1] == "state"
+        assert self.gazetteer.locate("MD", "Nowhere")[0].coords == (-76.7, 38.9)
+
+    def test_locate_unknown_state(self) -> None:
+        """Test that an unknown state is not placed"""
+        assert self.gazetteer.locate("ZZ", "Anne Arundel") == (None, "")
+
+
+class GazetteerCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        self.state = Region.objects.create(
+            geoid="24",
+            name="Maryland",
+            label="MD",
+            type="state",
+            coords=Point(-76.7, 38.9, srid=4326),
+        )
+
+    def test_rebuilt_after_region_change(self) -> None:
+        """Test that the cached gazetteer follows the regions table version"""
+        assert get_gazetteer().counties == {}
+
+        # As load_regions does, possibly in another process: no model signals
+        Region.objects.bulk_create(
+            [
+                Region(
+                    geoid="24003",
+                    name="Anne Arundel County, MD",
+                    label="Anne Arundel County",
+                    type="county",
+                    parent=self.state,
+                    coords=Point(-76.6, 39.0, srid=4326),
+                ),
+            ],
+        )
+        TableVersion.bump(Region)
+
+        assert get_gazetteer().counties == {("MD", "anne arundel"): (-76.6, 39.0)}
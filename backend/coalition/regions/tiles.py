@@ -0,0 +1,395 @@
+"""
+Mapbox Vector Tiles for regions.
+
+On PostGIS a tile is built entirely in the database with ``ST_AsMVT``. Other
+spatial backends (SpatiaLite in development) clip and reproject the shapes in
+the database and encode the tile with the small protobuf writer below.
+Rendered tiles are written to ``REGION_TILE_CACHE_DIR`` under the current
+``TableVersion`` of the regions table, so any change to a region starts a
+fresh cache and serving a known tile is a single file read.
+"""
+
+import logging
+import os
+import shutil
+import struct
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.gis.db.models.functions import Intersection, Transform
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.db import connection
+
+from coalition.core.models import TableVersion
+
+from .models import Region
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.contrib.gis.geos import GEOSGeometry
+
+logger = logging.getLogger(__name__)
+
+LAYER_NAME = "regions"
+EXTENT = 4096
+# Tile-space buffer (in EXTENT units) so that polygon edges just outside the
+# tile don't render as seams between neighbouring tiles
+BUFFER = 64
+MAX_ZOOM = 22
+
+# Half the width of the Web Mercator (EPSG:3857) world, in metres
+WORLD_HALF = 20037508.342789244
+
+# Columns copied into each feature's properties; "id" becomes the feature id
+TILE_PROPERTIES = ("geoid", "name", "label", "type")
+
+_MOVE_TO = 1
+_LINE_TO = 2
+_CLOSE_PATH = 7
+_POLYGON = 3
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """Web Mercator bounds ``(xmin, ymin, xmax, ymax)`` of an XYZ tile"""
+    size = 2 * WORLD_HALF / 2**z
+    xmin = -WORLD_HALF + x * size
+    ymax = WORLD_HALF - y * size
+    return xmin, ymax - size, xmin + size, ymax
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2**z and 0 <= y < 2**z
+
+
+# -- Protobuf encoding (vector_tile.proto, version 2) ------------------------
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _field(number: int, payload: bytes) -> bytes:
+    """A length-delimited field"""
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    return _varint(number << 3) + _varint(value)
+
+
+def _packed(number: int, values: Iterable[int]) -> bytes:
+    return _field(number, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value: "Any") -> bytes:
+    if isinstance(value, bool):
+        return _uint_field(7, int(value))
+    if isinstance(value, int):
+        return _varint(6 << 3) + _varint(_zigzag(value))
+    if isinstance(value, float):
+        return _varint(3 << 3 | 1) + struct.pack("<d", value)
+    return _field(1, str(value).encode())
+
+
+def _ring_area(ring: list[tuple[int, int]]) -> int:
+    """Twice the signed area (surveyor's formula) of a closed ring"""
+    return sum(
+        x1 * y2 - x2 * y1
+        for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1], strict=True)
+    )
+
+
+def _tile_ring(
+    coords: "Iterable[tuple[float, ...]]",
+    bounds: tuple[float, float, float, float],
+    exterior: bool,
+) -> list[tuple[int, int]] | None:
+    """Project a ring into tile space, or None if it collapses to nothing"""
+    xmin, ymin, xmax, ymax = bounds
+    sx = EXTENT / (xmax - xmin)
+    sy = EXTENT / (ymax - ymin)
+    ring: list[tuple[int, int]] = []
+    for x, y, *_ in coords:
+        point = (round((x - xmin) * sx), round((ymax - y) * sy))
+        if not ring or point != ring[-1]:
+            ring.append(point)
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+
+    area = _ring_area(ring) if len(ring) >= 3 else 0
+    if area == 0:
+        return None
+    # With y pointing down, exterior rings must have positive area (clockwise
+    # on screen) and interior rings negative area
+    if (area > 0) != exterior:
+        ring.reverse()
+    return ring
+
+
+def encode_polygon_geometry(
+    geom: "GEOSGeometry",
+    bounds: tuple[float, float, float, float],
+) -> list[int]:
+    """
+    Encode a (multi)polygon as an MVT command sequence.
+
+    ``geom`` must be in the same projection as ``bounds``; rings that collapse
+    at this tile resolution are dropped.
+    """
+    polygons = geom if isinstance(geom, MultiPolygon) else [geom]
+    commands: list[int] = []
+    cursor = (0, 0)
+    for polygon in polygons:
+        for i, coords in enumerate(polygon):
+            ring = _tile_ring(coords, bounds, exterior=i == 0)
+            if ring is None:
+                if i == 0:
+                    break
+                continue
+            first, *rest = ring
+            commands += [
+                _MOVE_TO | 1 << 3,
+                _zigzag(first[0] - cursor[0]),
+                _zigzag(first[1] - cursor[1]),
+            ]
+            commands.append(_LINE_TO | len(rest) << 3)
+            previous = first
+            for point in rest:
+                commands += [
+                    _zigzag(point[0] - previous[0]),
+                    _zigzag(point[1] - previous[1]),
+                ]
+                previous = point
+            commands.append(_CLOSE_PATH | 1 << 3)
+            cursor = previous
+    return commands
+
+
+def encode_tile(
+    features: "Iterable[tuple[int, GEOSGeometry, dict[str, Any]]]",
+    bounds: tuple[float, float, float, float],
+    layer_name: str = LAYER_NAME,
+) -> bytes:
+    """Encode ``(id, geometry, properties)`` features as a one-layer tile"""
+    keys: dict[str, int] = {}
+    values: dict[tuple[type, Any], int] = {}
+    encoded_features = []
+    for feature_id, geom, properties in features:
+        geometry = encode_polygon_geometry(geom, bounds)
+        if not geometry:
+            continue
+        tags = []
+        for key, value in properties.items():
+            if value is None:
+                continue
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault((type(value), value), len(values)))
+        encoded_features.append(
+            _field(
+                2,
+                _uint_field(1, feature_id)
+                + _packed(2, tags)
+                + _uint_field(3, _POLYGON)
+                + _packed(4, geometry),
+            ),
+        )
+
+    if not encoded_features:
+        return b""
+    layer = (
+        _uint_field(15, 2)
+        + _field(1, layer_name.encode())
+        + b"".join(encoded_features)
+        + b"".join(_field(3, key.encode()) for key in keys)
+        + b"".join(_field(4, _encode_value(value)) for _, value in values)
+        + _uint_field(5, EXTENT)
+    )
+    return _field(3, layer)
+
+
+# -- Rendering ---------------------------------------------------------------
+
+
+_POSTGIS_TILE_SQL = """
+WITH bounds AS (
+    SELECT
+        ST_TileEnvelope(%(z)s, %(x)s, %(y)s) AS geom,
+        -- Widened by the buffer, so shapes just outside the tile are clipped
+        -- into its margin rather than skipped
+        ST_Transform(
+            ST_TileEnvelope(%(z)s, %(x)s, %(y)s, margin => %(margin)s), 4326
+        ) AS search
+), features AS (
+    SELECT
+        ST_AsMVTGeom(
+            ST_Transform(r.geom, 3857), bounds.geom, %(extent)s, %(buffer)s, true
+        ) AS geom,
+        r.id, r.geoid, r.name, r.label, r.type
+    FROM {table} AS r, bounds
+    WHERE r.geom && bounds.search
+      AND r.type = ANY(%(types)s)
+)
+SELECT ST_AsMVT(features.*, %(layer)s, %(extent)s, 'geom', 'id')
+FROM features
+WHERE geom IS NOT NULL
+"""
+
+
+def _render_postgis(z: int, x: int, y: int, types: list[str]) -> bytes:
+    sql = _POSTGIS_TILE_SQL.format(
+        table=connection.ops.quote_name(Region._meta.db_table),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql,
+            {
+                "z": z,
+                "x": x,
+                "y": y,
+                "types": types,
+                "extent": EXTENT,
+                "buffer": BUFFER,
+                "margin": BUFFER / EXTENT,
+                "layer": LAYER_NAME,
+            },
+        )
+        (tile,) = cursor.fetchone()
+    return bytes(tile or b"")
+
+
+def _render_python(z: int, x: int, y: int, types: list[str]) -> bytes:
+    bounds = tile_bounds(z, x, y)
+    pad = (bounds[2] - bounds[0]) * BUFFER / EXTENT
+    clip = Polygon.from_bbox(
+        (bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad),
+    )
+    clip.srid = 3857
+    clip.transform(4326)
+
+    regions = (
+        Region.objects.filter(type__in=types, geom__intersects=clip)
+        .annotate(tile_geom=Transform(Intersection("geom", clip), 3857))
+        .values_list("id", "tile_geom", *TILE_PROPERTIES)
+        .order_by("id")
+    )
+    features = []
+    for region_id, geom, *properties in regions:
+        if geom is None or geom.empty:
+            continue
+        polygons = list(_polygons(geom))
+        if polygons:
+            features.append(
+                (
+                    region_id,
+                    MultiPolygon(polygons),
+                    dict(zip(TILE_PROPERTIES, properties, strict=True)),
+                ),
+            )
+    return encode_tile(features, bounds)
+
+
+def _polygons(geom: "GEOSGeometry") -> "Iterable[Polygon]":
+    """Yield the polygons of a clip result, which may be a mixed collection"""
+    if isinstance(geom, Polygon):
+        yield geom
+    elif geom.geom_type in ("MultiPolygon", "GeometryCollection"):
+        for part in geom:
+            yield from _polygons(part)
+
+
+def render_tile(z: int, x: int, y: int, types: list[str]) -> bytes:
+    """Render one tile of the given region types; empty tiles are ``b""``"""
+    if getattr(connection.ops, "postgis", False):
+        return _render_postgis(z, x, y, types)
+    return _render_python(z, x, y, types)
+
+
+# -- Disk cache --------------------------------------------------------------
+
+
+def _cache_root() -> Path | None:
+    return (
+        Path(settings.REGION_TILE_CACHE_DIR) if settings.REGION_TILE_CACHE_DIR else None
+    )
+
+
+def _prune_old_versions(root: Path, version: int) -> None:
+    """
+    Remove tile directories left behind by earlier data versions.
+
+    A request can still be holding a version that has since been bumped, so
+    only directories older than ``version`` are removed; newer ones belong to
+    requests that are already serving the current data.
+    """
+    for entry in root.iterdir():
+        name = entry.name
+        if name.startswith("v") and name[1:].isdigit() and int(name[1:]) < version:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def _write_tile(path: Path, tile: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file and rename it into place, so concurrent
+    # readers never see a partial tile
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(tile)
+        Path(tmp).replace(path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def get_tile(
+    z: int,
+    x: int,
+    y: int,
+    types: list[str],
+    version: int | None = None,
+) -> bytes:
+    """
+    Return a tile, reading it from the disk cache when possible.
+
+    Pass the regions ``TableVersion`` if it is already known, to save a query.
+    """
+    root = _cache_root()
+    if root is None:
+        return render_tile(z, x, y, types)
+
+    if version is None:
+        version = TableVersion.get_version(Region)
+    version_dir = root / f"v{version}"
+    path = version_dir / "-".join(sorted(types)) / str(z) / str(x) / f"{y}.mvt"
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    tile = render_tile(z, x, y, types)
+    try:
+        if not version_dir.exists():
+            root.mkdir(parents=True, exist_ok=True)
+            _prune_old_versions(root, version)
+        _write_tile(path, tile)
+    except OSError:
+        # Caching is best effort: the directory may have been pruned by a
+        # request that saw a newer version, or the disk may be full
+        logger.warning("Could not cache region tile %s", path, exc_info=True)
+    return tile
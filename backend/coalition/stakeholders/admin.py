@@ -1,11 +1,128 @@
-from django.contrib import admin
+from typing import TYPE_CHECKING
 
-from .models import Stakeholder
+from django.contrib import admin, messages
+from django.db.models import Count, Prefetch
+
+from .dedupe import merge_stakeholders
+from .models import DuplicateGroup, Stakeholder
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django.db.models import Model, QuerySet
+    from django.http import HttpRequest
+
+
+def _merge_into_oldest(stakeholders: "QuerySet[Stakeholder]") -> int:
+    """Merge stakeholders into the one created first; returns the number merged"""
+    oldest, *duplicates = stakeholders.order_by("created_at", "id")
+    return merge_stakeholders(oldest, duplicates)
 
 
 @admin.register(Stakeholder)
 class StakeholderAdmin(admin.ModelAdmin):
     list_display = ("name", "organization", "type", "state", "county", "created_at")
-    list_filter = ("type", "state", "created_at")
+    list_filter = ("type", "state", "location_precision", "created_at")
     search_fields = ("name", "organization", "email", "county")
     ordering = ("-created_at",)
+    actions = ["merge_selected"]
+
+    @admin.action(
+        description="Merge selected stakeholders into the oldest one",
+        permissions=["delete"],
+    )
+    def merge_selected(
+        self,
+        request: "HttpRequest",
+        queryset: "QuerySet[Stakeholder]",
+    ) -> None:
+        if queryset.count() < 2:
+            self.message_user(
+                request,
+                "Select at least two stakeholders to merge.",
+                messages.WARNING,
+            )
+            return
+        merged = _merge_into_oldest(queryset)
+        self.message_user(request, f"Merged {merged} duplicate stakeholders.")
+
+
+class DuplicateMemberInline(admin.TabularInline):
+    """The stakeholders in a duplicate group, read-only"""
+
+    model = DuplicateGroup.stakeholders.through
+    extra = 0
+    can_delete = False
+    fields = ("stakeholder", "email", "organization", "created_at")
+    readonly_fields = fields
+    verbose_name = "stakeholder"
+    verbose_name_plural = "stakeholders"
+
+    def get_queryset(self, request: "HttpRequest") -> "QuerySet":
+        return super().get_queryset(request).select_related("stakeholder")
+
+    def has_add_permission(self, _request: "HttpRequest", _obj: object = None) -> bool:
+        return False
+
+    @admin.display(description="Email")
+    def email(self, obj: "Model") -> str:
+        return obj.stakeholder.email
+
+    @admin.display(description="Organization")
+    def organization(self, obj: "Model") -> str:
+        return obj.stakeholder.organization
+
+    @admin.display(description="Created")
+    def created_at(self, obj: "Model") -> "datetime":
+        return obj.stakeholder.created_at
+
+
+@admin.register(DuplicateGroup)
+class DuplicateGroupAdmin(admin.ModelAdmin):
+    """Groups found by ``find_duplicate_stakeholders``, for review and merging"""
+
+    list_display = ("__str__", "members", "size", "score", "created_at")
+    ordering = ("-score",)
+    fields = ("score", "created_at")
+    readonly_fields = fields
+    inlines = [DuplicateMemberInline]
+    actions = ["merge_groups"]
+
+    def get_queryset(self, request: "HttpRequest") -> "QuerySet[DuplicateGroup]":
+        members = Stakeholder.objects.only("name", "organization").order_by(
+            "created_at",
+            "id",
+        )
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(size=Count("stakeholders"))
+            .prefetch_related(Prefetch("stakeholders", queryset=members))
+        )
+
+    def has_add_permission(self, _request: "HttpRequest") -> bool:
+        return False
+
+    @admin.display(description="Stakeholders")
+    def members(self, obj: DuplicateGroup) -> str:
+        return "; ".join(str(s) for s in obj.stakeholders.all())
+
+    @admin.display(description="Size", ordering="size")
+    def size(self, obj: DuplicateGroup) -> int:
+        return obj.size
+
+    @admin.action(
+        description="Merge each selected group into its oldest stakeholder",
+        permissions=["delete"],
+    )
+    def merge_groups(
+        self,
+        request: "HttpRequest",
+        queryset: "QuerySet[DuplicateGroup]",
+    ) -> None:
+        merged = 0
+        for group in queryset:
+            if group.size > 1:
+                merged += _merge_into_oldest(group.stakeholders.all())
+        queryset.delete()
+        self.message_user(request, f"Merged {merged} duplicate stakeholders.")
@@ -0,0 +1,272 @@
+"""
+Finding and merging duplicate stakeholders.
+
+People sign up more than once with slightly different organization names
+("Bay Watchers" and "BayWatchers Inc"). A batch job finds them in two
+passes:
+
+1. Blocking: pairs of stakeholders whose organizations share enough
+   trigrams. On PostgreSQL this is one self-join served by a ``pg_trgm`` GIN
+   index; elsewhere an in-memory trigram index does the same job.
+2. Scoring: each candidate pair is compared on normalized organization (legal
+   suffixes, case, spacing and punctuation ignored) and on email, or on name
+   when the emails differ. Pairs scoring at least the threshold on both are
+   linked, and linked stakeholders form a ``DuplicateGroup`` for the admin to
+   review and merge.
+"""
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+
+from coalition.core.models import TableVersion
+from coalition.endorsements.aggregates import rebuild_region_counts
+from coalition.endorsements.models import Endorsement
+
+from .models import DuplicateGroup, Stakeholder
+
+DEFAULT_THRESHOLD = 0.6
+
+# Trigram similarity organizations need to be compared at all. Lower than
+# the match threshold, because names as stored share fewer trigrams than
+# their normalized forms ("Bay Watchers" / "BayWatchers Inc").
+BLOCKING_THRESHOLD = 0.3
+
+# Trigrams shared by more organizations than this ("ion", " co") say little
+# about a match, and skipping them keeps the in-memory index fast
+MAX_TRIGRAM_FREQUENCY = 1000
+
+LEGAL_SUFFIXES = frozenset(
+    {
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "inc",
+        "incorporated",
+        "llc",
+        "llp",
+        "ltd",
+        "pc",
+        "the",
+    },
+)
+
+# Fields filled in on the stakeholder kept by a merge when it has them blank
+MERGE_FILL_FIELDS = ["role", "county"]
+
+
+def normalize_organization(name: str) -> str:
+    """``"The Bay Watchers, Inc."`` -> ``"baywatchers"``"""
+    words = re.findall(r"\w+", name.casefold().replace("&", " and "))
+    return "".join(word for word in words if word not in LEGAL_SUFFIXES)
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(re.findall(r"\w+", name.casefold()))
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams of each word, padded like ``pg_trgm`` does"""
+    grams = set()
+    for word in re.findall(r"\w+", text.casefold()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """Shared trigrams over all trigrams, as ``pg_trgm``'s ``similarity()``"""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return float(a == b)
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+@dataclass(frozen=True)
+class _Person:
+    id: int
+    organization: str
+    name: str
+    email: str
+
+    @classmethod
+    def from_row(cls, row: tuple[int, str, str, str]) -> "_Person":
+        pk, organization, name, email = row
+        return cls(
+            pk,
+            normalize_organization(organization),
+            normalize_name(name),
+            email.strip().casefold(),
+        )
+
+
+def match_score(a: _Person, b: _Person) -> float:
+    """How alike two stakeholders are, from 0 to 1; the lower of two scores"""
+    organization = 1.0 if a.organization == b.organization else 0.0
+    if not organization and a.organization and b.organization:
+        organization = similarity(a.organization, b.organization)
+    person = 1.0 if a.email == b.email else similarity(a.name, b.name)
+    return min(organization, person)
+
+
+def _postgres_pairs() -> list[tuple[int, int]]:
+    table = connection.ops.quote_name(Stakeholder._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        # The % operator compares with this threshold and uses the GIN index
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+            [str(BLOCKING_THRESHOLD)],
+        )
+        cursor.execute(
+            f"SELECT a.id, b.id FROM {table} a JOIN {table} b "
+            "ON a.id < b.id AND a.organization %% b.organization",
+            [],
+        )
+        return cursor.fetchall()
+
+
+def _python_pairs(organizations: dict[int, str]) -> Iterator[tuple[int, int]]:
+    grams = {pk: trigrams(name) for pk, name in organizations.items()}
+    index = defaultdict(list)
+    for pk, keys in grams.items():
+        for gram in keys:
+            index[gram].append(pk)
+
+    for pk, keys in grams.items():
+        shared = Counter(
+            other
+            for gram in keys
+            if len(index[gram]) <= MAX_TRIGRAM_FREQUENCY
+            for other in index[gram]
+            if other > pk
+        )
+        for other, count in shared.items():
+            union = len(keys) + len(grams[other]) - count
+            if count / union >= BLOCKING_THRESHOLD:
+                yield pk, other
+
+
+def candidate_pairs(normalized: dict[int, str]) -> Iterable[tuple[int, int]]:
+    """
+    Pairs of stakeholder ids whose organizations look alike.
+
+    PostgreSQL compares the organizations as stored, through the trigram
+    index; the in-memory fallback compares ``normalized`` organizations.
+    """
+    if connection.vendor == "postgresql":
+        return _postgres_pairs()
+    return _python_pairs(normalized)
+
+
+class _Clusters:
+    """Union-find over stakeholder ids, tracking each cluster's weakest link"""
+
+    def __init__(self, ids: Iterable[int]) -> None:
+        self.parent = {pk: pk for pk in ids}
+        self.scores: dict[int, float] = {}
+
+    def root(self, pk: int) -> int:
+        while self.parent[pk] != pk:
+            self.parent[pk] = self.parent[self.parent[pk]]
+            pk = self.parent[pk]
+        return pk
+
+    def link(self, a: int, b: int, score: float) -> None:
+        root_a, root_b = self.root(a), self.root(b)
+        weakest = min(
+            score,
+            self.scores.pop(root_a, 1.0),
+            self.scores.pop(root_b, 1.0) if root_b != root_a else 1.0,
+        )
+        self.parent[root_a] = root_b
+        self.scores[root_b] = weakest
+
+    def groups(self) -> list[tuple[list[int], float]]:
+        members = defaultdict(list)
+        for pk in self.parent:
+            members[self.root(pk)].append(pk)
+        return [
+            (sorted(ids), self.scores[key])
+            for key, ids in members.items()
+            if len(ids) > 1
+        ]
+
+
+def find_duplicates(
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[tuple[list[int], float]]:
+    """
+    Cluster the whole table into groups of likely duplicates.
+
+    Returns each group's stakeholder ids, oldest first, with the lowest
+    score among the links that joined it.
+    """
+    rows = Stakeholder.objects.values_list("id", "organization", "name", "email")
+    people = {row[0]: _Person.from_row(row) for row in rows.iterator()}
+    clusters = _Clusters(people)
+    normalized = {pk: person.organization for pk, person in people.items()}
+    for a, b in candidate_pairs(normalized):
+        score = match_score(people[a], people[b])
+        if score >= threshold:
+            clusters.link(a, b, score)
+    return clusters.groups()
+
+
+def save_duplicate_groups(threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Replace the stored duplicate groups with a fresh run; returns the count"""
+    found = find_duplicates(threshold)
+    with transaction.atomic():
+        DuplicateGroup.objects.all().delete()
+        groups = DuplicateGroup.objects.bulk_create(
+            DuplicateGroup(score=score) for _, score in found
+        )
+        membership = DuplicateGroup.stakeholders.through
+        membership.objects.bulk_create(
+            membership(duplicategroup_id=group.id, stakeholder_id=pk)
+            for group, (members, _) in zip(groups, found, strict=True)
+            for pk in members
+        )
+    return len(groups)
+
+
+def merge_stakeholders(keep: Stakeholder, duplicates: Iterable[Stakeholder]) -> int:
+    """
+    Fold ``duplicates`` into ``keep`` and delete them.
+
+    Endorsements move to ``keep`` unless it already endorses the same
+    campaign, and blank fields of ``keep`` are filled in from the
+    duplicates. Returns the number of stakeholders deleted.
+    """
+    duplicates = [s for s in duplicates if s.pk != keep.pk]
+    duplicate_ids = [s.pk for s in duplicates]
+    with transaction.atomic():
+        endorsed = set(keep.endorsements.values_list("campaign_id", flat=True))
+        moving = Endorsement.objects.filter(stakeholder_id__in=duplicate_ids)
+        campaigns = set(moving.values_list("campaign_id", flat=True))
+        # One endorsement per campaign moves; the rest go with the duplicates
+        first = {}
+        for pk, campaign_id in moving.order_by("created_at", "id").values_list(
+            "id",
+            "campaign_id",
+        ):
+            if campaign_id not in endorsed:
+                first.setdefault(campaign_id, pk)
+        Endorsement.objects.filter(pk__in=first.values()).update(stakeholder=keep)
+
+        blank = [name for name in MERGE_FILL_FIELDS if not getattr(keep, name)]
+        for name in blank:
+            values = [getattr(s, name) for s in duplicates if getattr(s, name)]
+            setattr(keep, name, next(iter(values), ""))
+        if any(getattr(keep, name) for name in blank):
+            keep.save()
+        deleted = Stakeholder.objects.filter(pk__in=duplicate_ids).delete()[1]
+
+    if campaigns:
+        # Moved endorsements skip the signals that keep the counts current
+        TableVersion.bump(Endorsement)
+        rebuild_region_counts(campaigns)
+    return deleted.get(Stakeholder._meta.label, 0)
@@ -0,0 +1,96 @@
+"""
+Offline geocoding of stakeholders.
+
+Stakeholders only give a state and a county, so each one is placed at the
+internal point of their county region, or of their state when the county is
+blank or not loaded. Lookups go through the cached gazetteer in
+``coalition.regions.gazetteer``, so no external service is called and a
+batch of any size costs one query per ``bulk_update``.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import islice
+
+from django.conf import settings
+
+from coalition.core.models import TableVersion
+from coalition.regions.gazetteer import Gazetteer, get_gazetteer
+
+from .models import Stakeholder
+
+GEOCODED_FIELDS = ["location", "location_precision"]
+
+
+@dataclass
+class GeocodeResult:
+    """Stakeholders geocoded to each precision, and those left unplaced"""
+
+    county: int = 0
+    state: int = 0
+    unmatched: int = 0
+    updated: int = 0
+
+
+def geocode(stakeholder: Stakeholder, gazetteer: Gazetteer | None = None) -> bool:
+    """
+    Set a stakeholder's location from their state and county.
+
+    Returns whether the location changed; the stakeholder is not saved.
+    """
+    gazetteer = gazetteer or get_gazetteer()
+    old = (
+        stakeholder.location.coords if stakeholder.location else None,
+        stakeholder.location_precision,
+    )
+    point, precision = gazetteer.locate(stakeholder.state, stakeholder.county)
+    stakeholder.location = point
+    stakeholder.location_precision = precision
+    return (point.coords if point else None, precision) != old
+
+
+def geocode_stakeholders(
+    refresh: bool = False,
+    batch_size: int | None = None,
+    progress: "Callable[[GeocodeResult], None] | None" = None,
+) -> GeocodeResult:
+    """
+    Geocode stakeholders that have no location yet, in batches.
+
+    With ``refresh``, every geocoded stakeholder is recomputed as well (for
+    example after loading counties); locations set by hand, which have no
+    ``location_precision``, are never touched.
+    """
+    batch_size = batch_size or settings.BULK_IMPORT_BATCH_SIZE
+    gazetteer = get_gazetteer()
+    stakeholders = Stakeholder.objects.only(
+        "state",
+        "county",
+        *GEOCODED_FIELDS,
+    ).order_by("id")
+    stakeholders = (
+        stakeholders.exclude(location__isnull=False, location_precision="")
+        if refresh
+        else stakeholders.filter(location__isnull=True)
+    )
+
+    result = GeocodeResult()
+    rows = stakeholders.iterator(chunk_size=batch_size)
+    while batch := list(islice(rows, batch_size)):
+        changed = [s for s in batch if geocode(s, gazetteer)]
+        for stakeholder in batch:
+            if stakeholder.location_precision == "county":
+                result.county += 1
+            elif stakeholder.location_precision == "state":
+                result.state += 1
+            else:
+                result.unmatched += 1
+        Stakeholder.objects.bulk_update(changed, GEOCODED_FIELDS)
+        result.updated += len(changed)
+        if progress is not None:
+            progress(result)
+
+    if result.updated:
+        # bulk_update skips model signals, so bump the API validators
+        TableVersion.bump(Stakeholder)
+    return result
@@ -0,0 +1,364 @@
+"""
+Bulk import of stakeholders and their endorsements.
+
+Rows are read lazily from NDJSON or CSV, validated against the model field
+rules and written in batches, each inside its own transaction. Stakeholders
+are matched on (email, organization), case-insensitively, so re-importing a
+petition list updates people instead of duplicating them. Endorsements are
+upserted with ``bulk_create(update_conflicts=True)`` against the
+``(stakeholder, campaign)`` unique constraint.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, Literal
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models.functions import Lower
+
+from coalition.campaigns.models import PolicyCampaign
+from coalition.core.models import TableVersion
+from coalition.endorsements.aggregates import rebuild_region_counts
+from coalition.endorsements.models import Endorsement
+from coalition.regions.gazetteer import get_gazetteer
+
+from .geocoding import GEOCODED_FIELDS, geocode
+from .models import Stakeholder
+
+if TYPE_CHECKING:
+    from typing import Any
+
+ImportFormat = Literal["ndjson", "csv"]
+
+STAKEHOLDER_FIELDS = (
+    "name",
+    "organization",
+    "role",
+    "email",
+    "state",
+    "county",
+    "type",
+)
+
+# Accepted spellings of public_display, compared lower-cased; JSON booleans
+# arrive as True/False and stringify to "true"/"false"
+TRUE_VALUES = frozenset({"true", "t", "yes", "y", "1"})
+FALSE_VALUES = frozenset({"false", "f", "no", "n", "0"})
+
+
+@dataclass
+class RowResult:
+    """Outcome of importing one input row (rows are numbered from 1)"""
+
+    row: int
+    status: Literal["created", "updated", "error"] = "error"
+    stakeholder_id: int | None = None
+    endorsement: Literal["created", "updated"] | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Row:
+    result: RowResult
+    stakeholder: dict[str, str]
+    campaign: str = ""
+    statement: str = ""
+    public_display: bool = True
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.stakeholder["email"], self.stakeholder["organization"].casefold())
+
+
+def _decode_error(e: UnicodeDecodeError) -> ValueError:
+    return ValueError(f"Invalid UTF-8: {e.reason} at byte {e.start}")
+
+
+def _csv_records(lines: Iterable[bytes]) -> Iterator[list[str] | ValueError]:
+    # A line that isn't UTF-8 is handed to the reader as a blank line and
+    # reported in its place, so the records after it are still read
+    undecodable: list[UnicodeDecodeError] = []
+
+    def decoded() -> Iterator[str]:
+        for line in lines:
+            try:
+                yield line.decode("utf-8-sig")
+            except UnicodeDecodeError as e:
+                undecodable.append(e)
+                yield "\n"
+
+    reader = csv.reader(decoded())
+    while True:
+        try:
+            values = next(reader, None)
+        except csv.Error as e:
+            values = ValueError(f"Invalid CSV: {e}")
+        if undecodable:
+            values = _decode_error(undecodable.pop())
+        if values is None:
+            return
+        yield values
+
+
+def _parse_csv(lines: Iterable[bytes]) -> "Iterator[dict[str, Any] | ValueError]":
+    records = _csv_records(lines)
+    fieldnames = next(records, [])
+    if isinstance(fieldnames, ValueError):
+        # Without a header row none of the rows can be read
+        yield ValueError(f"Header row: {fieldnames}")
+        return
+    for values in records:
+        if isinstance(values, ValueError):
+            yield values
+        elif values:
+            yield dict(zip(fieldnames, values, strict=False))
+
+
+def parse_rows(
+    lines: Iterable[bytes],
+    fmt: ImportFormat,
+) -> "Iterator[dict[str, Any] | ValueError]":
+    """
+    Yield one dict per input row, or a ValueError for a row that can't be parsed.
+
+    ``lines`` may be any iterable of byte lines (such as the request itself),
+    so the upload is never held in memory as a whole. Lines that aren't UTF-8
+    or valid CSV are reported as row errors rather than failing the import.
+    """
+    if fmt == "csv":
+        yield from _parse_csv(lines)
+        return
+
+    for raw in lines:
+        try:
+            line = raw.decode("utf-8-sig")
+        except UnicodeDecodeError as e:
+            yield _decode_error(e)
+            continue
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ValueError(f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield ValueError("Each line must be a JSON object")
+            continue
+        yield data
+
+
+def _clean_row(number: int, data: "dict[str, Any] | ValueError") -> _Row:
+    result = RowResult(row=number)
+    if isinstance(data, ValueError):
+        result.errors.append(str(data))
+        return _Row(result=result, stakeholder={})
+
+    fields = {name: str(data.get(name) or "").strip() for name in STAKEHOLDER_FIELDS}
+    fields["email"] = fields["email"].lower()
+    row = _Row(
+        result=result,
+        stakeholder=fields,
+        campaign=str(data.get("campaign") or "").strip(),
+        statement=str(data.get("statement") or "").strip(),
+    )
+
+    try:
+        Stakeholder(**fields).full_clean(
+            validate_unique=False,
+            validate_constraints=False,
+        )
+    except ValidationError as e:
+        result.errors.extend(
+            f"{name}: {message}"
+            for name, messages in e.message_dict.items()
+            for message in messages
+        )
+
+    public_display = data.get("public_display")
+    if public_display not in (None, ""):
+        value = str(public_display).strip().lower()
+        if value in TRUE_VALUES | FALSE_VALUES:
+            row.public_display = value in TRUE_VALUES
+        else:
+            result.errors.append(
+                f"public_display: '{public_display}' is not a yes/no value",
+            )
+
+    return row
+
+
+def _resolve_campaigns(rows: list[_Row]) -> dict[str, int]:
+    """Map the campaign slugs used in ``rows`` to ids, flagging unknown ones"""
+    slugs = {row.campaign for row in rows if row.campaign}
+    campaign_ids = dict(
+        PolicyCampaign.objects.filter(slug__in=slugs).values_list("slug", "id"),
+    )
+    for row in rows:
+        if row.campaign and row.campaign not in campaign_ids:
+            row.result.errors.append(f"campaign: Unknown campaign '{row.campaign}'")
+    return campaign_ids
+
+
+def _match_stakeholders(
+    rows: list[_Row],
+) -> tuple[list[tuple[_Row, Stakeholder]], set[int]]:
+    """
+    Pair each row with an existing or new (unsaved) Stakeholder.
+
+    Rows sharing a key within the batch share one Stakeholder, with later
+    rows overwriting earlier values. If the table already contains
+    duplicates, the oldest matching row is used. Also returns the ids of
+    existing stakeholders whose state changes, as their endorsements move
+    to another region.
+    """
+    stakeholders: dict[tuple[str, str], Stakeholder] = {}
+    matches = (
+        Stakeholder.objects.annotate(email_key=Lower("email"))
+        .filter(email_key__in={row.key[0] for row in rows})
+        .order_by("-id")
+    )
+    for stakeholder in matches:
+        stakeholders[(stakeholder.email_key, stakeholder.organization.casefold())] = (
+            stakeholder
+        )
+
+    paired = []
+    moved = set()
+    for row in rows:
+        stakeholder = stakeholders.get(row.key)
+        if stakeholder is None:
+            stakeholder = stakeholders[row.key] = Stakeholder(**row.stakeholder)
+            row.result.status = "created"
+        else:
+            if stakeholder.state.upper() != row.stakeholder["state"].upper():
+                moved.add(stakeholder.pk)
+            for name, value in row.stakeholder.items():
+                setattr(stakeholder, name, value)
+            row.result.status = "updated"
+        paired.append((row, stakeholder))
+    return paired, moved
+
+
+def _upsert_endorsements(
+    paired: list[tuple[_Row, Stakeholder]],
+    campaign_ids: dict[str, int],
+) -> None:
+    # Last row wins when the same endorsement appears twice in a batch, as
+    # ON CONFLICT cannot touch the same row twice in one statement
+    endorsements: dict[tuple[int, int], Endorsement] = {}
+    endorsement_rows: dict[tuple[int, int], list[_Row]] = {}
+    for row, stakeholder in paired:
+        if not row.campaign:
+            continue
+        pair = (stakeholder.pk, campaign_ids[row.campaign])
+        endorsements[pair] = Endorsement(
+            stakeholder_id=pair[0],
+            campaign_id=pair[1],
+            statement=row.statement,
+            public_display=row.public_display,
+        )
+        endorsement_rows.setdefault(pair, []).append(row)
+
+    existing_pairs = set(
+        Endorsement.objects.filter(
+            stakeholder_id__in={pair[0] for pair in endorsements},
+        ).values_list("stakeholder_id", "campaign_id"),
+    )
+    Endorsement.objects.bulk_create(
+        endorsements.values(),
+        update_conflicts=True,
+        unique_fields=["stakeholder", "campaign"],
+        update_fields=["statement", "public_display"],
+    )
+
+    for pair, pair_rows in endorsement_rows.items():
+        status = "updated" if pair in existing_pairs else "created"
+        for i, row in enumerate(pair_rows):
+            row.result.endorsement = status if i == 0 else "updated"
+
+
+def _geocode(stakeholders: list[Stakeholder]) -> None:
+    """Place stakeholders from their (possibly new) state and county"""
+    gazetteer = get_gazetteer()
+    for stakeholder in stakeholders:
+        # Leave locations entered by hand alone
+        if stakeholder.location is None or stakeholder.location_precision:
+            geocode(stakeholder, gazetteer)
+
+
+def _import_batch(rows: list[_Row]) -> set[int]:
+    """Write a batch, returning the ids of campaigns whose region counts change"""
+    valid = [row for row in rows if not row.result.errors]
+    campaign_ids = _resolve_campaigns(valid)
+    valid = [row for row in valid if not row.result.errors]
+    if not valid:
+        return set()
+
+    paired, moved = _match_stakeholders(valid)
+    new = {id(s): s for _, s in paired if s.pk is None}
+    changed = {s.pk: s for _, s in paired if s.pk is not None}
+    _geocode([*new.values(), *changed.values()])
+
+    with transaction.atomic():
+        Stakeholder.objects.bulk_create(new.values())
+        Stakeholder.objects.bulk_update(
+            changed.values(),
+            [*STAKEHOLDER_FIELDS, *GEOCODED_FIELDS],
+        )
+        for row, stakeholder in paired:
+            row.result.stakeholder_id = stakeholder.pk
+        _upsert_endorsements(paired, campaign_ids)
+
+    touched = {campaign_ids[row.campaign] for row in valid if row.campaign}
+    if moved:
+        touched.update(
+            Endorsement.objects.filter(stakeholder_id__in=moved).values_list(
+                "campaign_id",
+                flat=True,
+            ),
+        )
+    return touched
+
+
+def import_stakeholders(
+    records: "Iterable[dict[str, Any] | ValueError]",
+    batch_size: int | None = None,
+) -> list[RowResult]:
+    """
+    Import stakeholder (and optional endorsement) records in batches.
+
+    Each record may hold the Stakeholder fields plus ``campaign`` (a campaign
+    slug), ``statement`` and ``public_display`` to endorse that campaign. A
+    batch that fails at the database level is rolled back on its own and its
+    rows are reported as errors; other batches are unaffected.
+    """
+    batch_size = batch_size or settings.BULK_IMPORT_BATCH_SIZE
+    results: list[RowResult] = []
+    touched: set[int] = set()
+    numbered = enumerate(records, start=1)
+    while batch := [_clean_row(n, data) for n, data in islice(numbered, batch_size)]:
+        try:
+            touched |= _import_batch(batch)
+        except DatabaseError as e:
+            for row in batch:
+                if not row.result.errors:
+                    row.result.status = "error"
+                    row.result.stakeholder_id = None
+                    row.result.endorsement = None
+                    row.result.errors.append(f"Database error: {e}")
+        results.extend(row.result for row in batch)
+
+    # bulk_create/bulk_update skip model signals, so bump the API validators
+    # and recount endorsements per region for the campaigns the import
+    # endorsed or whose endorsers moved state
+    TableVersion.bump(Stakeholder)
+    TableVersion.bump(Endorsement)
+    if touched:
+        rebuild_region_counts(touched)
+    return results
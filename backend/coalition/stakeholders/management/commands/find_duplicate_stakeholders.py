@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from coalition.stakeholders.dedupe import DEFAULT_THRESHOLD, save_duplicate_groups
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Find groups of stakeholders that are probably the same person, for "
+        "review and merging in the admin. Replaces the groups of the last run."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help=(
+                "Similarity (0-1) two stakeholders need on both organization "
+                f"and name or email to be linked (default: {DEFAULT_THRESHOLD})"
+            ),
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        if not 0 < options["threshold"] <= 1:
+            raise CommandError("--threshold must be greater than 0 and at most 1")
+
+        groups = save_duplicate_groups(options["threshold"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Found {groups} groups of duplicate stakeholders"),
+        )
@@ -0,0 +1,45 @@
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from coalition.stakeholders.geocoding import GeocodeResult, geocode_stakeholders
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from typing import Any
+
+
+class Command(BaseCommand):
+    help = (
+        "Place stakeholders at the internal point of their county (or state) "
+        "region. Load state and county regions first."
+    )
+
+    def add_arguments(self, parser: "ArgumentParser") -> None:
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            help="Also recompute stakeholders that were already geocoded",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Stakeholders updated per query (default: BULK_IMPORT_BATCH_SIZE)",
+        )
+
+    def handle(self, *_args: "Any", **options: "Any") -> None:
+        result = geocode_stakeholders(
+            refresh=options["refresh"],
+            batch_size=options["batch_size"],
+            progress=self._progress,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated {result.updated} stakeholders: {result.county} placed by "
+                f"county, {result.state} by state, {result.unmatched} unmatched",
+            ),
+        )
+
+    def _progress(self, result: GeocodeResult) -> None:
+        total = result.county + result.state + result.unmatched
+        self.stdout.write(f"Geocoded {total} stakeholders")
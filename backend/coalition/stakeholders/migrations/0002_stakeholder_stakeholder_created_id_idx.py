@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stakeholders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="stakeholder",
+            index=models.Index(
+                fields=["created_at", "id"],
+                name="stakeholder_created_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stakeholders", "0002_stakeholder_stakeholder_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="stakeholder",
+            index=models.Index(
+                fields=["state", "county", "type"],
+                name="stakeholder_location_type_idx",
+            ),
+        ),
+    ]
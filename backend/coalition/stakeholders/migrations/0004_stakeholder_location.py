@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:31
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stakeholders", "0003_stakeholder_stakeholder_location_type_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stakeholder",
+            name="location",
+            field=django.contrib.gis.db.models.fields.PointField(
+                blank=True,
+                geography=True,
+                help_text="Approximate location, geocoded from state and county",
+                null=True,
+                srid=4326,
+            ),
+        ),
+        migrations.AddField(
+            model_name="stakeholder",
+            name="location_precision",
+            field=models.CharField(
+                blank=True,
+                choices=[("county", "County"), ("state", "State")],
+                help_text="Region whose internal point the location is",
+                max_length=10,
+            ),
+        ),
+    ]
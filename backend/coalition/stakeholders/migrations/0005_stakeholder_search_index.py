@@ -0,0 +1,34 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# A copy of the coalition.core.search definition as of this migration, so
+# later edits there can't change what it does
+SEARCH_INDEX = GinIndex(
+    SearchVector("name", "organization", config="english"),
+    name="stakeholder_search_idx",
+)
+
+
+def add_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        Stakeholder = apps.get_model("stakeholders", "Stakeholder")
+        schema_editor.add_index(Stakeholder, SEARCH_INDEX)
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        Stakeholder = apps.get_model("stakeholders", "Stakeholder")
+        schema_editor.remove_index(Stakeholder, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+    """Full-text GIN index on PostgreSQL (see coalition.core.search)"""
+
+    dependencies = [
+        ("stakeholders", "0004_stakeholder_location"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index, elidable=False),
+    ]
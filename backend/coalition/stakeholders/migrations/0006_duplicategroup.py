@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:40
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+TRIGRAM_INDEX_NAME = "stakeholder_org_trgm_idx"
+
+
+def add_index(apps, schema_editor):
+    """Index organizations for pg_trgm's % operator, used to pair duplicates"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Stakeholder = apps.get_model("stakeholders", "Stakeholder")
+    quote = schema_editor.quote_name
+    schema_editor.execute(
+        f"CREATE INDEX {quote(TRIGRAM_INDEX_NAME)} "
+        f"ON {quote(Stakeholder._meta.db_table)} "
+        f"USING gin ({quote('organization')} gin_trgm_ops)",
+    )
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {schema_editor.quote_name(TRIGRAM_INDEX_NAME)}",
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stakeholders", "0005_stakeholder_search_index"),
+    ]
+
+    operations = [
+        # Both are no-ops except on PostgreSQL
+        TrigramExtension(),
+        migrations.RunPython(add_index, remove_index, elidable=False),
+        migrations.CreateModel(
+            name="DuplicateGroup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "score",
+                    models.FloatField(
+                        help_text="Similarity of the least alike pair that links the group, 0-1",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "stakeholders",
+                    models.ManyToManyField(
+                        related_name="duplicate_groups",
+                        to="stakeholders.stakeholder",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stakeholders", "0006_duplicategroup"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="stakeholder",
+            index=models.Index(fields=["name", "id"], name="stakeholder_name_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="stakeholder",
+            index=models.Index(
+                fields=["organization", "id"],
+                name="stakeholder_org_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stakeholder",
+            index=models.Index(fields=["state", "id"], name="stakeholder_state_id_idx"),
+        ),
+    ]
@@ -1,7 +1,13 @@
+from django.contrib.gis.db.models import PointField
 from django.db import models
 
 
 class Stakeholder(models.Model):
+    LOCATION_PRECISION_CHOICES = [
+        ("county", "County"),
+        ("state", "State"),
+    ]
+
     STAKEHOLDER_TYPE_CHOICES = [
         ("farmer", "Farmer"),
         ("waterman", "Waterman"),
@@ -18,6 +24,59 @@ class Stakeholder(models.Model):
     county = models.CharField(max_length=100, blank=True)
     type = models.CharField(max_length=50, choices=STAKEHOLDER_TYPE_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True)
+    location = PointField(
+        blank=True,
+        null=True,
+        spatial_index=True,
+        geography=True,
+        help_text="Approximate location, geocoded from state and county",
+    )
+    location_precision = models.CharField(
+        max_length=10,
+        choices=LOCATION_PRECISION_CHOICES,
+        blank=True,
+        help_text="Region whose internal point the location is",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="stakeholder_created_id_idx",
+            ),
+            models.Index(
+                fields=["state", "county", "type"],
+                name="stakeholder_location_type_idx",
+            ),
+            # Keyset pagination for the other ?ordering= keys of the list API
+            models.Index(fields=["name", "id"], name="stakeholder_name_id_idx"),
+            models.Index(
+                fields=["organization", "id"],
+                name="stakeholder_org_id_idx",
+            ),
+            models.Index(fields=["state", "id"], name="stakeholder_state_id_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.organization} – {self.name}"
+
+
+class DuplicateGroup(models.Model):
+    """
+    Stakeholders that are probably the same person.
+
+    Found in bulk by ``coalition.stakeholders.dedupe`` (the
+    ``find_duplicate_stakeholders`` command) and merged from the admin.
+    """
+
+    stakeholders = models.ManyToManyField(
+        Stakeholder,
+        related_name="duplicate_groups",
+    )
+    score = models.FloatField(
+        help_text="Similarity of the least alike pair that links the group, 0-1",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"Duplicate group {self.pk}"
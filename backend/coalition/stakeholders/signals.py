@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from .geocoding import geocode
+from .models import Stakeholder
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def _place_changed(stakeholder: Stakeholder) -> bool:
+    saved = (
+        Stakeholder.objects.filter(pk=stakeholder.pk)
+        .values_list("state", "county")
+        .first()
+    )
+    return saved != (stakeholder.state, stakeholder.county)
+
+
+@receiver(pre_save, sender=Stakeholder)
+def geocode_stakeholder(
+    sender: type,
+    instance: Stakeholder,
+    raw: bool = False,
+    **kwargs: "Any",
+) -> None:
+    """
+    Geocode a stakeholder without a location, or whose state or county changed.
+
+    Locations entered by hand (with no ``location_precision``) are kept.
+    """
+    if raw:
+        return
+    if instance.location is None or (
+        instance.location_precision and instance.pk and _place_changed(instance)
+    ):
+        geocode(instance)
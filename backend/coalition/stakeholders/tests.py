@@ -1,7 +1,18 @@
+from io import StringIO
+
+from django.contrib.gis.geos import Point
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from coalition.campaigns.models import PolicyCampaign
+from coalition.core.cache import cache_clear
+from coalition.core.models import TableVersion
+from coalition.endorsements.models import Endorsement, RegionEndorsementCount
+from coalition.regions.models import Region
 
-from .models import Stakeholder
+from .dedupe import merge_stakeholders, normalize_organization, similarity
+from .models import DuplicateGroup, Stakeholder
 
 
 class StakeholderModelTest(TestCase):
@@ -64,3 +75,179 @@ class StakeholderModelTest(TestCase):
         stakeholder = Stakeholder(**invalid_data)
         with self.assertRaises(ValidationError):
             stakeholder.full_clean()
+
+
+class GeocodingTest(TestCase):
+    def setUp(self) -> None:
+        cache_clear()
+        maryland = Region.objects.create(
+            geoid="24",
+            name="Maryland",
+            label="MD",
+            type="state",
+            coords=Point(-76.7, 38.9, srid=4326),
+        )
+        Region.objects.create(
+            geoid="24003",
+            name="Anne Arundel County, MD",
+            label="Anne Arundel County",
+            type="county",
+            parent=maryland,
+            coords=Point(-76.6, 39.0, srid=4326),
+        )
+
+    def _create(self, **kwargs: str) -> Stakeholder:
+        data = {
+            "name": "John Doe",
+            "organization": "Test Farm LLC",
+            "email": "john@testfarm.com",
+            "state": "MD",
+            "type": "farmer",
+        } | kwargs
+        return Stakeholder.objects.create(**data)
+
+    def test_geocoded_on_save(self) -> None:
+        """Test that new stakeholders are placed by county, else by state"""
+        by_county = self._create(county="anne arundel")
+        by_state = self._create(email="jane@testfarm.com", county="Unknown")
+        unplaced = self._create(email="x@testfarm.com", state="ZZ")
+
+        assert by_county.location.coords == (-76.6, 39.0)
+        assert by_county.location_precision == "county"
+        assert by_state.location.coords == (-76.7, 38.9)
+        assert by_state.location_precision == "state"
+        assert unplaced.location is None
+
+    def test_regeocoded_when_place_changes(self) -> None:
+        """Test that editing the county moves a geocoded stakeholder"""
+        stakeholder = self._create()
+
+        stakeholder.county = "Anne Arundel County"
+        stakeholder.save()
+
+        assert stakeholder.location_precision == "county"
+
+    def test_manual_location_kept(self) -> None:
+        """Test that a location without a precision is never overwritten"""
+        stakeholder = self._create(county="Anne Arundel")
+        stakeholder.location = Point(-76.5, 38.98, srid=4326)
+        stakeholder.location_precision = ""
+        stakeholder.save()
+
+        stakeholder.county = ""
+        stakeholder.save()
+
+        stakeholder.refresh_from_db()
+        assert stakeholder.location.coords == (-76.5, 38.98)
+
+    def test_geocode_command(self) -> None:
+        """Test batch geocoding of stakeholders written without signals"""
+        Stakeholder.objects.bulk_create(
+            Stakeholder(
+                name=f"Person {i}",
+                organization=f"Org {i}",
+                email=f"person{i}@example.com",
+                state="MD",
+                county="Anne Arundel" if i % 2 else "",
+                type="other",
+            )
+            for i in range(3)
+        )
+        version = TableVersion.get_version(Stakeholder)
+        out = StringIO()
+
+        call_command("geocode_stakeholders", "--batch-size=2", stdout=out)
+
+        assert "Updated 3 stakeholders: 1 placed by county, 2 by state" in (
+            out.getvalue()
+        )
+        assert not Stakeholder.objects.filter(location__isnull=True).exists()
+        assert TableVersion.get_version(Stakeholder) > version
+
+
+class SimilarityTest(SimpleTestCase):
+    def test_normalize_organization(self) -> None:
+        """Test that case, spacing, punctuation and legal suffixes are ignored"""
+        assert normalize_organization("The Bay Watchers, Inc.") == "baywatchers"
+        assert normalize_organization("BayWatchers LLC") == "baywatchers"
+        assert normalize_organization("Smith & Sons") == "smithandsons"
+
+    def test_similarity(self) -> None:
+        """Test trigram similarity like pg_trgm's"""
+        assert similarity("baywatchers", "baywatchers") == 1.0
+        assert similarity("baywatcher", "baywatchers") > 0.7
+        assert similarity("baywatchers", "riverkeepers") < 0.3
+
+
+class DuplicateStakeholdersTest(TestCase):
+    def _create(
+        self,
+        name: str,
+        organization: str,
+        email: str,
+        **kwargs: str,
+    ) -> Stakeholder:
+        return Stakeholder.objects.create(
+            name=name,
+            organization=organization,
+            email=email,
+            state=kwargs.pop("state", "MD"),
+            type="nonprofit",
+            **kwargs,
+        )
+
+    def test_find_duplicates(self) -> None:
+        """Test that sign-ups by the same person at one organization are grouped"""
+        first = self._create("Jamie Smith", "Bay Watchers", "jamie@bay.org")
+        second = self._create("Jamie Smith", "BayWatchers Inc", "JAMIE@bay.org")
+        third = self._create("Jamie Smyth", "The Bay Watchers", "js@example.com")
+        # A colleague at the same organization is a different person
+        self._create("Alex Jones", "Bay Watchers", "alex@bay.org")
+        self._create("Jamie Smith", "Riverkeepers", "jamie@river.org")
+        out = StringIO()
+
+        call_command("find_duplicate_stakeholders", stdout=out)
+
+        assert "Found 1 groups" in out.getvalue()
+        group = DuplicateGroup.objects.get()
+        assert set(group.stakeholders.all()) == {first, second, third}
+        assert 0.6 <= group.score < 1
+
+    def test_rerun_replaces_groups(self) -> None:
+        """Test that each run replaces the previous groups"""
+        self._create("Jamie Smith", "Bay Watchers", "jamie@bay.org")
+        self._create("Jamie Smith", "Bay Watchers", "jamie@bay.org")
+
+        for _ in range(2):
+            call_command("find_duplicate_stakeholders", stdout=StringIO())
+
+        assert DuplicateGroup.objects.count() == 1
+
+    def test_merge(self) -> None:
+        """Test that endorsements move and blank fields are filled in"""
+        Region.objects.create(geoid="24", name="Maryland", label="MD", type="state")
+        water, farms = (
+            PolicyCampaign.objects.create(title=slug, slug=slug, summary="")
+            for slug in ["water", "farms"]
+        )
+        keep = self._create("Jamie Smith", "Bay Watchers", "jamie@bay.org")
+        duplicate = self._create(
+            "Jamie Smith",
+            "BayWatchers Inc",
+            "jamie@bay.org",
+            role="Director",
+        )
+        Endorsement.objects.create(stakeholder=keep, campaign=water)
+        Endorsement.objects.create(stakeholder=duplicate, campaign=water)
+        moved = Endorsement.objects.create(stakeholder=duplicate, campaign=farms)
+        RegionEndorsementCount.objects.all().delete()
+
+        assert merge_stakeholders(keep, [keep, duplicate]) == 1
+
+        keep.refresh_from_db()
+        assert keep.role == "Director"
+        assert not Stakeholder.objects.filter(pk=duplicate.pk).exists()
+        assert set(keep.endorsements.values_list("id", flat=True)) >= {moved.id}
+        assert keep.endorsements.count() == 2
+        counts = RegionEndorsementCount.objects.filter(campaign=farms)
+        assert counts.get().count == 1
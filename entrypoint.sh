@@ -45,6 +45,9 @@ echo "Database is ready!"
 echo "Applying migrations..."
 python manage.py migrate --noinput
 
+# Create the database cache table (a no-op unless CACHE_L2_BACKEND=db)
+python manage.py createcachetable
+
 # Collect static files
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
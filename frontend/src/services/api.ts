@@ -16,6 +16,28 @@ const getBaseUrl = (): string => {
   return '';
 };
 
+// Largest page the API serves (API_MAX_PAGE_SIZE), to keep round trips few
+const LIST_PAGE_SIZE = 500;
+
+// List endpoints return one page at a time; follow X-Next-Cursor to the end
+const fetchAllPages = async <T>(path: string): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ page_size: String(LIST_PAGE_SIZE) });
+    if (cursor) {
+      params.set('cursor', cursor);
+    }
+    const response = await fetch(`${getBaseUrl()}${path}?${params}`);
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    items.push(...((await response.json()) as T[]));
+    cursor = response.headers.get('X-Next-Cursor');
+  } while (cursor);
+  return items;
+};
+
 const API = {
   // Export getBaseUrl for testing
   getBaseUrl,
@@ -23,11 +45,7 @@ const API = {
   // Campaigns
   getCampaigns: async (): Promise<Campaign[]> => {
     try {
-      const response = await fetch(`${getBaseUrl()}/api/campaigns/`);
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      return (await response.json()) as Campaign[];
+      return await fetchAllPages<Campaign>('/api/campaigns/');
     } catch (error) {
       console.error('Error fetching campaigns:', error);
       throw error;
@@ -51,11 +69,7 @@ const API = {
   // Legislators
   getLegislators: async (): Promise<Legislator[]> => {
     try {
-      const response = await fetch(`${getBaseUrl()}/api/legislators/`);
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      return (await response.json()) as Legislator[];
+      return await fetchAllPages<Legislator>('/api/legislators/');
     } catch (error) {
       console.error('Error fetching legislators:', error);
       throw error;
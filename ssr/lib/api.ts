@@ -6,6 +6,9 @@ import {
   ContentBlock,
 } from "@/types";
 
+// Largest page the API serves (API_MAX_PAGE_SIZE), to keep round trips few
+const LIST_PAGE_SIZE = 500;
+
 const API_URL =
   process.env.API_URL ||
   process.env.NEXT_PUBLIC_API_URL ||
@@ -19,6 +22,29 @@ class ApiClient {
   }
 
   private async request<T>(endpoint: string): Promise<T> {
+    const response = await this.fetchResponse(endpoint);
+    return await response.json();
+  }
+
+  // List endpoints return one page at a time; follow X-Next-Cursor to the end
+  private async requestAll<T>(endpoint: string): Promise<T[]> {
+    const items: T[] = [];
+    let cursor: string | null = null;
+    do {
+      const params = new URLSearchParams({
+        page_size: String(LIST_PAGE_SIZE),
+      });
+      if (cursor) {
+        params.set("cursor", cursor);
+      }
+      const response = await this.fetchResponse(`${endpoint}?${params}`);
+      items.push(...((await response.json()) as T[]));
+      cursor = response.headers.get("X-Next-Cursor");
+    } while (cursor);
+    return items;
+  }
+
+  private async fetchResponse(endpoint: string): Promise<Response> {
     const url = `${this.baseURL}${endpoint}`;
 
     try {
@@ -36,7 +62,7 @@ class ApiClient {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
 
-      return await response.json();
+      return response;
     } catch (error) {
       console.error(`API request failed for ${url}:`, error);
       throw error;
@@ -45,7 +71,7 @@ class ApiClient {
 
   // Campaigns
   async getCampaigns(): Promise<Campaign[]> {
-    return this.request<Campaign[]>("/api/campaigns/");
+    return this.requestAll<Campaign>("/api/campaigns/");
   }
 
   async getCampaign(id: number): Promise<Campaign> {
@@ -59,7 +85,7 @@ class ApiClient {
 
   // Legislators
   async getLegislators(): Promise<Legislator[]> {
-    return this.request<Legislator[]>("/api/legislators/");
+    return this.requestAll<Legislator>("/api/legislators/");
   }
 
   // Homepage